@@ -0,0 +1,211 @@
+"""
+Benchmark suite for the Tic-Tac-Toe engines.
+
+Times find_move (empty board and a fixed corpus of mid-game positions, X and
+O to move), calc_score/game_over and the full exhaustive_test for each code
+directory, loading modules through code_loader like student_code/play_game.py
+does: from <dir>/NAME.py if it exists, otherwise from default_code/NAME.pyc.
+
+    python benchmark.py                      # run and compare to the baseline
+    python benchmark.py --save-baseline      # record a new baseline
+    python benchmark.py --targets minimax_recursion --threshold 0.5
+
+Exits with status 1 when a benchmark's median is slower than the baseline
+by more than the threshold.
+"""
+import argparse
+import contextlib
+import inspect
+import io
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+from code_loader import load_function, target_path
+
+LAB_DIR = Path(__file__).parent.resolve()
+BASELINE_PATH = LAB_DIR / 'benchmark_baseline.json'
+TARGETS = ('minimax_recursion', 'teacher_code', 'student_code')
+
+EMPTY = [1, 2, 3, 4, 5, 6, 7, 8, 9]
+X, O = 10, -10
+
+# Mid-game positions, each playable by whichever side is asked to move
+CORPUS = [
+    [X, 2, 3, 4, 5, 6, 7, 8, 9],
+    [1, 2, 3, 4, O, 6, 7, 8, 9],
+    [X, 2, 3, 4, O, 6, 7, 8, 9],
+    [X, O, 3, 4, 5, 6, 7, 8, 9],
+    [1, X, 3, 4, O, 6, 7, 8, 9],
+    [X, 2, 3, 4, O, 6, 7, 8, X],
+    [X, 2, 3, O, X, 6, 7, 8, O],
+    [O, 2, X, 4, X, 6, 7, 8, 9],
+    [X, O, X, 4, O, 6, 7, 8, 9],
+    [X, 2, O, 4, X, 6, O, 8, 9],
+]
+
+
+def time_calls(function, calls, repeat, before=None, batch=1):
+    """
+    Times each call in calls (a list of argument tuples) `repeat` times.
+    - before: optional function run untimed before every call (e.g. clear caches).
+    - batch: calls per sample, for functions too fast to time one call at a time.
+    Returns the list of per-call times in seconds.
+    """
+    times = []
+    for _ in range(repeat):
+        for args in calls:
+            if before is not None:
+                before()
+            start = time.perf_counter()
+            for _ in range(batch):
+                function(*args)
+            times.append((time.perf_counter() - start) / batch)
+    return times
+
+
+def summarize(times, nodes=None):
+    """Median, p95 and (when the node count per call is known) nodes/second."""
+    times = sorted(times)
+    median = statistics.median(times)
+    result = {
+        'calls': len(times),
+        'median': median,
+        'p95': times[min(len(times) - 1, int(len(times) * 0.95))],
+    }
+    if nodes is not None and median > 0:
+        result['nodes_per_second'] = nodes / median
+    return result
+
+
+def count_nodes(base_dir, find_move, calls, before=None):
+    """Average mini_max nodes per call, if the target's find_move takes a stats argument."""
+    SearchStats = load_function(base_dir, 'search_stats', 'SearchStats')
+    if SearchStats is None or 'stats' not in inspect.signature(find_move).parameters:
+        return None
+    stats = SearchStats()
+    for args in calls:
+        if before is not None:
+            before()
+        find_move(*args, stats=stats)
+    return stats.nodes / len(calls)
+
+
+def benchmark_target(target, repeat, micro_repeat, micro_batch):
+    """Runs every benchmark the target has the code for. Missing ones are reported as None."""
+    base_dir = LAB_DIR / target
+    results = {}
+
+    with target_path(base_dir):
+        calc_score = load_function(base_dir, 'calc_score', 'calc_score')
+        game_over = load_function(base_dir, 'game_over', 'game_over')
+        find_move = load_function(base_dir, 'find_move', 'find_move')
+        exhaustive_test = load_function(base_dir, 'test_minimax', 'exhaustive_test')
+
+        # Cold cache for every find_move call: the first move of a new game
+        table = getattr(sys.modules.get('find_move'), 'shared_table', None)
+        clear_cache = table.clear if table is not None else None
+
+        for name, function, calls, reps, before, batch in (
+            ('find_move_empty_x', find_move, [(list(EMPTY), True)], repeat, clear_cache, 1),
+            ('find_move_empty_o', find_move, [(list(EMPTY), False)], repeat, clear_cache, 1),
+            ('find_move_corpus_x', find_move, [(list(b), True) for b in CORPUS], repeat, clear_cache, 1),
+            ('find_move_corpus_o', find_move, [(list(b), False) for b in CORPUS], repeat, clear_cache, 1),
+            ('calc_score', calc_score, [(list(b),) for b in CORPUS], micro_repeat, None, micro_batch),
+            ('game_over', game_over, [(list(b),) for b in CORPUS], micro_repeat, None, micro_batch),
+        ):
+            if function is None:
+                results[name] = None
+                continue
+            try:
+                times = time_calls(function, calls, reps, before, batch)
+            except Exception as e:  # student stubs return None, raise, etc.
+                results[name] = {'error': f'{type(e).__name__}: {e}'}
+                continue
+            nodes = None
+            if name.startswith('find_move'):
+                nodes = count_nodes(base_dir, function, calls, before)
+            results[name] = summarize(times, nodes)
+
+        if exhaustive_test is None:
+            results['exhaustive_test'] = None
+        else:
+            def run_exhaustive():
+                with contextlib.redirect_stdout(io.StringIO()):
+                    exhaustive_test()
+            results['exhaustive_test'] = summarize(time_calls(run_exhaustive, [()], 1, clear_cache))
+
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Returns a list of (target, benchmark, baseline median, median) that regressed."""
+    regressions = []
+    for target, benchmarks in results.items():
+        for name, result in benchmarks.items():
+            old = (baseline.get(target) or {}).get(name)
+            if not result or not old or 'median' not in result or 'median' not in old:
+                continue
+            if result['median'] > old['median'] * (1 + threshold):
+                regressions.append((target, name, old['median'], result['median']))
+    return regressions
+
+
+def print_report(results):
+    print(f"{'target':<18} {'benchmark':<20} {'median us':>10} {'p95 us':>10} {'nodes/s':>12}")
+    for target, benchmarks in results.items():
+        for name, result in benchmarks.items():
+            if result is None:
+                print(f'{target:<18} {name:<20} {"missing":>10}')
+            elif 'error' in result:
+                print(f'{target:<18} {name:<20} {"error":>10}  {result["error"]}')
+            else:
+                nps = result.get('nodes_per_second')
+                print(f"{target:<18} {name:<20} {result['median'] * 1e6:>10.1f} "
+                      f"{result['p95'] * 1e6:>10.1f} {f'{nps:,.0f}' if nps else '':>12}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the Tic-Tac-Toe engines.')
+    parser.add_argument('--targets', nargs='+', default=list(TARGETS), choices=TARGETS)
+    parser.add_argument('--repeat', type=int, default=5, help='repetitions of each find_move call')
+    parser.add_argument('--micro-repeat', type=int, default=20,
+                        help='samples of each calc_score/game_over call')
+    parser.add_argument('--micro-batch', type=int, default=500,
+                        help='calc_score/game_over calls timed together per sample')
+    parser.add_argument('--baseline', type=Path, default=BASELINE_PATH)
+    parser.add_argument('--save-baseline', action='store_true')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='allowed slowdown before failing, as a fraction (0.25 = 25%%)')
+    parser.add_argument('--json', type=Path, help='also write the results to this file')
+    args = parser.parse_args(argv)
+
+    results = {target: benchmark_target(target, args.repeat, args.micro_repeat, args.micro_batch)
+               for target in args.targets}
+    print_report(results)
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2) + '\n')
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2) + '\n')
+        print(f'\nBaseline saved to {args.baseline}')
+        return 0
+
+    if not args.baseline.exists():
+        print('\nNo baseline to compare against (run with --save-baseline).')
+        return 0
+
+    regressions = compare(results, json.loads(args.baseline.read_text()), args.threshold)
+    for target, name, old, new in regressions:
+        print(f'REGRESSION {target}/{name}: {old * 1000:.3f} ms -> {new * 1000:.3f} ms')
+    if regressions:
+        return 1
+    print(f'\nNo regressions beyond {args.threshold:.0%} of the baseline.')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""
+Loads a code directory's modules the way the lab's play_game does: NAME.py
+from the directory if it exists, otherwise default_code/NAME.pyc.
+
+student_code/play_game.py, benchmark.py and tournament.py all load through
+here, so the fallback, the sys.modules reuse and the import timing are the
+same everywhere.
+
+    with target_path(LAB_DIR / 'teacher_code'):
+        ai_move = load_function(LAB_DIR / 'teacher_code', 'ai_move', 'ai_move')
+"""
+import contextlib
+import importlib.util
+import sys
+import time
+from pathlib import Path
+
+LAB_DIR = Path(__file__).parent.resolve()
+REPO_ROOT = LAB_DIR.parent.parent
+DEFAULT_DIR = LAB_DIR / 'default_code'
+
+# Module names the code directories share; cleared between targets
+MODULE_NAMES = (
+    'calc_score', 'game_over', 'mini_max', 'find_move', 'display_board',
+    'player_move', 'utils', 'transposition', 'search_stats', 'test_minimax',
+    'alpha_beta', 'bitboard', 'tablebase', 'mnk', 'engines', 'ai_move',
+)
+
+_located = {}      # (directory, module name) -> file it is loaded from
+import_times = {}  # module name -> seconds spent importing it
+import_paths = {}  # module name -> file it was imported from
+
+
+def locate_module(name, base_dir):
+    """
+    Returns base_dir/NAME.py if it exists, otherwise default_code/NAME.pyc.
+    Each name is resolved once per directory per process.
+    """
+    key = (base_dir, name)
+    if key not in _located:
+        source_py = base_dir / f'{name}.py'
+        default_pyc = DEFAULT_DIR / f'{name}.pyc'
+        if source_py.exists():
+            _located[key] = source_py
+        elif default_pyc.exists():
+            _located[key] = default_pyc
+        else:
+            raise ImportError(f"Module '{name}' not found in {base_dir.name} or default_code.")
+    return _located[key]
+
+
+def import_module(name, base_dir):
+    """
+    Imports a module from base_dir/NAME.py if it exists,
+    otherwise loads default_code/NAME.pyc directly.
+    A module already imported is returned from sys.modules. The file loader
+    keeps compiled code in __pycache__, so unchanged files are not compiled
+    again.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    start = time.perf_counter()
+    path = locate_module(name, base_dir)
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    import_times[name] = time.perf_counter() - start
+    import_paths[name] = path
+    return module
+
+
+def report_import_times(file=sys.stderr):
+    """Prints how long each module took to import (including what it imported)."""
+    for name, seconds in import_times.items():
+        print(f'{name:<15} {seconds * 1000:8.3f} ms  {import_paths[name]}', file=file)
+
+
+@contextlib.contextmanager
+def target_path(base_dir):
+    """
+    Lets base_dir's modules import each other by bare name, then puts
+    sys.path and sys.modules back so the next target starts clean.
+    """
+    saved_path = list(sys.path)
+    saved_modules = {name: sys.modules.pop(name) for name in MODULE_NAMES if name in sys.modules}
+    sys.path[:0] = [str(base_dir), str(DEFAULT_DIR), str(REPO_ROOT)]
+    try:
+        yield
+    finally:
+        for name in MODULE_NAMES:
+            sys.modules.pop(name, None)
+        sys.modules.update(saved_modules)
+        sys.path[:] = saved_path
+
+
+def load_function(base_dir, module_name, function_name):
+    """Returns base_dir's function, or None if the target doesn't have it."""
+    try:
+        return getattr(import_module(module_name, base_dir), function_name)
+    except (ImportError, AttributeError):
+        return None
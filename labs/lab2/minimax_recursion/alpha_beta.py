@@ -0,0 +1,108 @@
+from copy import copy
+from game_over import game_over
+from calc_score import calc_score
+
+
+# Center first, then corners, then edges: strong moves first means earlier cutoffs.
+MOVE_ORDER = (4, 0, 2, 6, 8, 1, 3, 5, 7)
+
+
+def alpha_beta(board, XsTurn, level, alpha=float('-inf'), beta=float('inf'), stats=None):
+    """
+    Minimax with alpha-beta pruning, using the same level-adjusted scores as mini_max.
+    - board: current state of the game (list of 9 squares).
+    - XsTurn: True if it's X's turn, False if it's O's turn.
+    - level: how deep we are in recursion (faster wins / slower losses score better).
+    - alpha: score X is already sure of elsewhere in the tree.
+    - beta: score O is already sure of elsewhere in the tree.
+    - stats: optional search_stats.SearchStats to count nodes, children and cutoffs in.
+    Returns the exact mini_max score when it lies strictly between alpha and beta,
+    otherwise a bound on the wrong side of the window.
+    """
+    if stats is not None:
+        stats.record_node(board, XsTurn, level)
+
+    best_score = float('-inf') if XsTurn else float('inf')
+    points = 10 if XsTurn else -10
+    children = 0
+
+    # Winning right now is the best this player can ever do from here
+    best_possible = 30 - level if XsTurn else -30 + level
+
+    for square in MOVE_ORDER:
+        if board[square] in (10, -10):
+            continue
+
+        new_board = copy(board)
+        new_board[square] = points
+        children += 1
+
+        if game_over(new_board):
+            if stats is not None:
+                stats.terminal_nodes += 1
+            score = calc_score(new_board)
+            child_score = (
+                score - level if score == 30 else
+                score + level if score == -30 else
+                0
+            )
+        else:
+            child_score = alpha_beta(new_board, not XsTurn, level + 1, alpha, beta, stats)
+
+        if XsTurn:
+            best_score = max(best_score, child_score)
+            alpha = max(alpha, best_score)
+        else:
+            best_score = min(best_score, child_score)
+            beta = min(beta, best_score)
+
+        # Cut off: the other player will never let the game get here,
+        # or this player already found the fastest possible win.
+        if alpha >= beta or best_score == best_possible:
+            if stats is not None:
+                stats.cutoffs += 1
+            break
+
+    if stats is not None:
+        stats.record_expansion(level, children)
+    return best_score
+
+
+def find_move_ab(board, XsTurn, stats=None):
+    """
+    Drop-in replacement for find_move that searches with alpha_beta.
+    - board: current state of the game (list of 9 squares).
+    - XsTurn: True if it's X's turn, False if it's O's turn.
+    - stats: optional search_stats.SearchStats, passed down to alpha_beta.
+    Returns: the index (0-8) of the best move, the same square find_move picks.
+    """
+
+    best_score = float('-inf') if XsTurn else float('inf')
+    best_move = None
+    points = 10 if XsTurn else -10
+
+    # Root moves are tried in square order so ties go to the same square as find_move
+    # (the last one of the best). Each child only has to prove it is at least as good
+    # as the best so far, so its window starts one point worse than best_score.
+    for square in range(9):
+        if board[square] in (10, -10):
+            continue
+
+        new_board = copy(board)
+        new_board[square] = points
+
+        if game_over(new_board):
+            return square
+
+        if XsTurn:
+            score = alpha_beta(new_board, False, 0, alpha=best_score - 1, stats=stats)
+            if score >= best_score:
+                best_score = score
+                best_move = square
+        else:
+            score = alpha_beta(new_board, True, 0, beta=best_score + 1, stats=stats)
+            if score <= best_score:
+                best_score = score
+                best_move = square
+
+    return best_move
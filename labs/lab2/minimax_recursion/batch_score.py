@@ -0,0 +1,56 @@
+"""
+Vectorized calc_score and game_over for many boards at once.
+
+Boards are rows of an (N, 9) int8 array in the usual encoding
+(10 for X, -10 for O, anything else is open). All 8 line sums for all
+N boards come from one matrix product against the winning-line masks.
+"""
+import numpy as np
+
+# Winning lines in the order calc_score checks them, so a board with two
+# winning lines reports the same one: row 0, column 0, row 1, column 1,
+# row 2, column 2, then the two diagonals.
+LINES = (
+    (0, 1, 2), (0, 3, 6),
+    (3, 4, 5), (1, 4, 7),
+    (6, 7, 8), (2, 5, 8),
+    (0, 4, 8), (2, 4, 6),
+)
+
+# (9, 8) matrix: column j has a 1 for each square of line j
+LINE_MASKS = np.zeros((9, len(LINES)), dtype=np.int16)
+for column, line in enumerate(LINES):
+    LINE_MASKS[list(line), column] = 1
+
+
+def calc_score_batch(boards):
+    """
+    calc_score for every board.
+    - boards: (N, 9) array-like of squares.
+    Returns an (N,) int8 array of 30 (X wins), -30 (O wins) or 0.
+    """
+    boards = np.asarray(boards)
+    if boards.ndim != 2 or boards.shape[1] != 9:
+        raise ValueError(f'Expected an (N, 9) array of boards, got shape {boards.shape}')
+
+    # int16 so three 10s don't overflow int8
+    sums = boards.astype(np.int16) @ LINE_MASKS
+    won = (sums == 30) | (sums == -30)
+
+    first = won.argmax(axis=1)  # first winning line, like calc_score's early return
+    scores = sums[np.arange(len(sums)), first]
+    return np.where(won.any(axis=1), scores, 0).astype(np.int8)
+
+
+def game_over_batch(boards, scores=None):
+    """
+    game_over for every board.
+    - boards: (N, 9) array-like of squares.
+    - scores: result of calc_score_batch(boards), if already computed.
+    Returns an (N,) bool array: True if a line is complete or no squares are open.
+    """
+    boards = np.asarray(boards)
+    if scores is None:
+        scores = calc_score_batch(boards)
+    all_filled = (np.abs(boards.astype(np.int16)) == 10).all(axis=1)
+    return all_filled | (scores != 0)
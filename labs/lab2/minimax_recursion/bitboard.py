@@ -0,0 +1,169 @@
+"""
+Bitboard version of the Tic-Tac-Toe board.
+
+Instead of a list of 9 integers, the position is two 9-bit integers:
+bit i of `x` is set when X owns square i, bit i of `o` when O owns it.
+
+    square:  0 1 2      bit:  1    2    4
+             3 4 5            8   16   32
+             6 7 8           64  128  256
+
+Moves are made and unmade in place, and a move only checks the lines that
+run through the square just played, so the search never copies a board.
+"""
+
+FULL = 0b111111111
+
+# The 8 ways to win, as bit masks
+WIN_MASKS = tuple(
+    (1 << a) | (1 << b) | (1 << c) for a, b, c in (
+        (0, 1, 2), (3, 4, 5), (6, 7, 8),  # rows
+        (0, 3, 6), (1, 4, 7), (2, 5, 8),  # columns
+        (0, 4, 8), (2, 4, 6),             # diagonals
+    )
+)
+
+# For each square, only the winning lines that pass through it
+LINES_THROUGH = tuple(
+    tuple(mask for mask in WIN_MASKS if mask & (1 << square)) for square in range(9)
+)
+
+
+class BitBoard:
+    """
+    Game state as two bit masks, one per player.
+    """
+    __slots__ = ('x', 'o')
+
+    def __init__(self, x=0, o=0):
+        self.x = x
+        self.o = o
+
+    @classmethod
+    def from_list(cls, board: list[int]) -> 'BitBoard':
+        """
+        Builds a BitBoard from the list board used everywhere else
+        (10 for X, -10 for O, anything else is open).
+        """
+        x = o = 0
+        for square, cell in enumerate(board):
+            if cell == 10:
+                x |= 1 << square
+            elif cell == -10:
+                o |= 1 << square
+        return cls(x, o)
+
+    def to_list(self) -> list[int]:
+        """
+        Returns the list board (10 for X, -10 for O, 1–9 for open),
+        ready for display_board.print_board and player_move.
+        """
+        return [
+            10 if self.x >> square & 1 else -10 if self.o >> square & 1 else square + 1
+            for square in range(9)
+        ]
+
+    def empty(self) -> int:
+        """Mask of the open squares."""
+        return FULL & ~(self.x | self.o)
+
+    def make(self, square: int, XsTurn: bool) -> bool:
+        """
+        Plays square for the current player, in place.
+        Returns True if this move wins the game.
+        """
+        bit = 1 << square
+        if XsTurn:
+            self.x |= bit
+            mine = self.x
+        else:
+            self.o |= bit
+            mine = self.o
+        for mask in LINES_THROUGH[square]:
+            if mine & mask == mask:
+                return True
+        return False
+
+    def unmake(self, square: int, XsTurn: bool) -> None:
+        """Takes back a move made with make()."""
+        if XsTurn:
+            self.x &= ~(1 << square)
+        else:
+            self.o &= ~(1 << square)
+
+    def score(self) -> int:
+        """Same result as calc_score: 30 if X has a line, -30 if O has one, else 0."""
+        for mask in WIN_MASKS:
+            if self.x & mask == mask:
+                return 30
+            if self.o & mask == mask:
+                return -30
+        return 0
+
+    def game_over(self) -> bool:
+        """Same result as game_over: a line is complete or no open squares remain."""
+        return self.empty() == 0 or self.score() != 0
+
+
+def bb_mini_max(state: BitBoard, XsTurn: bool, level: int) -> int:
+    """
+    mini_max on a BitBoard: same scores, no board copies.
+    - state: position to search (restored before returning).
+    - XsTurn: True if it's X's turn, False if it's O's turn.
+    - level: how deep we are in recursion (faster wins / slower losses score better).
+    """
+    best_score = float('-inf') if XsTurn else float('inf')
+
+    empty = state.empty()
+    while empty:
+        bit = empty & -empty  # lowest open square
+        empty ^= bit
+        square = bit.bit_length() - 1
+
+        if state.make(square, XsTurn):
+            child_score = 30 - level if XsTurn else -30 + level
+        elif state.x | state.o == FULL:
+            child_score = 0
+        else:
+            child_score = bb_mini_max(state, not XsTurn, level + 1)
+        state.unmake(square, XsTurn)
+
+        if XsTurn:
+            if child_score > best_score:
+                best_score = child_score
+        elif child_score < best_score:
+            best_score = child_score
+
+    return best_score
+
+
+def find_move_bb(board: list[int], XsTurn: bool):
+    """
+    Drop-in replacement for find_move that searches on a BitBoard.
+    - board: current state of the game (list of 9 squares).
+    - XsTurn: True if it's X's turn, False if it's O's turn.
+    Returns: the index (0-8) of the best move, the same square find_move picks.
+    """
+    state = BitBoard.from_list(board)
+
+    best_score = float('-inf') if XsTurn else float('inf')
+    best_move = None
+
+    # Square order and ">=" / "<=" keep find_move's tie-breaking (last best square wins)
+    for square in range(9):
+        if not state.empty() >> square & 1:
+            continue
+
+        game_ended = state.make(square, XsTurn) or state.x | state.o == FULL
+        if not game_ended:
+            score = bb_mini_max(state, not XsTurn, 0)
+        state.unmake(square, XsTurn)
+
+        if game_ended:
+            return square
+
+        if score >= best_score if XsTurn else score <= best_score:
+            best_score = score
+            best_move = square
+
+    return best_move
@@ -0,0 +1,108 @@
+"""
+Load-testing client for server.py.
+
+Opens many connections at once and plays random legal moves against the
+server's AI until every game is over, then reports games per second and
+the server's reply latency.
+
+    python client.py --games 2000 --concurrency 500 --port 8765
+    python client.py --unix /tmp/ttt.sock --first ai
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+
+async def read_reply(reader):
+    """Reads one reply block (lines up to the empty line)."""
+    lines = []
+    while True:
+        line = (await reader.readline()).decode()
+        if not line:
+            raise ConnectionError('server closed the connection')
+        line = line.rstrip('\n')
+        if not line:
+            return lines
+        lines.append(line)
+
+
+async def play_one(connect, first, engine, rng, latencies):
+    """Plays one game with random moves. Returns 'you', 'ai' or 'tie'."""
+    reader, writer = await connect()
+    try:
+        await read_reply(reader)  # HELLO
+
+        async def send(command):
+            start = time.perf_counter()
+            writer.write(f'{command}\n'.encode())
+            reply = await read_reply(reader)
+            latencies.append(time.perf_counter() - start)
+            if reply[0].startswith('ERR'):
+                raise RuntimeError(f'{command!r} -> {reply[0]}')
+            return reply
+
+        reply = await send(f'NEW {first} {engine}')
+        open_squares = set(range(1, 10))
+        while True:
+            for line in reply[1:]:
+                if line.startswith('AI '):
+                    open_squares.discard(int(line[3:]))
+            if reply[0].startswith('OVER'):
+                return reply[0].split()[1]
+            move = rng.choice(sorted(open_squares))
+            open_squares.discard(move)
+            reply = await send(f'MOVE {move}')
+    finally:
+        writer.write(b'QUIT\n')
+        writer.close()
+
+
+async def load_test(games, concurrency, first, engine, seed, host, port, unix):
+    if unix:
+        async def connect():
+            return await asyncio.open_unix_connection(unix)
+    else:
+        async def connect():
+            return await asyncio.open_connection(host, port)
+
+    rng = random.Random(seed)
+    latencies = []
+    results = {'you': 0, 'ai': 0, 'tie': 0}
+    limit = asyncio.Semaphore(concurrency)
+
+    async def game():
+        async with limit:
+            results[await play_one(connect, first, engine, rng, latencies)] += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(game() for _ in range(games)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    print(f'{games} games in {elapsed:.2f}s ({games / elapsed:,.0f} games/s), '
+          f'{concurrency} at a time')
+    print(f"results: you {results['you']}, ai {results['ai']}, tie {results['tie']}")
+    print(f'reply latency: median {statistics.median(latencies) * 1000:.2f} ms, '
+          f'p95 {latencies[int(len(latencies) * 0.95)] * 1000:.2f} ms, '
+          f'max {latencies[-1] * 1000:.2f} ms')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Load test the Tic-Tac-Toe server.')
+    parser.add_argument('--games', type=int, default=1000)
+    parser.add_argument('--concurrency', type=int, default=200)
+    parser.add_argument('--first', default='you', choices=('you', 'ai'))
+    parser.add_argument('--engine', default='minimax')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', help='connect to this Unix socket path instead of TCP')
+    args = parser.parse_args(argv)
+    asyncio.run(load_test(args.games, args.concurrency, args.first, args.engine,
+                          args.seed, args.host, args.port, args.unix))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,24 +1,51 @@
 from utils import clear_screen
+from math import isqrt
 
-def print_board(board: list[int]) -> None:
+def format_board(board: list[int], cols: int | None = None) -> str:
     """
-    Display the Tic-Tac-Toe board.
+    Returns the Tic-Tac-Toe board as text, the way print_board shows it.
     Args:
         board: List of 9 integers (10 for X, -10 for O, 1–9 for open).
+               Open squares show the value stored in them, as before.
+               Bigger m,n,k boards work too; their open squares hold 0
+               (mnk.new_board), so those show their square number from 1.
+        cols: Squares per row. Defaults to a square board.
     """
-    def cell(value: int) -> str:
+    if cols is None:
+        cols = isqrt(len(board))
+    rows = len(board) // cols
+    width = len(str(len(board)))
+
+    def cell(square: int) -> str:
+        value = board[square]
         if value == 10: return 'X'
         elif value == -10: return 'O'
-        else: return str(value)
+        elif len(board) == 9: return str(value)
+        else: return str(square + 1)
+
+    lines = []
+    spacer = '|'.join([' ' * (width + 2)] * cols)
+    for row in range(rows):
+        row_values = [f' {cell(row * cols + col):^{width}} ' for col in range(cols)]
+        lines.append(spacer)
+        lines.append('|'.join(row_values))
+        lines.append(spacer)
+        if row < rows - 1:
+            lines.append('-' * len(spacer))
+    return '\n'.join(lines)
 
+
+def print_board(board: list[int], cols: int | None = None) -> None:
+    """
+    Display the Tic-Tac-Toe board.
+    Args:
+        board: List of 9 integers (10 for X, -10 for O, 1–9 for open).
+               Open squares show the value stored in them, as before.
+               Bigger m,n,k boards work too; their open squares hold 0
+               (mnk.new_board), so those show their square number from 1.
+        cols: Squares per row. Defaults to a square board.
+    """
     clear_screen()
     print()
-
-    for row in range(3):
-        row_values = [cell(board[row * 3 + col]) for col in range(3)]
-        print('   |   |   ')
-        print(f' {row_values[0]} | {row_values[1]} | {row_values[2]} ')
-        print('   |   |   ')
-        if row < 2:
-            print('-----------')
+    print(format_board(board, cols))
     print()
@@ -0,0 +1,33 @@
+from find_move import find_move
+from alpha_beta import find_move_ab
+from bitboard import find_move_bb
+from tablebase import find_move_tb
+from mnk import find_move_mnk
+from parallel_find_move import find_move_parallel
+from mcts import find_move_mcts
+
+
+# Every AI engine takes (board, XsTurn) and returns the index (0-8) of its move.
+ENGINES = {
+    'minimax': find_move,
+    'alphabeta': find_move_ab,
+    'bitboard': find_move_bb,
+    'tablebase': find_move_tb,
+    'mnk': find_move_mnk,
+    'parallel': find_move_parallel,
+    'mcts': find_move_mcts,
+}
+
+
+def get_engine(engine):
+    """
+    Returns the move function for an engine.
+    - engine: a name from ENGINES, or a move function (returned unchanged).
+    """
+    if callable(engine):
+        return engine
+    try:
+        return ENGINES[engine]
+    except KeyError:
+        raise ValueError(
+            f"Unknown engine '{engine}'. Choose from: {', '.join(ENGINES)}") from None
@@ -1,13 +1,17 @@
+import time
 from copy import copy
 from mini_max import mini_max
 from game_over import game_over
+from transposition import shared_table
 
 
-def find_move(board, XsTurn):
+def find_move(board, XsTurn, table=shared_table, stats=None):
     """
     Finds the best move for the current player using minimax.
     - board: current state of the game (list of 9 squares).
     - XsTurn: True if it's X's turn, False if it's O's turn.
+    - table: transposition table kept between moves (None to disable caching).
+    - stats: optional search_stats.SearchStats; also gets each root move's score and time.
     Returns: the index (0-8) of the best move.
     """
 
@@ -33,7 +37,10 @@ def find_move(board, XsTurn):
                 return square
 
             # Otherwise, use minimax to evaluate how good this move is
-            score = mini_max(new_board, not XsTurn, 0)
+            start = time.perf_counter() if stats is not None else 0
+            score = mini_max(new_board, not XsTurn, 0, table, stats)
+            if stats is not None:
+                stats.record_root(square, score, time.perf_counter() - start)
 
             # If this score is better (for X: higher, for O: lower), update best_move
             if compare(best_score, score) == score:
@@ -0,0 +1,145 @@
+"""
+Append-only binary log of finished Tic-Tac-Toe games.
+
+File layout:
+    header   MAGIC (4 bytes) and VERSION (1 byte), written once
+    records  one per game, back to back
+
+Each record is one flag byte followed by the moves packed two per byte
+(4-bit square indices 0-8, first move in the low nibble):
+    bits 0-3  number of moves (0-9)
+    bit  4    who moved first: 0 = X (10), 1 = O (-10)
+    bits 5-6  outcome: 0 tie, 1 X won, 2 O won, 3 unfinished
+
+A 9-move game takes 6 bytes. read_games() streams records in chunks, so
+files with millions of games are never loaded whole.
+"""
+from collections import Counter, defaultdict, namedtuple
+from pathlib import Path
+
+MAGIC = b'TTTL'
+VERSION = 1
+HEADER = MAGIC + bytes([VERSION])
+
+DEFAULT_PATH = Path(__file__).parent / 'games.tttlog'
+
+TIE, X_WON, O_WON, UNFINISHED = 0, 1, 2, 3
+OUTCOME_NAMES = ('tie', 'X', 'O', 'unfinished')
+
+GameRecord = namedtuple('GameRecord', 'moves x_first outcome')
+
+
+def outcome_from_score(score):
+    """Maps a calc_score result (30, -30, 0) to an outcome code."""
+    return X_WON if score == 30 else O_WON if score == -30 else TIE
+
+
+def pack_game(moves, x_first=True, outcome=TIE):
+    """Returns the bytes of one record."""
+    if len(moves) > 9 or any(not 0 <= square <= 8 for square in moves):
+        raise ValueError(f'Not a Tic-Tac-Toe game: {moves}')
+    record = bytearray([len(moves) | (0 if x_first else 1) << 4 | outcome << 5])
+    for i in range(0, len(moves), 2):
+        pair = moves[i:i + 2]
+        record.append(pair[0] | (pair[1] << 4 if len(pair) == 2 else 0))
+    return bytes(record)
+
+
+class GameLog:
+    """
+    Appends games to a log file, writing the file header the first time.
+    Use as a context manager, or call close().
+    """
+
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = Path(path)
+        self.file = open(self.path, 'ab')
+        if self.file.tell() == 0:
+            self.file.write(HEADER)
+
+    def append(self, moves, x_first=True, outcome=TIE):
+        """
+        Logs one game.
+        - moves: squares (0-8) in the order they were played.
+        - x_first: True if X (10) made the first move.
+        - outcome: TIE, X_WON, O_WON or UNFINISHED (see outcome_from_score).
+        """
+        self.file.write(pack_game(moves, x_first, outcome))
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def append_game(moves, x_first=True, outcome=TIE, path=DEFAULT_PATH):
+    """Logs a single game (opens and closes the file)."""
+    with GameLog(path) as log:
+        log.append(moves, x_first, outcome)
+
+
+def read_games(path=DEFAULT_PATH, chunk_size=1 << 16):
+    """
+    Yields a GameRecord for every game in the log, reading chunk_size bytes at a time.
+    """
+    with open(path, 'rb') as f:
+        if f.read(len(HEADER)) != HEADER:
+            raise ValueError(f'{path} is not a version {VERSION} game log')
+
+        leftover = b''
+        while True:
+            chunk = f.read(chunk_size)
+            buffer = leftover + chunk
+            pos, end = 0, len(buffer)
+            while pos < end:
+                flags = buffer[pos]
+                count = flags & 0x0F
+                size = 1 + (count + 1) // 2
+                if pos + size > end:
+                    break  # the record continues in the next chunk
+                moves = []
+                for byte in buffer[pos + 1:pos + size]:
+                    moves.append(byte & 0x0F)
+                    moves.append(byte >> 4)
+                yield GameRecord(tuple(moves[:count]), not flags & 0x10, flags >> 5 & 0x03)
+                pos += size
+            leftover = buffer[pos:]
+
+            if not chunk:
+                if leftover:
+                    raise ValueError(f'{path} ends with a truncated record')
+                return
+
+
+def summarize(path=DEFAULT_PATH):
+    """
+    One pass over the log: number of games, how often each opening square is
+    played, results by opening square and the average game length.
+    """
+    games = 0
+    total_moves = 0
+    openings = Counter()
+    results = defaultdict(Counter)
+    for game in read_games(path):
+        games += 1
+        total_moves += len(game.moves)
+        if game.moves:
+            opening = game.moves[0]
+            openings[opening] += 1
+            results[opening][OUTCOME_NAMES[game.outcome]] += 1
+    return {
+        'games': games,
+        'opening_frequency': dict(sorted(openings.items())),
+        'result_by_opening': {square: dict(results[square]) for square in sorted(results)},
+        'average_length': total_moves / games if games else 0.0,
+    }
+
+
+if __name__ == '__main__':
+    import json
+    import sys
+    print(json.dumps(summarize(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_PATH), indent=2))
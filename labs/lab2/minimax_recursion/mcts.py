@@ -0,0 +1,308 @@
+"""
+Monte Carlo Tree Search engine for Tic-Tac-Toe and larger m,n,k boards.
+
+Where a full minimax is out of reach, MCTS grows a search tree with UCT
+selection and scores each new leaf with a batch of random playouts to the end
+of the game. Playouts run on a compact board: for each player, how many
+squares they hold in every winning line, so a move is checked for a win by
+touching only the lines through it. Results use calc_score's values (30 X
+wins, -30 O wins, 0 tie), and the game is over when someone completes a line
+or no squares are open, as in game_over.
+
+    find_move_mcts(board, XsTurn, playouts=5000)           # playout budget
+    find_move_mcts(board, XsTurn, time_ms=500, workers=4)  # time budget, 4 cores
+
+MCTSPlayer keeps its tree between moves, so the search from the previous
+turn is reused after the opponent replies.
+"""
+import math
+import multiprocessing
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from game_over import game_over
+from mnk import board_shape, game_over_mnk, winning_lines
+
+EXPLORATION = math.sqrt(2)
+DEFAULT_PLAYOUTS = 5000
+DEFAULT_BATCH = 8
+
+
+@lru_cache(maxsize=None)
+def line_ids_through(rows, cols, k):
+    """For each square, the indexes (into winning_lines) of the lines through it."""
+    through = [[] for _ in range(rows * cols)]
+    for i, line in enumerate(winning_lines(rows, cols, k)):
+        for square in line:
+            through[square].append(i)
+    return tuple(tuple(ids) for ids in through)
+
+
+def place(counts, through, k, square, points):
+    """Adds a move to the line counts. Returns True if it completes a line."""
+    mine = counts[points]
+    won = False
+    for line in through[square]:
+        mine[line] += 1
+        if mine[line] == k:
+            won = True
+    return won
+
+
+def playout(counts, through, k, open_squares, XsTurn, rng):
+    """
+    Plays random moves from a position to the end of the game.
+    counts is left unchanged. Returns calc_score's result (30, -30 or 0).
+    """
+    counts = {10: list(counts[10]), -10: list(counts[-10])}
+    squares = list(open_squares)
+    rng.shuffle(squares)
+    for square in squares:
+        if place(counts, through, k, square, 10 if XsTurn else -10):
+            return 30 if XsTurn else -30
+        XsTurn = not XsTurn
+    return 0
+
+
+class _Node:
+    """A position in the tree, reached by playing `move` from its parent."""
+
+    __slots__ = ('move', 'x_moved', 'children', 'untried', 'visits', 'value', 'result')
+
+    def __init__(self, move, x_moved, untried, result=None):
+        self.move = move
+        self.x_moved = x_moved      # True if X made `move`
+        self.children = {}
+        self.untried = untried      # open squares with no child node yet
+        self.visits = 0
+        self.value = 0.0            # wins (ties count half) for the player who made `move`
+        self.result = result        # calc_score result if the game is over here
+
+
+class SearchTree:
+    """
+    The MCTS tree for one position, with the compact board of its root.
+    - board: list of rows * cols squares (10 for X, -10 for O, anything else open).
+    - XsTurn: True if it's X's turn, False if it's O's turn.
+    - rows, cols, k: board shape, as for find_move_mnk.
+    """
+
+    def __init__(self, board, XsTurn, rows, cols, k, rng=None):
+        self.k = k
+        self.through = line_ids_through(rows, cols, k)
+        self.rng = rng or random.Random()
+        lines = winning_lines(rows, cols, k)
+        self.counts = {10: [0] * len(lines), -10: [0] * len(lines)}
+        for i, line in enumerate(lines):
+            for square in line:
+                if board[square] in (10, -10):
+                    self.counts[board[square]][i] += 1
+        self.open_squares = [sq for sq in range(len(board)) if board[sq] not in (10, -10)]
+        self.XsTurn = XsTurn
+        self.root = self.new_node(None, not XsTurn, self.open_squares)
+
+    def new_node(self, move, x_moved, open_squares, result=None):
+        untried = list(open_squares)
+        self.rng.shuffle(untried)  # expand children in random order
+        return _Node(move, x_moved, untried, result)
+
+    def iterate(self, batch=DEFAULT_BATCH):
+        """One select / expand / playout / backpropagate pass. Returns the playouts run."""
+        node = self.root
+        path = [node]
+        counts = {10: list(self.counts[10]), -10: list(self.counts[-10])}
+        taken = set()
+        XsTurn = self.XsTurn
+
+        # Select: follow the best UCT child while every move has been tried
+        while node.result is None and not node.untried:
+            log_visits = math.log(node.visits)
+            node = max(node.children.values(), key=lambda child: (
+                child.value / child.visits
+                + EXPLORATION * math.sqrt(log_visits / child.visits)))
+            place(counts, self.through, self.k, node.move, 10 if XsTurn else -10)
+            taken.add(node.move)
+            XsTurn = not XsTurn
+            path.append(node)
+
+        open_squares = [sq for sq in self.open_squares if sq not in taken]
+
+        # Expand one untried move
+        if node.result is None:
+            move = node.untried.pop()
+            open_squares.remove(move)
+            if place(counts, self.through, self.k, move, 10 if XsTurn else -10):
+                result = 30 if XsTurn else -30
+            else:
+                result = None if open_squares else 0
+            child = self.new_node(move, XsTurn, open_squares, result)
+            node.children[move] = child
+            node = child
+            XsTurn = not XsTurn
+            path.append(node)
+
+        # Playouts (a finished game just repeats its result)
+        if node.result is not None:
+            x_wins = batch * (1.0 if node.result == 30 else 0.0 if node.result == -30 else 0.5)
+        else:
+            x_wins = 0.0
+            for _ in range(batch):
+                result = playout(counts, self.through, self.k, open_squares, XsTurn, self.rng)
+                x_wins += 1.0 if result == 30 else 0.0 if result == -30 else 0.5
+
+        for node in path:
+            node.visits += batch
+            node.value += x_wins if node.x_moved else batch - x_wins
+        return batch
+
+    def search(self, playouts=None, time_ms=None, batch=DEFAULT_BATCH):
+        """
+        Runs iterations until the playout budget or the time budget is spent
+        (whichever comes first; DEFAULT_PLAYOUTS if neither is given).
+        """
+        if playouts is None and time_ms is None:
+            playouts = DEFAULT_PLAYOUTS
+        deadline = time.perf_counter() + time_ms / 1000 if time_ms is not None else None
+        done = 0
+        while playouts is None or done < playouts:
+            done += self.iterate(batch)
+            if deadline is not None and time.perf_counter() > deadline:
+                break
+        return done
+
+    def winning_move(self):
+        """A square that wins at once for the player to move, or None."""
+        points = 10 if self.XsTurn else -10
+        mine = self.counts[points]
+        for square in self.open_squares:
+            # The other k - 1 squares of such a line are already ours
+            if any(mine[line] == self.k - 1 for line in self.through[square]):
+                return square
+        return None
+
+    def visit_counts(self):
+        """Playouts through each root move."""
+        return {move: child.visits for move, child in self.root.children.items()}
+
+    def advance(self, move):
+        """Plays a move at the root, keeping the subtree below it."""
+        place(self.counts, self.through, self.k, move, 10 if self.XsTurn else -10)
+        self.open_squares.remove(move)
+        child = self.root.children.get(move)
+        if child is None:
+            child = self.new_node(move, self.XsTurn, self.open_squares)
+        self.root = child
+        self.XsTurn = not self.XsTurn
+
+
+def best_move(visits):
+    """The most visited move (the lowest square on ties)."""
+    return min(visits, key=lambda move: (-visits[move], move))
+
+
+def is_finished(board, rows, cols, k):
+    """game_over on 3x3 boards, game_over_mnk on the rest."""
+    if (rows, cols, k) == (3, 3, 3):
+        return game_over(board)
+    return game_over_mnk(board, rows, cols, k)
+
+
+def search_visits(board, XsTurn, rows, cols, k, playouts, time_ms, batch, seed):
+    """Builds and searches one tree (run in a worker process); returns its root visit counts."""
+    tree = SearchTree(board, XsTurn, rows, cols, k, random.Random(seed))
+    tree.search(playouts, time_ms, batch)
+    return tree.visit_counts()
+
+
+def find_move_mcts(board, XsTurn, rows=None, cols=None, k=None, playouts=None,
+                   time_ms=None, batch=DEFAULT_BATCH, workers=1, seed=None):
+    """
+    Finds a move with Monte Carlo Tree Search.
+    - board: list of rows * cols squares (10 for X, -10 for O, anything else open).
+    - XsTurn: True if it's X's turn, False if it's O's turn.
+    - rows, cols, k: board shape; see mnk.board_shape() for the defaults.
+    - playouts, time_ms: search budget (DEFAULT_PLAYOUTS if neither is given).
+    - batch: playouts run from each new leaf.
+    - workers: processes searching independent trees whose visit counts are
+      added up (each gets the whole budget).
+    - seed: seed for the random playouts, for repeatable moves.
+    Returns: the index of the chosen square, or None if the game is over.
+    """
+    rows, cols, k = board_shape(board, rows, cols, k)
+    if is_finished(board, rows, cols, k):
+        return None
+
+    tree = SearchTree(board, XsTurn, rows, cols, k, random.Random(seed))
+    move = tree.winning_move()
+    if move is not None:
+        return move
+
+    if workers > 1 and multiprocessing.parent_process() is None:
+        seeds = random.Random(seed).sample(range(1 << 30), workers)
+        visits = {}
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(search_visits, list(board), XsTurn, rows, cols, k,
+                                   playouts, time_ms, batch, worker_seed)
+                       for worker_seed in seeds]
+            for future in futures:
+                for square, count in future.result().items():
+                    visits[square] = visits.get(square, 0) + count
+        return best_move(visits)
+
+    tree.search(playouts, time_ms, batch)
+    return best_move(tree.visit_counts())
+
+
+class MCTSPlayer:
+    """
+    An MCTS engine for one game that keeps its tree between moves.
+    Call it like any engine: player(board, XsTurn) returns a square. When the
+    board is the last one it saw plus one opponent move, the search carries on
+    from that part of the old tree; otherwise it starts a new tree.
+    """
+
+    def __init__(self, rows=None, cols=None, k=None, playouts=None, time_ms=None,
+                 batch=DEFAULT_BATCH, seed=None):
+        self.shape = (rows, cols, k)
+        self.playouts = playouts
+        self.time_ms = time_ms
+        self.batch = batch
+        self.rng = random.Random(seed)
+        self.tree = None
+        self.board = None
+        self.reused = 0  # moves that started from an old tree
+
+    def reuse_tree(self, board, XsTurn):
+        """Moves the old tree's root to board if it is one move on. Returns True on success."""
+        if self.tree is None or self.tree.XsTurn != (not XsTurn) or len(board) != len(self.board):
+            return False
+        changed = [sq for sq in range(len(board))
+                   if (board[sq] in (10, -10) or self.board[sq] in (10, -10))
+                   and board[sq] != self.board[sq]]
+        opponent = -10 if XsTurn else 10
+        if len(changed) != 1 or board[changed[0]] != opponent:
+            return False
+        self.tree.advance(changed[0])
+        return True
+
+    def __call__(self, board, XsTurn):
+        rows, cols, k = board_shape(board, *self.shape)
+        if is_finished(board, rows, cols, k):
+            return None
+
+        if self.reuse_tree(board, XsTurn):
+            self.reused += 1
+        else:
+            self.tree = SearchTree(board, XsTurn, rows, cols, k, self.rng)
+
+        move = self.tree.winning_move()
+        if move is None:
+            self.tree.search(self.playouts, self.time_ms, self.batch)
+            move = best_move(self.tree.visit_counts())
+
+        self.tree.advance(move)
+        self.board = list(board)
+        self.board[move] = 10 if XsTurn else -10
+        return move
@@ -1,15 +1,30 @@
 from copy import copy
 from game_over import game_over
 from calc_score import calc_score
+from transposition import canonical_key, shared_table
 
 
-def mini_max(board, XsTurn, level):
+def mini_max(board, XsTurn, level, table=shared_table, stats=None):
     """
     Recursive minimax function.
     - board: current state of the game (list of 9 squares).
     - XsTurn: True if it's X's turn, False if it's O's turn.
     - level: how deep we are in recursion (used to slightly reward faster wins / slower losses).
+    - table: transposition table shared between searches (None to disable caching).
+    - stats: optional search_stats.SearchStats to count nodes, table lookups and children in.
     """
+    if stats is not None:
+        stats.record_node(board, XsTurn, level)
+
+    # Symmetric positions have the same score, so look the position up first.
+    # Scores are cached as if found at level 0 and shifted back to this level.
+    if table is not None:
+        key = (canonical_key(board), XsTurn)
+        cached = table.get(key)
+        if stats is not None:
+            stats.record_lookup(cached is not None)
+        if cached is not None:
+            return cached - level if cached > 0 else cached + level if cached < 0 else 0
 
     # Start with the worst possible score for this player.
     # X wants to maximize (start -inf). O wants to minimize (start +inf).
@@ -20,6 +35,7 @@ def mini_max(board, XsTurn, level):
 
     # X marks squares with 10, O marks with -10
     points = 10 if XsTurn else -10
+    children = 0
 
     # Loop through all 9 possible squares on the board
     for square in range(9):
@@ -29,10 +45,13 @@ def mini_max(board, XsTurn, level):
         # Only play in empty squares (not already 10 or -10)
         if new_board[square] not in (10, -10):
             new_board[square] = points  # Try making this move
+            children += 1
             score = calc_score(new_board)  # Check if it makes someone win
 
             # Base case: if game is over, assign score immediately
             if game_over(new_board):
+                if stats is not None:
+                    stats.terminal_nodes += 1
                 # If X wins: score == 30
                 # If O wins: score == -30
                 # If draw: score == 0
@@ -44,10 +63,17 @@ def mini_max(board, XsTurn, level):
                 )
             else:
                 # Recursive case: let the other player make their move
-                child_score = mini_max(new_board, not XsTurn, level + 1)
+                child_score = mini_max(new_board, not XsTurn, level + 1, table, stats)
 
             # Update best_score if this move is better than what we had
             if compare(best_score, child_score) == child_score:
                 best_score = child_score
 
+    if stats is not None:
+        stats.record_expansion(level, children)
+
+    if table is not None:
+        table.put(key, best_score + level if best_score > 0 else
+                  best_score - level if best_score < 0 else 0)
+
     return best_score
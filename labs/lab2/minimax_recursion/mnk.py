@@ -0,0 +1,353 @@
+"""
+Generalized m,n,k engine: any rows x cols board, k in a row to win.
+
+Boards use the same encoding as the 3x3 game (10 for X, -10 for O, anything
+else is open). Open squares past 9 cannot hold their own number, since 10
+would read as X, so new_board() fills open squares with 0.
+
+The search cannot reach the end of the game on big boards, so find_move_mnk
+runs alpha-beta with iterative deepening, scores unfinished positions by
+their open lines, and stops at a hard wall-clock deadline with the best move
+of the last completed depth. The line tables of a board shape are built
+under the same deadline, carrying on over later calls, and a search that
+plays every line out to the end stops deepening at once. Moves are tried
+from the centre outwards, generated a ring at a time as the search asks for
+them, so nothing walks or sorts the whole board before the deadline is
+checked.
+"""
+import itertools
+import time
+from collections import defaultdict
+from functools import lru_cache
+from math import isqrt
+
+WIN_SCORE = 1_000_000_000
+# Squares scanned for pieces between deadline checks when a search starts
+SCAN_BLOCK = 1 << 16
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search when the move deadline has passed."""
+
+
+def new_board(rows, cols):
+    """Returns an empty rows x cols board."""
+    return [0] * (rows * cols)
+
+
+def board_shape(board, rows=None, cols=None, k=None):
+    """
+    Fills in the board dimensions that were not given.
+    Square boards are assumed; k defaults to the side length, capped at 5.
+    """
+    if rows is None and cols is None:
+        rows = cols = isqrt(len(board))
+    elif rows is None:
+        rows = len(board) // cols
+    elif cols is None:
+        cols = len(board) // rows
+    if rows * cols != len(board):
+        raise ValueError(f'A board of {len(board)} squares is not {rows}x{cols}')
+    if k is None:
+        k = min(rows, cols, 5)
+    return rows, cols, k
+
+
+class _LineTables:
+    """
+    The winning lines of one board shape, and the lines through each
+    square. Built a row of squares at a time, so a search under a deadline
+    can stop part way and carry on building on its next call.
+    """
+
+    def __init__(self, rows, cols, k):
+        self.rows, self.cols, self.k = rows, cols, k
+        self.lines = []
+        self.through = defaultdict(list)  # square -> lines, filled in as rows are built
+        self.next_row = 0
+
+    def build(self, deadline=None):
+        """Builds the rest of the tables; raises SearchTimeout if the deadline passes first."""
+        rows, cols, k = self.rows, self.cols, self.k
+        while self.next_row < rows:
+            if deadline is not None and time.perf_counter() > deadline:
+                raise SearchTimeout
+            r = self.next_row
+            for c in range(cols):
+                for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                    end_r, end_c = r + dr * (k - 1), c + dc * (k - 1)
+                    if 0 <= end_r < rows and 0 <= end_c < cols:
+                        line = tuple((r + dr * i) * cols + c + dc * i for i in range(k))
+                        self.lines.append(line)
+                        for square in line:
+                            self.through[square].append(line)
+            self.next_row += 1
+        return self
+
+
+_line_tables = {}
+
+
+def line_tables(rows, cols, k):
+    """The (possibly unfinished) _LineTables of a board shape, one per shape per process."""
+    tables = _line_tables.get((rows, cols, k))
+    if tables is None:
+        tables = _line_tables[rows, cols, k] = _LineTables(rows, cols, k)
+    return tables
+
+
+@lru_cache(maxsize=None)
+def winning_lines(rows, cols, k):
+    """All runs of k squares in a row, column or diagonal, as index tuples."""
+    return tuple(line_tables(rows, cols, k).build().lines)
+
+
+@lru_cache(maxsize=None)
+def lines_through(rows, cols, k):
+    """For each square, the winning lines that pass through it."""
+    through = line_tables(rows, cols, k).build().through
+    return tuple(tuple(through[square]) for square in range(rows * cols))
+
+
+def center_out(rows, cols):
+    """
+    Yields every square from the center outwards, the default move ordering:
+    the center square, then ring after ring around it. Each ring goes from
+    the middle of its sides out to its corners, so nearer squares come
+    first, and only the part of a ring on the board is walked.
+    """
+    mid_r, mid_c = (rows - 1) // 2, (cols - 1) // 2
+    # The board reaches this far past the center (the far side is never the shorter one)
+    reach_r, reach_c = rows - 1 - mid_r, cols - 1 - mid_c
+    yield mid_r * cols + mid_c
+    for ring in range(1, max(reach_r, reach_c) + 1):
+        edges = ring <= reach_r   # the top and bottom of the ring, t columns from the middle
+        sides = ring <= reach_c   # its left and right, t rows from the middle (corners excluded)
+        last = max(min(ring, reach_c) if edges else -1, min(ring - 1, reach_r) if sides else -1)
+        for t in range(last + 1):
+            offsets = (-t, t) if t else (0,)
+            squares = []
+            if edges and t <= reach_c:
+                squares += [(mid_r + dr, mid_c + dc) for dr in (-ring, ring) for dc in offsets]
+            if sides and t < ring:
+                squares += [(mid_r + dr, mid_c + dc) for dc in (-ring, ring) for dr in offsets]
+            yield from sorted(r * cols + c for r, c in squares if 0 <= r < rows and 0 <= c < cols)
+
+
+def calc_score_mnk(board, rows, cols, k):
+    """Like calc_score: 30 if X has k in a row, -30 if O has, else 0."""
+    for line in winning_lines(rows, cols, k):
+        first = board[line[0]]
+        if first in (10, -10) and all(board[square] == first for square in line):
+            return 30 if first == 10 else -30
+    return 0
+
+
+def game_over_mnk(board, rows, cols, k):
+    """Like game_over: someone has k in a row or no open squares remain."""
+    return all(abs(cell) == 10 for cell in board) or calc_score_mnk(board, rows, cols, k) != 0
+
+
+def line_value(board, line):
+    """
+    Heuristic worth of one line from X's point of view: a line still open
+    for only one player counts for that player, more the fuller it is.
+    """
+    xs = os = 0
+    for square in line:
+        cell = board[square]
+        if cell == 10:
+            xs += 1
+        elif cell == -10:
+            os += 1
+    if xs and not os:
+        return 4 ** xs
+    if os and not xs:
+        return -(4 ** os)
+    return 0
+
+
+def evaluate(board, rows, cols, k):
+    """Heuristic score of an unfinished position from X's point of view."""
+    return sum(line_value(board, line) for line in winning_lines(rows, cols, k))
+
+
+class _Search:
+    """
+    State shared by one deadline-bound search. Setting up raises
+    SearchTimeout if the deadline passes before the line tables are built.
+    """
+
+    def __init__(self, board, rows, cols, k, deadline):
+        self.board = board
+        self.rows, self.cols, self.k = rows, cols, k
+        self.through = line_tables(rows, cols, k).build(deadline).through
+        self.deadline = deadline
+        self.nodes = 0
+        self.cut = False  # set when a line was scored by the heuristic, not played out
+        # Lines with no pieces score 0, so only the lines through taken squares count
+        self.score = 0
+        self.open_count = len(board)
+        scored = set()
+        # list.index finds the taken squares, a block at a time between deadline checks
+        for start in range(0, len(board), SCAN_BLOCK):
+            if time.perf_counter() > deadline:
+                raise SearchTimeout
+            stop = start + SCAN_BLOCK
+            for points in (10, -10):
+                square = start - 1
+                while True:
+                    try:
+                        square = board.index(points, square + 1, stop)
+                    except ValueError:
+                        break
+                    self.open_count -= 1
+                    for line in self.through[square]:
+                        if line not in scored:
+                            scored.add(line)
+                            self.score += line_value(board, line)
+
+    def candidates(self):
+        """
+        Yields the open squares from the center outwards, generating them as
+        they are asked for and checking the deadline along the way.
+        """
+        board = self.board
+        for i, square in enumerate(center_out(self.rows, self.cols)):
+            if i % 64 == 0 and time.perf_counter() > self.deadline:
+                raise SearchTimeout
+            if board[square] not in (10, -10):
+                yield square
+
+    def check_deadline(self):
+        self.nodes += 1
+        if time.perf_counter() > self.deadline:
+            raise SearchTimeout
+
+    def make(self, square, points):
+        """
+        Places points on square and updates the heuristic score from only
+        the lines through it. Returns True if the move completes a line.
+        """
+        board = self.board
+        through = self.through[square]
+        before = sum(line_value(board, line) for line in through)
+        board[square] = points
+        self.open_count -= 1
+        self.score += sum(line_value(board, line) for line in through) - before
+        for line in through:
+            if all(board[s] == points for s in line):
+                return True
+        return False
+
+    def unmake(self, square, saved):
+        """Takes back a move made with make(), restoring the old square value."""
+        board = self.board
+        through = self.through[square]
+        before = sum(line_value(board, line) for line in through)
+        board[square] = saved
+        self.open_count += 1
+        self.score += sum(line_value(board, line) for line in through) - before
+
+    def alpha_beta(self, XsTurn, depth, level, alpha, beta):
+        self.check_deadline()
+
+        board = self.board
+        points = 10 if XsTurn else -10
+        best_score = float('-inf') if XsTurn else float('inf')
+
+        for square in self.candidates():
+            saved = board[square]
+            try:
+                if self.make(square, points):
+                    child_score = WIN_SCORE - level if XsTurn else -WIN_SCORE + level
+                elif self.open_count == 0:
+                    child_score = 0
+                elif depth <= 1:
+                    child_score = self.score
+                    self.cut = True
+                else:
+                    child_score = self.alpha_beta(not XsTurn, depth - 1, level + 1, alpha, beta)
+            finally:
+                self.unmake(square, saved)
+
+            if XsTurn:
+                best_score = max(best_score, child_score)
+                alpha = max(alpha, best_score)
+            else:
+                best_score = min(best_score, child_score)
+                beta = min(beta, best_score)
+            if alpha >= beta:
+                break
+
+        return best_score
+
+    def root(self, XsTurn, depth, first):
+        """Searches every root move to depth; returns (best move, best score)."""
+        board = self.board
+        points = 10 if XsTurn else -10
+        moves = itertools.chain([first], (sq for sq in self.candidates() if sq != first))
+
+        best_move, best_score = None, float('-inf') if XsTurn else float('inf')
+        alpha, beta = float('-inf'), float('inf')
+        for square in moves:
+            self.check_deadline()
+            saved = board[square]
+            try:
+                if self.make(square, points):
+                    return square, WIN_SCORE if XsTurn else -WIN_SCORE
+                if self.open_count == 0:
+                    score = 0
+                elif depth <= 1:
+                    score = self.score
+                    self.cut = True
+                else:
+                    score = self.alpha_beta(not XsTurn, depth - 1, 1, alpha, beta)
+            finally:
+                self.unmake(square, saved)
+
+            if score > best_score if XsTurn else score < best_score:
+                best_move, best_score = square, score
+            if XsTurn:
+                alpha = max(alpha, best_score)
+            else:
+                beta = min(beta, best_score)
+        return best_move, best_score
+
+
+def find_move_mnk(board, XsTurn, rows=None, cols=None, k=None, deadline_ms=1000):
+    """
+    Finds a move on any rows x cols board with k in a row to win.
+    - board: list of rows * cols squares (10 for X, -10 for O, anything else open).
+    - XsTurn: True if it's X's turn, False if it's O's turn.
+    - rows, cols, k: board shape; see board_shape() for the defaults.
+    - deadline_ms: wall-clock budget. The best move of the deepest completed
+      search is returned once it runs out, so latency is bounded on any board.
+    Returns: the index of the chosen square, or None if the board is full.
+    """
+    deadline = time.perf_counter() + deadline_ms / 1000
+    rows, cols, k = board_shape(board, rows, cols, k)
+
+    # Played if the deadline passes before a search completes
+    best_move = next((sq for sq in center_out(rows, cols) if board[sq] not in (10, -10)), None)
+    if best_move is None:
+        return None
+
+    try:
+        search = _Search(list(board), rows, cols, k, deadline)
+    except SearchTimeout:
+        return best_move
+
+    for depth in range(1, search.open_count + 1):
+        search.cut = False
+        try:
+            best_move, best_score = search.root(XsTurn, depth, best_move)
+        except SearchTimeout:
+            break
+        # A forced result is final: deeper searches cannot change it
+        if abs(best_score) >= WIN_SCORE - len(board):
+            break
+        # Every line was played to the end of the game: the result is exact
+        if not search.cut:
+            break
+    return best_move
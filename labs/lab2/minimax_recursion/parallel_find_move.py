@@ -0,0 +1,95 @@
+"""
+find_move with the root moves scored in parallel on a process pool.
+
+Each worker keeps its own transposition table between searches, and scores
+that come back are stored in the caller's table, so a position searched once
+is answered from the cache after that. Moves are merged in square order with
+the same comparison as find_move, so the chosen move is always the one
+find_move would pick.
+"""
+import atexit
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from copy import copy
+
+from find_move import find_move
+from game_over import game_over
+from mini_max import mini_max
+from transposition import canonical_key, shared_table
+
+# With fewer empty squares than this the search is too short to be worth
+# sending to the pool, so find_move runs in this process instead
+MIN_PARALLEL_SQUARES = 8
+
+_pool = None
+
+
+def get_pool(workers=None):
+    """Returns the process pool, starting it on first use."""
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=workers)
+        atexit.register(_pool.shutdown)
+    return _pool
+
+
+def score_move(board, XsTurn, use_table):
+    """Scores one root move in a worker process (level 0, like find_move)."""
+    return mini_max(board, XsTurn, 0, shared_table if use_table else None)
+
+
+def find_move_parallel(board, XsTurn, table=shared_table, workers=None,
+                       min_squares=MIN_PARALLEL_SQUARES):
+    """
+    Finds the best move like find_move, scoring the root moves concurrently.
+    - board: current state of the game (list of 9 squares).
+    - XsTurn: True if it's X's turn, False if it's O's turn.
+    - table: transposition table for results (None to disable caching).
+    - workers: pool size the first time the pool starts (None for one per CPU).
+    - min_squares: positions with fewer empty squares are searched serially.
+    Returns: the index (0-8) of the best move.
+    Inside a worker process (e.g. the verifier's or the server's pool) the
+    search is serial too, as a pool can't safely be started from there.
+    """
+    open_squares = [square for square in range(9) if board[square] not in (10, -10)]
+    if len(open_squares) < min_squares or multiprocessing.parent_process() is not None:
+        return find_move(board, XsTurn, table)
+
+    points = 10 if XsTurn else -10
+    children = {}
+    for square in open_squares:
+        new_board = copy(board)
+        new_board[square] = points
+        # find_move returns the first move that ends the game without searching the rest
+        if game_over(new_board):
+            return square
+        children[square] = new_board
+
+    scores = {}
+    futures = {}
+    for square, new_board in children.items():
+        key = (canonical_key(new_board), not XsTurn)
+        cached = table.get(key) if table is not None else None
+        if cached is not None:
+            scores[square] = cached
+        else:
+            futures[square] = get_pool(workers).submit(
+                score_move, new_board, not XsTurn, table is not None)
+
+    for square, future in futures.items():
+        scores[square] = future.result()
+        if table is not None:
+            # Level 0 scores are stored as they are, like mini_max does
+            table.put((canonical_key(children[square]), not XsTurn), scores[square])
+
+    # Merge in square order with find_move's tie-breaking (the last best square wins)
+    best_score = float('-inf') if XsTurn else float('inf')
+    best_move = None
+    compare = max if XsTurn else min
+    for square in open_squares:
+        score = scores[square]
+        if compare(best_score, score) == score:
+            best_score = score
+            best_move = square
+
+    return best_move
@@ -0,0 +1,209 @@
+"""
+Perft: counts the positions reachable at every ply, using each board
+representation's own move generation and game-over check.
+
+From the empty board the counts are known exactly, so any change to
+calc_score, game_over or the move loops that drops or invents a position
+shows up at once:
+
+    python perft.py                       # every representation, full depth
+    python perft.py --representations list bitboard --depth 6
+
+Known totals from the empty board: 255,168 possible games, ending in
+958 distinct terminal positions.
+"""
+import argparse
+import sys
+import time
+from collections import namedtuple
+from copy import copy
+
+from bitboard import BitBoard
+from calc_score import calc_score
+from game_over import game_over
+from alpha_beta import MOVE_ORDER
+from mcts import SearchTree, place
+from mnk import _Search
+
+# Positions after each ply from the empty board (every move sequence counted)
+KNOWN_POSITIONS = (9, 72, 504, 3024, 15120, 54720, 148176, 200448, 127872)
+# Games that end at each ply
+KNOWN_GAMES = (0, 0, 0, 0, 1440, 5328, 47952, 72576, 127872)
+# Games won by X, won by O and tied, keyed by calc_score's result
+KNOWN_RESULTS = {30: 131184, -30: 77904, 0: 46080}
+KNOWN_TERMINAL_POSITIONS = 958
+
+# positions[i] and games[i] are counts after ply i + 1
+PerftResult = namedtuple('PerftResult', 'positions games results terminal_positions')
+
+
+class _Counter:
+    def __init__(self, depth):
+        self.positions = [0] * depth
+        self.games = [0] * depth
+        self.results = {30: 0, -30: 0, 0: 0}
+        self.terminal = set()
+
+    def game_over(self, ply, score, key):
+        self.games[ply] += 1
+        self.results[score] += 1
+        self.terminal.add(key)
+
+    def result(self):
+        return PerftResult(self.positions, self.games, self.results, len(self.terminal))
+
+
+def _list_key(board):
+    return tuple(cell if cell in (10, -10) else 0 for cell in board)
+
+
+def perft_list(board, XsTurn, depth, order=range(9)):
+    """Copies the board for every move and checks it with game_over/calc_score, like mini_max."""
+    counter = _Counter(depth)
+
+    def walk(board, XsTurn, ply):
+        points = 10 if XsTurn else -10
+        for square in order:
+            if board[square] not in (10, -10):
+                new_board = copy(board)
+                new_board[square] = points
+                counter.positions[ply] += 1
+                if game_over(new_board):
+                    counter.game_over(ply, calc_score(new_board), _list_key(new_board))
+                elif ply + 1 < depth:
+                    walk(new_board, not XsTurn, ply + 1)
+
+    walk(board, XsTurn, 0)
+    return counter.result()
+
+
+def perft_alphabeta(board, XsTurn, depth):
+    """The list board in alpha_beta's MOVE_ORDER."""
+    return perft_list(board, XsTurn, depth, MOVE_ORDER)
+
+
+def perft_bitboard(board, XsTurn, depth):
+    """BitBoard.make/unmake in place, like bb_mini_max."""
+    counter = _Counter(depth)
+    state = BitBoard.from_list(board)
+
+    def walk(XsTurn, ply):
+        empty = state.empty()
+        for square in range(9):
+            if empty >> square & 1:
+                won = state.make(square, XsTurn)
+                counter.positions[ply] += 1
+                if won or not state.empty():
+                    counter.game_over(ply, state.score(), (state.x, state.o))
+                elif ply + 1 < depth:
+                    walk(not XsTurn, ply + 1)
+                state.unmake(square, XsTurn)
+
+    walk(XsTurn, 0)
+    return counter.result()
+
+
+def perft_mnk(board, XsTurn, depth):
+    """The m,n,k search's make/unmake (incremental heuristic and open count) on 3x3."""
+    counter = _Counter(depth)
+    search = _Search(list(board), 3, 3, 3, float('inf'))
+
+    def walk(XsTurn, ply):
+        points = 10 if XsTurn else -10
+        for square in search.candidates():
+            saved = search.board[square]
+            won = search.make(square, points)
+            counter.positions[ply] += 1
+            if won or search.open_count == 0:
+                counter.game_over(ply, points * 3 if won else 0, _list_key(search.board))
+            elif ply + 1 < depth:
+                walk(not XsTurn, ply + 1)
+            search.unmake(square, saved)
+
+    walk(XsTurn, 0)
+    return counter.result()
+
+
+def perft_mcts(board, XsTurn, depth):
+    """The MCTS line counts, as used by its tree and playouts."""
+    counter = _Counter(depth)
+    tree = SearchTree(board, XsTurn, 3, 3, 3)
+
+    def walk(counts, cells, open_squares, XsTurn, ply):
+        points = 10 if XsTurn else -10
+        for square in open_squares:
+            new_counts = {10: list(counts[10]), -10: list(counts[-10])}
+            won = place(new_counts, tree.through, tree.k, square, points)
+            new_cells = cells[:square] + (points,) + cells[square + 1:]
+            rest = [sq for sq in open_squares if sq != square]
+            counter.positions[ply] += 1
+            if won or not rest:
+                counter.game_over(ply, points * 3 if won else 0, new_cells)
+            elif ply + 1 < depth:
+                walk(new_counts, new_cells, rest, not XsTurn, ply + 1)
+
+    walk(tree.counts, _list_key(board), tree.open_squares, XsTurn, 0)
+    return counter.result()
+
+
+REPRESENTATIONS = {
+    'list': perft_list,
+    'alphabeta': perft_alphabeta,
+    'bitboard': perft_bitboard,
+    'mnk': perft_mnk,
+    'mcts': perft_mcts,
+}
+
+
+def perft(board, XsTurn, depth, representation='list'):
+    """
+    Counts the positions reachable from board, ply by ply.
+    - board: current state of the game (list of 9 squares).
+    - XsTurn: True if it's X's turn, False if it's O's turn.
+    - depth: number of plies to look ahead (9 reaches the end of every game).
+    - representation: a name from REPRESENTATIONS.
+    Returns a PerftResult: positions and games (games that ended) per ply,
+    games by calc_score result, and the number of distinct finished positions.
+    """
+    return REPRESENTATIONS[representation](board, XsTurn, depth)
+
+
+def check(result, depth):
+    """Returns the differences from the known totals of the empty board (empty if none)."""
+    errors = []
+    if result.positions != list(KNOWN_POSITIONS[:depth]):
+        errors.append(f'positions {result.positions} != {list(KNOWN_POSITIONS[:depth])}')
+    if result.games != list(KNOWN_GAMES[:depth]):
+        errors.append(f'games {result.games} != {list(KNOWN_GAMES[:depth])}')
+    if depth == 9 and result.results != KNOWN_RESULTS:
+        errors.append(f'results {result.results} != {KNOWN_RESULTS}')
+    if depth == 9 and result.terminal_positions != KNOWN_TERMINAL_POSITIONS:
+        errors.append(f'terminal positions {result.terminal_positions} != {KNOWN_TERMINAL_POSITIONS}')
+    return errors
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Count reachable positions from the empty board.')
+    parser.add_argument('--depth', type=int, default=9, choices=range(1, 10))
+    parser.add_argument('--representations', nargs='+', default=list(REPRESENTATIONS),
+                        choices=list(REPRESENTATIONS))
+    args = parser.parse_args(argv)
+
+    failed = False
+    for name in args.representations:
+        start = time.perf_counter()
+        result = perft([1, 2, 3, 4, 5, 6, 7, 8, 9], True, args.depth, name)
+        elapsed = time.perf_counter() - start
+        total = sum(result.positions)
+        errors = check(result, args.depth)
+        failed = failed or bool(errors)
+        print(f'{name:<10} {total:>8,} positions  {sum(result.games):>8,} games  '
+              f'{result.terminal_positions:>4} terminal  {elapsed:6.2f}s  '
+              f'{total / elapsed:>10,.0f} positions/s  {"FAIL" if errors else "ok"}')
+        for error in errors:
+            print(f'    {error}')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
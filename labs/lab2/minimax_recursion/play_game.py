@@ -2,15 +2,26 @@ from display_board import print_board
 from game_over import game_over
 from calc_score import calc_score
 from player_move import player_move
-from find_move import find_move, mini_max
+from engines import get_engine
+from mcts import MCTSPlayer, find_move_mcts
+from gamelog import DEFAULT_PATH, append_game, outcome_from_score
 from utils import clear_screen
 import time
 
 
-def play_game():
+def play_game(engine='minimax', log_path=DEFAULT_PATH):
+    """
+    Plays one game against the AI.
+    - engine: name of the AI engine (see engines.ENGINES) or a move function.
+    - log_path: game log the finished game is appended to (None to not log it).
+    """
+    engine = get_engine(engine)
+    if engine is find_move_mcts:
+        engine = MCTSPlayer()  # keeps its search tree from move to move
     score = {'player': 10, 'ai': -10}
     playerTurn = True
     board = [1, 2, 3, 4, 5, 6, 7, 8, 9]
+    moves = []
     player_win = 30
 
     clear_screen()
@@ -41,20 +52,27 @@ def play_game():
 
             print(f'{player_name} moves')
 
+            before = list(board)
             player_move(board, score)
+            moves.append(next(sq for sq in range(9) if board[sq] != before[sq]))
         else:
             print(f'{ai_name} moves')
             time.sleep(2)
 
             XsTurn = (score['ai'] == 10)
-            move = find_move(board, XsTurn)
+            move = engine(board, XsTurn)
             board[move] = score['ai']
+            moves.append(move)
 
         playerTurn = not playerTurn
 
     print_board(board)
     score = calc_score(board)
 
+    # Whoever moves first plays X
+    if log_path is not None:
+        append_game(moves, x_first=True, outcome=outcome_from_score(score), path=log_path)
+
     if score == player_win:
         print(f'Congratulations {player_name}, you beat me. Big Deal \n')
     elif score == -player_win:
@@ -1,15 +1,17 @@
 def player_move(board: list[int], score: dict[str, int]):
     """
     Prompts the player to choose a valid move.
+    Works for any board size: cells are numbered 1 to len(board).
     """
-    prompt = 'Select an empty cell (1-9): '
+    last = len(board)
+    prompt = f'Select an empty cell (1-{last}): '
     while True:
         try:
             move = int(input(prompt))
-            if move < 1 or move > 9 or abs(board[move - 1]) == abs(score['player']):
+            if move < 1 or move > last or abs(board[move - 1]) == abs(score['player']):
                 raise ValueError
             break
         except ValueError:
-            prompt = 'Invalid. Try again with an empty cell index (1–9): '
+            prompt = f'Invalid. Try again with an empty cell index (1–{last}): '
 
     board[move - 1] = score['player']
@@ -0,0 +1,80 @@
+"""
+Opt-in counters for the searches.
+
+    stats = SearchStats()
+    find_move(board, True, stats=stats)
+    print(stats.to_json())
+
+mini_max, find_move, alpha_beta and find_move_ab take an optional stats
+argument and count into it where the work happens: every node visited,
+every transposition table lookup made on the table the search was given,
+the children generated at each node that was expanded, and (alpha_beta)
+every cutoff. Without stats the searches skip all of it.
+"""
+import json
+
+
+class SearchStats:
+    """
+    Counters for one or more searches.
+    - on_node: optional callback(board, XsTurn, level) called for every node.
+    """
+
+    def __init__(self, on_node=None):
+        self.on_node = on_node
+        self.nodes = 0
+        self.terminal_nodes = 0
+        self.max_depth = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cutoffs = 0
+        self.plies = {}       # level -> [nodes expanded, children generated]
+        self.root_moves = []  # one entry per root move searched by find_move
+        self.elapsed = 0.0
+
+    def record_node(self, board, XsTurn, level):
+        self.nodes += 1
+        self.max_depth = max(self.max_depth, level + 1)
+        if self.on_node is not None:
+            self.on_node(board, XsTurn, level)
+
+    def record_lookup(self, hit):
+        if hit:
+            self.cache_hits += 1
+        else:
+            self.cache_misses += 1
+
+    def record_expansion(self, level, children):
+        """A node at level that was searched (not answered from the table) and its children."""
+        ply = self.plies.setdefault(level, [0, 0])
+        ply[0] += 1
+        ply[1] += children
+
+    def record_root(self, square, score, elapsed):
+        self.root_moves.append({'square': square, 'score': score, 'elapsed': elapsed})
+        self.elapsed += elapsed
+
+    def branching_factor(self):
+        """Average number of children per expanded node, by level."""
+        return {level: children / nodes for level, (nodes, children) in sorted(self.plies.items())}
+
+    def to_dict(self):
+        return {
+            'nodes': self.nodes,
+            'terminal_nodes': self.terminal_nodes,
+            'max_depth': self.max_depth,
+            'branching_factor': self.branching_factor(),
+            'cache_hits': self.cache_hits,
+            'cache_misses': self.cache_misses,
+            'cutoffs': self.cutoffs,
+            'root_moves': self.root_moves,
+            'elapsed': self.elapsed,
+        }
+
+    def to_json(self, **kwargs):
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def dump(self, path):
+        """Writes the stats to path as JSON."""
+        with open(path, 'w') as f:
+            f.write(self.to_json(indent=2) + '\n')
@@ -0,0 +1,237 @@
+"""
+Multi-game Tic-Tac-Toe server on asyncio.
+
+Each connection plays its own games over a line protocol, so one process
+serves many players. AI searches run on a process pool and never block the
+event loop, and all games share one position cache.
+
+    python server.py --port 8765            # TCP on localhost
+    python server.py --unix /tmp/ttt.sock   # Unix socket
+
+Commands (one per line):
+    NEW [you|ai] [engine]   start a game; who moves first (default you)
+    MOVE <1-9>              play a square
+    BOARD                   show the board again
+    QUIT                    close the connection
+
+Every reply is a block of lines ended by an empty line:
+    OK | ERR <reason> | OVER <you|ai|tie>   status
+    AI <1-9>                                if the AI moved
+    <board lines>                           print_board's drawing
+
+If the engine fails, the reply is ERR and the failure is logged; the
+player's move is taken back, so the same MOVE can be sent again.
+"""
+import argparse
+import asyncio
+import logging
+import os
+import stat
+from concurrent.futures import ProcessPoolExecutor
+
+from calc_score import calc_score
+from display_board import format_board
+from engines import ENGINES, get_engine
+from game_over import game_over
+from transposition import TranspositionTable
+
+logger = logging.getLogger(__name__)
+
+
+def search(engine_name, board, XsTurn):
+    """Runs an engine in a worker process (top level so it can be pickled)."""
+    return get_engine(engine_name)(board, XsTurn)
+
+
+class MoveCache:
+    """
+    AI moves shared by every game on the server, keyed by exact position
+    (engines break ties by square index, so mirrored boards can differ).
+    A position already being searched is awaited rather than searched twice.
+    """
+
+    def __init__(self, pool, max_size=50000):
+        self.pool = pool
+        self.table = TranspositionTable(max_size)
+        self.pending = {}
+
+    async def find_move(self, engine_name, board, XsTurn):
+        key = (engine_name, tuple(cell if cell in (10, -10) else 0 for cell in board), XsTurn)
+        move = self.table.get(key)
+        if move is not None:
+            return move
+
+        future = self.pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self.pool, search, engine_name, list(board), XsTurn)
+            self.pending[key] = future
+            future.add_done_callback(lambda done: self.finish(key, done))
+        # Shielded: a client that disconnects cancels only its own wait,
+        # not the search other games are waiting on
+        return await asyncio.shield(future)
+
+    def finish(self, key, future):
+        del self.pending[key]
+        if not future.cancelled() and future.exception() is None:
+            self.table.put(key, future.result())
+
+
+def remove_socket(path):
+    """Removes a Unix socket file left at path, leaving any other kind of file alone."""
+    try:
+        if stat.S_ISSOCK(os.stat(path).st_mode):
+            os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+class Session:
+    """One player's connection and current game."""
+
+    def __init__(self, cache, default_engine):
+        self.cache = cache
+        self.default_engine = default_engine
+        self.engine = default_engine
+        self.board = None
+
+    async def new_game(self, first='you', engine=None):
+        if first not in ('you', 'ai'):
+            return ['ERR first player must be you or ai']
+        engine = engine or self.default_engine
+        if engine not in ENGINES:
+            return [f"ERR unknown engine, choose from {' '.join(ENGINES)}"]
+
+        self.engine = engine
+        self.board = [1, 2, 3, 4, 5, 6, 7, 8, 9]
+        # Whoever moves first plays X (10), like play_game
+        self.player, self.ai = (10, -10) if first == 'you' else (-10, 10)
+
+        lines = ['OK']
+        if first == 'ai':
+            try:
+                lines += await self.ai_move()
+            except Exception:
+                self.board = None  # no game until NEW works
+                raise
+        return lines + self.board_lines()
+
+    async def move(self, text):
+        if self.board is None:
+            return ['ERR no game, send NEW first']
+        if game_over(self.board):
+            return ['ERR game is over, send NEW to play again']
+        try:
+            move = int(text)
+            if move < 1 or move > 9 or abs(self.board[move - 1]) == 10:
+                raise ValueError
+        except ValueError:
+            return ['ERR select an empty cell (1-9)']
+
+        self.board[move - 1] = self.player
+        lines = []
+        if not game_over(self.board):
+            try:
+                lines += await self.ai_move()
+            except Exception:
+                self.board[move - 1] = move  # take the move back so it can be sent again
+                raise
+        return [self.status()] + lines + self.board_lines()
+
+    async def ai_move(self):
+        move = await self.cache.find_move(self.engine, self.board, self.ai == 10)
+        if move not in range(9) or abs(self.board[move]) == 10:
+            raise ValueError(f'{self.engine} chose {move!r}, not an open square')
+        self.board[move] = self.ai
+        return [f'AI {move + 1}']
+
+    def status(self):
+        if not game_over(self.board):
+            return 'OK'
+        score = calc_score(self.board)
+        if score == 3 * self.player:
+            return 'OVER you'
+        if score == 3 * self.ai:
+            return 'OVER ai'
+        return 'OVER tie'
+
+    def board_lines(self):
+        return format_board(self.board).split('\n')
+
+    async def handle(self, line):
+        """Returns the reply lines for one command, or None to close the connection."""
+        command, *args = line.split() or ['']
+        command = command.upper()
+        if command == 'NEW':
+            return await self.new_game(*args[:2])
+        if command == 'MOVE' and len(args) == 1:
+            return await self.move(args[0])
+        if command == 'BOARD':
+            if self.board is None:
+                return ['ERR no game, send NEW first']
+            return [self.status()] + self.board_lines()
+        if command == 'QUIT':
+            return None
+        return ['ERR commands are NEW [you|ai] [engine], MOVE <1-9>, BOARD, QUIT']
+
+
+async def serve(host='127.0.0.1', port=8765, unix=None, workers=None, engine='minimax'):
+    pool = ProcessPoolExecutor(max_workers=workers)
+    cache = MoveCache(pool)
+
+    async def client_connected(reader, writer):
+        session = Session(cache, engine)
+        writer.write(b'HELLO tictactoe\n\n')
+        try:
+            while line := await reader.readline():
+                command = line.decode(errors='replace').strip()
+                try:
+                    reply = await session.handle(command)
+                except Exception:
+                    # One game's failure must not drop the connection or the server
+                    logger.exception('%s failed on %r', session.engine, command)
+                    reply = ['ERR the engine failed, try again']
+                if reply is None:
+                    break
+                writer.write(('\n'.join(reply) + '\n\n').encode())
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    # A deep accept queue so thousands of players can connect at once
+    if unix:
+        remove_socket(unix)  # left behind by a server that didn't shut down cleanly
+        server = await asyncio.start_unix_server(client_connected, path=unix, backlog=4096)
+    else:
+        server = await asyncio.start_server(client_connected, host, port, backlog=4096)
+
+    where = unix or f'{host}:{port}'
+    print(f'Serving Tic-Tac-Toe on {where} ({engine}, {workers or os.cpu_count()} workers)')
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        pool.shutdown(cancel_futures=True)
+        if unix:
+            remove_socket(unix)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Serve Tic-Tac-Toe games over a line protocol.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix', help='listen on this Unix socket path instead of TCP')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--engine', default='minimax', choices=sorted(ENGINES))
+    args = parser.parse_args(argv)
+    logging.basicConfig(format='%(asctime)s %(levelname)s %(message)s')
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix, args.workers, args.engine))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,178 @@
+"""
+Solved-game tablebase for Tic-Tac-Toe.
+
+Every position reachable from [1..9] is solved once with find_move and the
+answers are written to a small binary file. find_move_tb then answers with a
+single lookup in the memory-mapped file instead of searching.
+
+File layout:
+    header   MAGIC (4 bytes), VERSION (1 byte), source digest (16 bytes)
+    entries  2 bytes per board index (X to move, then O to move)
+
+A board's index is its base-3 number: square i contributes 3**i times
+0 (open), 1 (X) or 2 (O). Each entry byte packs the best move in the low
+nibble (0-8) and the result with best play in bits 4-5 (0 draw, 1 X wins,
+2 O wins). 0xFF means the position was not solved (unreachable or over).
+"""
+import hashlib
+import mmap
+import warnings
+from copy import copy
+from pathlib import Path
+
+from calc_score import calc_score
+from find_move import find_move
+from game_over import game_over
+from mini_max import mini_max
+
+MAGIC = b'TTTB'
+VERSION = 1
+HEADER_SIZE = len(MAGIC) + 1 + 16
+POSITIONS = 3 ** 9
+EMPTY_ENTRY = 0xFF
+
+DEFAULT_PATH = Path(__file__).parent / 'tablebase.bin'
+
+# The answers are only valid for the rules and search they were built from
+SOURCE_FILES = ('calc_score.py', 'game_over.py', 'mini_max.py', 'find_move.py')
+
+RESULT_BITS = {0: 0, 30: 1, -30: 2}
+
+
+def board_index(board):
+    """Base-3 index of a board (10 for X, -10 for O, anything else is open)."""
+    index = 0
+    for cell in reversed(board):
+        index = index * 3 + (1 if cell == 10 else 2 if cell == -10 else 0)
+    return index
+
+
+def source_digest():
+    """Digest of the rule/search sources, used to detect a stale tablebase file."""
+    digest = hashlib.md5()
+    base_dir = Path(__file__).parent
+    for name in SOURCE_FILES:
+        path = base_dir / name
+        digest.update(path.read_bytes() if path.exists() else name.encode())
+    return digest.digest()
+
+
+def solve_position(board, XsTurn):
+    """
+    Returns (best move, result with best play) for the player to move,
+    where result is 30, -30 or 0 like calc_score.
+    """
+    move = find_move(board, XsTurn)
+    new_board = copy(board)
+    new_board[move] = 10 if XsTurn else -10
+    if game_over(new_board):
+        return move, calc_score(new_board)
+    score = mini_max(new_board, not XsTurn, 0)
+    return move, 30 if score > 0 else -30 if score < 0 else 0
+
+
+def generate(path=DEFAULT_PATH):
+    """
+    Solves every position reachable from [1..9] (either player moving first)
+    and writes the tablebase file. Returns the number of positions solved.
+    """
+    entries = bytearray([EMPTY_ENTRY]) * (POSITIONS * 2)
+    solved = 0
+
+    def walk(board, XsTurn):
+        nonlocal solved
+        if game_over(board):
+            return
+        slot = board_index(board) * 2 + (0 if XsTurn else 1)
+        if entries[slot] != EMPTY_ENTRY:
+            return  # already solved through another move order
+
+        move, result = solve_position(board, XsTurn)
+        entries[slot] = RESULT_BITS[result] << 4 | move
+        solved += 1
+
+        for square in range(9):
+            if board[square] not in (10, -10):
+                new_board = copy(board)
+                new_board[square] = 10 if XsTurn else -10
+                walk(new_board, not XsTurn)
+
+    walk([1, 2, 3, 4, 5, 6, 7, 8, 9], True)
+    walk([1, 2, 3, 4, 5, 6, 7, 8, 9], False)
+
+    with open(path, 'wb') as f:
+        f.write(MAGIC + bytes([VERSION]) + source_digest())
+        f.write(entries)
+    return solved
+
+
+class Tablebase:
+    """
+    Read-only view of a tablebase file through mmap.
+    Raises ValueError if the file is not a tablebase or is stale.
+    """
+
+    def __init__(self, path=DEFAULT_PATH):
+        with open(path, 'rb') as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        header = self.data[:HEADER_SIZE]
+        if (len(self.data) != HEADER_SIZE + POSITIONS * 2
+                or header[:4] != MAGIC or header[4] != VERSION):
+            self.close()
+            raise ValueError(f'{path} is not a version {VERSION} tablebase')
+        if header[5:] != source_digest():
+            self.close()
+            raise ValueError(f'{path} is stale: the rules or search changed since it was built')
+
+    def lookup(self, board, XsTurn):
+        """Returns (best move, result) or None if the position is not in the file."""
+        entry = self.data[HEADER_SIZE + board_index(board) * 2 + (0 if XsTurn else 1)]
+        if entry == EMPTY_ENTRY:
+            return None
+        return entry & 0x0F, (0, 30, -30)[entry >> 4]
+
+    def close(self):
+        self.data.close()
+
+
+# Mapped tablebases by resolved path (None for a path that failed to load)
+_tablebases = {}
+
+
+def load_tablebase(path=DEFAULT_PATH):
+    """
+    Maps the tablebase at path once per process. Returns None (and the
+    caller falls back to searching) when the file is missing or stale, with
+    a warning the first time.
+    """
+    key = Path(path).resolve()
+    if key not in _tablebases:
+        try:
+            _tablebases[key] = Tablebase(key)
+        except (OSError, ValueError) as e:
+            warnings.warn(f'Tablebase unavailable, using live search: {e}',
+                          RuntimeWarning, stacklevel=2)
+            _tablebases[key] = None
+    return _tablebases[key]
+
+
+def find_move_tb(board, XsTurn):
+    """
+    Drop-in replacement for find_move that answers from the tablebase file.
+    - board: current state of the game (list of 9 squares).
+    - XsTurn: True if it's X's turn, False if it's O's turn.
+    Falls back to find_move when the file is missing, stale or lacks the position.
+    """
+    tablebase = load_tablebase()
+    if tablebase is not None:
+        entry = tablebase.lookup(board, XsTurn)
+        if entry is not None:
+            return entry[0]
+    return find_move(board, XsTurn)
+
+
+if __name__ == '__main__':
+    count = generate()
+    print(f'Solved {count} positions into {DEFAULT_PATH} '
+          f'({DEFAULT_PATH.stat().st_size} bytes)')
@@ -0,0 +1,57 @@
+import itertools
+
+import numpy as np
+
+from batch_score import calc_score_batch, game_over_batch
+from calc_score import calc_score
+from game_over import game_over
+
+
+def all_boards(open_value=None):
+    """
+    Every filling of the 9 squares with X, O or open (3^9 boards, reachable or not).
+    Open squares hold open_value, or their number 1-9 if it is None.
+    """
+    return [
+        [10 if cell == 1 else -10 if cell == 2 else square + 1 if open_value is None else open_value
+         for square, cell in enumerate(cells)]
+        for cells in itertools.product(range(3), repeat=9)
+    ]
+
+
+def test_calc_score_batch():
+    for open_value in (None, 0):
+        boards = all_boards(open_value)
+        expected = [calc_score(board) for board in boards]
+        # Boards with two winning lines must report the same line as calc_score
+        assert calc_score_batch(boards).tolist() == expected
+
+
+def test_game_over_batch():
+    for open_value in (None, 0):
+        boards = all_boards(open_value)
+        expected = [game_over(board) for board in boards]
+        assert game_over_batch(boards).tolist() == expected
+        assert game_over_batch(boards, calc_score_batch(boards)).tolist() == expected
+
+
+def test_dtypes_and_shapes():
+    boards = np.array(all_boards(0), dtype=np.int8)
+    scores = calc_score_batch(boards)
+    assert scores.dtype == np.int8 and scores.shape == (len(boards),)
+    assert game_over_batch(boards).dtype == bool
+    assert calc_score_batch(np.zeros((0, 9), dtype=np.int8)).shape == (0,)
+    for bad in ([1, 2, 3], np.zeros((4, 8))):
+        try:
+            calc_score_batch(bad)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f'no ValueError for shape {np.shape(bad)}')
+
+
+if __name__ == "__main__":
+    test_calc_score_batch()
+    test_game_over_batch()
+    test_dtypes_and_shapes()
+    print('calc_score_batch and game_over_batch match calc_score and game_over on all 3^9 boards.')
@@ -0,0 +1,71 @@
+from bitboard import BitBoard, find_move_bb
+from calc_score import calc_score
+from find_move import find_move
+from game_over import game_over
+
+
+def reachable_positions():
+    """Every position reachable from the empty board with X moving first, as (board, XsTurn)."""
+    seen = set()
+    positions = []
+
+    def visit(board, XsTurn):
+        key = tuple(board)
+        if key in seen:
+            return
+        seen.add(key)
+        positions.append((board, XsTurn))
+        if game_over(board):
+            return
+        for square in range(9):
+            if board[square] not in (10, -10):
+                new_board = list(board)
+                new_board[square] = 10 if XsTurn else -10
+                visit(new_board, not XsTurn)
+
+    visit([1, 2, 3, 4, 5, 6, 7, 8, 9], True)
+    return positions
+
+
+def test_round_trip():
+    for board, _ in reachable_positions():
+        assert BitBoard.from_list(board).to_list() == board
+
+
+def test_score_and_game_over():
+    for board, _ in reachable_positions():
+        state = BitBoard.from_list(board)
+        assert state.score() == calc_score(board), board
+        assert state.game_over() == game_over(board), board
+
+
+def test_make_unmake():
+    for board, XsTurn in reachable_positions():
+        if game_over(board):
+            continue
+        state = BitBoard.from_list(board)
+        for square in range(9):
+            if board[square] in (10, -10):
+                continue
+            new_board = list(board)
+            new_board[square] = 10 if XsTurn else -10
+            won = state.make(square, XsTurn)
+            assert won == (calc_score(new_board) != 0), (board, square)
+            assert state.to_list() == [cell if cell in (10, -10) else i + 1
+                                       for i, cell in enumerate(new_board)]
+            state.unmake(square, XsTurn)
+            assert state.to_list() == board
+
+
+def test_same_moves_as_find_move():
+    for board, XsTurn in reachable_positions():
+        if not game_over(board):
+            assert find_move_bb(board, XsTurn) == find_move(board, XsTurn), (board, XsTurn)
+
+
+if __name__ == "__main__":
+    test_round_trip()
+    test_score_and_game_over()
+    test_make_unmake()
+    test_same_moves_as_find_move()
+    print('bitboard matches find_move, calc_score and game_over on every reachable position.')
@@ -1,20 +1,56 @@
+import inspect
+import sys
 from copy import copy
+from functools import lru_cache
 from find_move import find_move
+from engines import get_engine
 from calc_score import calc_score
 from game_over import game_over
+from transposition import shared_table
 
-def play_sequence(board, XsTurn):
-    """Play out the game sequence: X moves freely, O uses AI."""
+def play_sequence(board, XsTurn, table=shared_table, engine=find_move):
+    """Play out the game sequence: X moves freely, O uses AI (any engine from engines.py)."""
     if game_over(board):
         return calc_score(board)
 
+    # The AI breaks ties by square index, so mirrored positions can play out
+    # differently: remember results by the exact board, not the canonical one.
+    key = ('sequence', engine, tuple(cell if cell in (10, -10) else 0 for cell in board), XsTurn)
+    cached = table.get(key) if table is not None else None
+    if cached is not None:
+        return cached
+
+    result = _play_sequence(board, XsTurn, table, engine)
+    if table is not None:
+        table.put(key, result)
+    return result
+
+
+@lru_cache(maxsize=None)
+def _accepts_table(engine):
+    """True if the engine takes a table argument (find_move, find_move_parallel)."""
+    try:
+        return 'table' in inspect.signature(engine).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+def engine_move(engine, board, XsTurn, table=shared_table):
+    """Asks the engine for a move, handing it the table if it takes one."""
+    if _accepts_table(engine):
+        return engine(board, XsTurn, table=table)
+    return engine(board, XsTurn)
+
+
+def _play_sequence(board, XsTurn, table, engine):
+
     if XsTurn:
         results = []
         for square in range(9):
             if board[square] not in (10, -10):
                 new_board = copy(board)
                 new_board[square] = 10
-                results.append(play_sequence(new_board, False))
+                results.append(play_sequence(new_board, False, table, engine))
         # If X can ever force a win, return that
         if 30 in results: return 30
         # If not, but draws exist, return 0
@@ -23,19 +59,19 @@ def play_sequence(board, XsTurn):
         return -30
     else:
         # O moves optimally using minimax
-        move = find_move(board, False)
+        move = engine_move(engine, board, False, table)
         if move is None:
             return calc_score(board)
         new_board = copy(board)
         new_board[move] = -10
-        return play_sequence(new_board, True)
+        return play_sequence(new_board, True, table, engine)
 
 
-def exhaustive_test():
+def exhaustive_test(engine=find_move):
     board = [i for i in range(9)]  # empty board
     
     # Case 1: X goes first
-    result = play_sequence(board, True)
+    result = play_sequence(board, True, engine=engine)
     if result == 30:
         print("BUG: X can beat the AI (X first)")
     elif result == -30:
@@ -44,10 +80,10 @@ def exhaustive_test():
         print("X first: always a draw with perfect play.")
 
     # Case 2: O goes first
-    move = find_move(board, False)  # AI makes the opening move
+    move = engine(board, False)  # AI makes the opening move
     new_board = copy(board)
     new_board[move] = -10
-    result = play_sequence(new_board, True)
+    result = play_sequence(new_board, True, engine=engine)
     if result == 30:
         print("BUG: X can beat the AI (O first)")
     elif result == -30:
@@ -55,6 +91,8 @@ def exhaustive_test():
     else:
         print("O first: always a draw with perfect play.")
 
+    print(f"Transposition table: {shared_table.stats()}")
+
 
 if __name__ == "__main__":
-    exhaustive_test()
+    exhaustive_test(get_engine(sys.argv[1]) if len(sys.argv) > 1 else find_move)
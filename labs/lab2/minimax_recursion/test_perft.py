@@ -0,0 +1,50 @@
+from perft import (KNOWN_GAMES, KNOWN_POSITIONS, KNOWN_RESULTS, KNOWN_TERMINAL_POSITIONS,
+                   REPRESENTATIONS, check, perft)
+
+EMPTY = [1, 2, 3, 4, 5, 6, 7, 8, 9]
+X, O = 10, -10
+
+# Mid-game positions with the side to move
+MIDGAME = [
+    ([X, 2, 3, 4, O, 6, 7, 8, 9], True),
+    ([X, O, X, 4, O, 6, 7, 8, 9], False),
+    ([X, 2, O, 4, X, 6, O, 8, 9], True),
+]
+
+
+def test_known_totals():
+    for name in REPRESENTATIONS:
+        result = perft(EMPTY, True, 9, name)
+        assert check(result, 9) == [], (name, check(result, 9))
+        assert result.positions == list(KNOWN_POSITIONS)
+        assert result.games == list(KNOWN_GAMES)
+        assert result.results == KNOWN_RESULTS
+        assert result.terminal_positions == KNOWN_TERMINAL_POSITIONS
+        assert sum(result.games) == 255168
+
+
+def test_shallow_depths():
+    # A shallower search stops early but still counts the same positions per ply
+    for depth in (1, 4, 6):
+        assert check(perft(EMPTY, True, depth, 'bitboard'), depth) == [], depth
+
+
+def test_representations_agree_midgame():
+    for board, XsTurn in MIDGAME:
+        expected = perft(board, XsTurn, 9, 'list')
+        for name in REPRESENTATIONS:
+            assert perft(board, XsTurn, 9, name) == expected, (name, board)
+
+
+def test_check_reports_differences():
+    result = perft(EMPTY, True, 9, 'list')
+    wrong = result._replace(positions=result.positions[:-1] + [result.positions[-1] + 1])
+    assert check(wrong, 9)
+
+
+if __name__ == "__main__":
+    test_known_totals()
+    test_shallow_depths()
+    test_representations_agree_midgame()
+    test_check_reports_differences()
+    print(f'Every representation matches the known perft totals: {", ".join(REPRESENTATIONS)}.')
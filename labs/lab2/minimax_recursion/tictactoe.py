@@ -5,4 +5,4 @@ sys.path.insert(1, './default_code')   # Fallback default
 
 from play_game import play_game
 
-play_game()
+play_game(sys.argv[1] if len(sys.argv) > 1 else 'minimax')
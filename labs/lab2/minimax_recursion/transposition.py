@@ -0,0 +1,82 @@
+from collections import OrderedDict
+
+
+# The 8 symmetries of the 3x3 grid, written as "new square i takes old square p[i]".
+#   0 1 2
+#   3 4 5
+#   6 7 8
+SYMMETRIES = (
+    (0, 1, 2, 3, 4, 5, 6, 7, 8),  # identity
+    (6, 3, 0, 7, 4, 1, 8, 5, 2),  # rotate 90
+    (8, 7, 6, 5, 4, 3, 2, 1, 0),  # rotate 180
+    (2, 5, 8, 1, 4, 7, 0, 3, 6),  # rotate 270
+    (2, 1, 0, 5, 4, 3, 8, 7, 6),  # mirror left/right
+    (6, 7, 8, 3, 4, 5, 0, 1, 2),  # mirror top/bottom
+    (0, 3, 6, 1, 4, 7, 2, 5, 8),  # mirror main diagonal
+    (8, 5, 2, 7, 4, 1, 6, 3, 0),  # mirror anti diagonal
+)
+
+
+def canonical_key(board):
+    """
+    Returns a key that is the same for a board and all its rotations/reflections.
+    - board: list of 9 squares (10 for X, -10 for O, anything else is open).
+    Open squares are folded to 0, so boards numbered 1-9 and 0-8 share keys.
+    """
+    cells = tuple(1 if cell == 10 else -1 if cell == -10 else 0 for cell in board)
+    return min(tuple(cells[p] for p in perm) for perm in SYMMETRIES)
+
+
+class TranspositionTable:
+    """
+    Bounded cache of search results, evicting the least recently used entry
+    once it holds `max_size` positions. Counts hits and misses so callers
+    can see how much work the cache is saving.
+    """
+
+    def __init__(self, max_size=20000):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Returns the stored value for key, or None if it is not cached."""
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        """Stores value under key, evicting the oldest entry if the table is full."""
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        """Empties the table and resets the counters."""
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        """Returns the hit/miss counters and current size as a dict."""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'size': len(self.entries),
+            'max_size': self.max_size,
+        }
+
+    def __len__(self):
+        return len(self.entries)
+
+
+# One table shared by find_move, mini_max and test_minimax.
+shared_table = TranspositionTable()
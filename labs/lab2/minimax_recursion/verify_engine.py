@@ -0,0 +1,209 @@
+"""
+Parallel exhaustive verifier for the AI engines.
+
+Like test_minimax.exhaustive_test, X tries every possible move and the AI
+plays O. The X moves out of the starting position are fanned out across a
+process pool, positions already checked are skipped, and the run ends with
+a JSON report:
+
+    python verify_engine.py --engine alphabeta --workers 4 --report report.json
+
+The exit code is 1 if X ever beats the AI.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from copy import copy
+
+from calc_score import calc_score
+from engines import ENGINES, get_engine
+from game_over import game_over
+from gamelog import GameLog, outcome_from_score
+from transposition import SYMMETRIES
+
+
+def position_key(board, XsTurn):
+    """Key of a position exactly as it stands (open squares folded to 0)."""
+    return tuple(1 if cell == 10 else -1 if cell == -10 else 0 for cell in board), XsTurn
+
+
+def canonical_form(board):
+    """
+    Returns (canonical key, symmetries that give it), like
+    transposition.canonical_key but keeping the symmetries so a move can be
+    mapped into the canonical board: square m becomes perm.index(m).
+    """
+    cells = tuple(1 if cell == 10 else -1 if cell == -10 else 0 for cell in board)
+    forms = [(tuple(cells[p] for p in perm), perm) for perm in SYMMETRIES]
+    key = min(form for form, _ in forms)
+    return key, [perm for form, perm in forms if form == key]
+
+
+def verify_branch(engine_name, board, XsTurn, moves, dedupe):
+    """
+    Checks every game from one position, with X moving freely and the AI as O.
+    Runs in a worker process. Returns the best result X can force, the keys of
+    the positions visited, the move sequences of every AI loss found and every
+    game played out to the end as (moves, score).
+    """
+    engine = get_engine(engine_name)
+    results = {}
+    mirrored = {}  # canonical AI-to-move position -> (canonical reply, result)
+    losses = []
+    games = []
+
+    def explore(board, XsTurn, moves):
+        if game_over(board):
+            score = calc_score(board)
+            if score == 30:
+                losses.append(moves)
+            games.append((moves, score))
+            return score
+
+        key = position_key(board, XsTurn)
+        if key in results:
+            return results[key]
+
+        if XsTurn:
+            outcomes = []
+            for square in range(9):
+                if board[square] not in (10, -10):
+                    new_board = copy(board)
+                    new_board[square] = 10
+                    outcomes.append(explore(new_board, False, moves + [square]))
+            result = max(outcomes)  # X takes a win if it can, else a draw
+        else:
+            move = engine(board, False)
+            if dedupe == 'canonical':
+                # The AI breaks ties by square index, so a mirrored position
+                # only shares its result if the AI's reply is the mirrored reply
+                canonical, perms = canonical_form(board)
+                replies = {perm.index(move) for perm in perms}
+                seen = mirrored.get(canonical)
+                if seen is not None and seen[0] in replies:
+                    results[key] = seen[1]
+                    return seen[1]
+            new_board = copy(board)
+            new_board[move] = -10
+            result = explore(new_board, True, moves + [move])
+            if dedupe == 'canonical' and canonical not in mirrored:
+                mirrored[canonical] = (perms[0].index(move), result)
+
+        results[key] = result
+        return result
+
+    result = explore(board, XsTurn, moves)
+    return result, list(results), losses, games
+
+
+def verify_phase(pool, engine_name, board, moves, dedupe, log=None, x_first=True):
+    """
+    Fans the X moves out of board across the pool and merges what comes back.
+    Every game played out is appended to log (a GameLog), if given.
+    """
+    start = time.perf_counter()
+
+    # Every first move is checked, even symmetric ones: the AI may answer
+    # mirrored openings differently
+    branches = []
+    for square in range(9):
+        if board[square] not in (10, -10):
+            new_board = copy(board)
+            new_board[square] = 10
+            branches.append((new_board, moves + [square]))
+
+    futures = [
+        pool.submit(verify_branch, engine_name, new_board, False, branch_moves, dedupe)
+        for new_board, branch_moves in branches
+    ]
+
+    visited = set()
+    losses = []
+    result = -30
+    for future in futures:
+        branch_result, keys, branch_losses, games = future.result()
+        result = max(result, branch_result)
+        visited.update(keys)
+        losses.extend(branch_losses)
+        if log is not None:
+            for game_moves, score in games:
+                log.append(game_moves, x_first, outcome_from_score(score))
+
+    return {
+        'result': result,
+        'branches': len(branches),
+        'positions_visited': len(visited),
+        'ai_losses': losses,
+        'wall_time': time.perf_counter() - start,
+    }, visited
+
+
+def verify_engine(engine_name='minimax', workers=None, dedupe='exact', log_path=None):
+    """
+    Verifies that X can never beat the AI, whether X or the AI moves first.
+    - engine_name: name of an engine in engines.ENGINES.
+    - workers: process pool size (None for one per CPU).
+    - dedupe: 'exact' checks every orientation of every position (the AI
+      breaks ties by square index). 'canonical' reuses a mirrored position's
+      result when the AI's reply there is the mirror of its reply here; the
+      replies further down the mirrored line are not asked again, so only
+      'exact' is a complete check.
+    - log_path: game log to append every game played out to (None for no log).
+    Returns the report as a dict.
+    """
+    start = time.perf_counter()
+    board = [i for i in range(9)]  # empty board
+    log = GameLog(log_path) if log_path is not None else None
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        x_first, x_visited = verify_phase(pool, engine_name, board, [], dedupe, log)
+
+        opening_start = time.perf_counter()
+        opening = get_engine(engine_name)(board, False)  # AI makes the opening move
+        opening_time = time.perf_counter() - opening_start
+        new_board = copy(board)
+        new_board[opening] = -10
+        o_first, o_visited = verify_phase(
+            pool, engine_name, new_board, [opening], dedupe, log, x_first=False)
+        o_first['wall_time'] += opening_time
+
+    if log is not None:
+        log.close()
+
+    losses = x_first['ai_losses'] + o_first['ai_losses']
+    return {
+        'engine': engine_name,
+        'dedupe': dedupe,
+        'workers': workers or os.cpu_count(),
+        'phases': {'x_first': x_first, 'o_first': o_first},
+        'positions_visited': len(x_visited | o_visited),
+        'ai_loss_count': len(losses),
+        'passed': not losses,
+        'wall_time': time.perf_counter() - start,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Exhaustively verify a Tic-Tac-Toe engine.')
+    parser.add_argument('--engine', default='minimax', choices=sorted(ENGINES))
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--dedupe', default='exact', choices=('exact', 'canonical'))
+    parser.add_argument('--report', help='write the JSON report to this file instead of stdout')
+    parser.add_argument('--log', help='append every game played out to this game log')
+    args = parser.parse_args(argv)
+
+    report = verify_engine(args.engine, args.workers, args.dedupe, args.log)
+    text = json.dumps(report, indent=2)
+    if args.report:
+        with open(args.report, 'w') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+    return 0 if report['passed'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -27,33 +27,19 @@ Imported Functions:
 import sys
 import time
 from utils import clear_screen
-import importlib.util
 from pathlib import Path
 
+from code_loader import import_module as load_module, import_times, report_import_times  # noqa: F401
+
+BASE_DIR = Path(__file__).parent.resolve()
+
 
 def import_module(name):
     """
     Imports a module from student_code/*.py if it exists,
-    otherwise loads default_code/*.pyc directly.
+    otherwise loads default_code/*.pyc directly (see ../code_loader.py).
     """
-    base_dir = Path(__file__).parent.resolve()
-    student_py = base_dir / f"{name}.py"
-    default_pyc = base_dir.parent / "default_code" / f"{name}.pyc"
-
-    if student_py.exists():
-        spec = importlib.util.spec_from_file_location(name, student_py)
-    elif default_pyc.exists():
-        spec = importlib.util.spec_from_file_location(name, default_pyc)
-    else:
-        raise ImportError(
-            f"Module '{name}' not found in student_code or default_code.")
-
-    module = importlib.util.module_from_spec(spec)
-
-    import sys
-    sys.modules[name] = module
-    spec.loader.exec_module(module)
-    return module
+    return load_module(name, BASE_DIR)
 
 
 print_board = import_module("display_board").print_board
@@ -61,8 +47,9 @@ game_over = import_module("game_over").game_over
 calc_score = import_module("calc_score").calc_score
 player_move = import_module("player_move").player_move
 ai_move = import_module("ai_move").ai_move
-find_move = import_module("find_move").find_move
-mini_max = import_module("find_move").mini_max
+find_move_module = import_module("find_move")
+find_move = find_move_module.find_move
+mini_max = find_move_module.mini_max
 clear_screen = import_module("utils").clear_screen
 
 
@@ -6,13 +6,16 @@ base_dir = Path(__file__).parent.resolve()
 student_code = base_dir
 default_code = base_dir.parent / 'default_code'
 
-# Add both to sys.path (student_code first)
+# Add both to sys.path (student_code first), then the lab for code_loader
 sys.path.insert(0, str(student_code))
 sys.path.insert(1, str(default_code))
+sys.path.insert(2, str(base_dir.parent))
 
 # Import and run
 
 
-from play_game import play_game
+from play_game import play_game, report_import_times
+if '--import-times' in sys.argv:
+    report_import_times()
 play_game()
 
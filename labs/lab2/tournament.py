@@ -0,0 +1,268 @@
+"""
+Headless self-play tournament between Tic-Tac-Toe engines.
+
+Plays N games for every pairing of engines across a process pool, with a few
+random opening moves so games differ, and no clear_screen, print_board or
+sleep. Reports win/draw/loss tables, mean decision latency per engine and
+games per second, and can record every game for replay.
+
+Engines are the names in minimax_recursion/engines.py (minimax, alphabeta, ...)
+or DIR:FUNCTION for code loaded like student_code/play_game.py does, e.g.
+teacher:ai_move or student:find_move.
+
+    python tournament.py --engines minimax alphabeta teacher:ai_move --games 200
+    python tournament.py --engines minimax teacher:ai_move --record games.txt
+    python tournament.py --engines minimax teacher:ai_move --log games.tttlog
+    python tournament.py --replay games.txt 17
+
+Text records (--record) are one line per game: "<X engine> <O engine> <squares>
+<result>", where squares are the moves in order as digits 0-8 (X always moves
+first) and result is X, O or tie; a player whose engine makes an illegal move
+forfeits. --log appends the games to a binary game log instead (see
+minimax_recursion/gamelog.py), where a forfeit is logged as unfinished; both
+can be replayed.
+"""
+import argparse
+import inspect
+import itertools
+import random
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+LAB_DIR = Path(__file__).parent.resolve()
+sys.path.insert(0, str(LAB_DIR / 'minimax_recursion'))
+
+from calc_score import calc_score  # noqa: E402
+from code_loader import load_function, target_path  # noqa: E402
+from engines import ENGINES  # noqa: E402
+from game_over import game_over  # noqa: E402
+from gamelog import (MAGIC, OUTCOME_NAMES, UNFINISHED, GameLog, outcome_from_score,  # noqa: E402
+                     read_games)
+
+CODE_DIRS = {'teacher': 'teacher_code', 'student': 'student_code', 'minimax': 'minimax_recursion'}
+
+_loaded = {}
+
+
+def load_engine(spec):
+    """
+    Returns a move function taking (board, XsTurn) for an engine spec.
+    Functions that only take the board (like ai_move) are wrapped.
+    """
+    if spec in _loaded:
+        return _loaded[spec]
+
+    if ':' in spec:
+        prefix, function_name = spec.split(':', 1)
+        if prefix not in CODE_DIRS:
+            raise ValueError(f"Unknown code directory '{prefix}' in '{spec}'")
+        base_dir = LAB_DIR / CODE_DIRS[prefix]
+        with target_path(base_dir):
+            function = load_function(base_dir, function_name, function_name)
+        if function is None:
+            raise ValueError(f"'{spec}': no {function_name}() in {base_dir.name} or default_code")
+    elif spec in ENGINES:
+        function = ENGINES[spec]
+    else:
+        raise ValueError(f"Unknown engine '{spec}'. Choose from {', '.join(ENGINES)} or DIR:FUNCTION")
+
+    if len(inspect.signature(function).parameters) == 1:
+        board_only = function
+
+        def function(board, XsTurn):
+            return board_only(board)
+
+    _loaded[spec] = function
+    return function
+
+
+def play_one(x_move, o_move, rng, random_plies):
+    """
+    Plays one game. X moves first. The first random_plies moves are random.
+    Returns (moves, result, X decision times, O decision times).
+    """
+    board = [1, 2, 3, 4, 5, 6, 7, 8, 9]
+    moves = []
+    times = {True: [], False: []}
+    XsTurn = True
+
+    while not game_over(board):
+        if len(moves) < random_plies:
+            move = rng.choice([sq for sq in range(9) if board[sq] not in (10, -10)])
+        else:
+            start = time.perf_counter()
+            move = (x_move if XsTurn else o_move)(board, XsTurn)
+            times[XsTurn].append(time.perf_counter() - start)
+            if move is None or not 0 <= move <= 8 or board[move] in (10, -10):
+                # An illegal move forfeits the game
+                return moves, 'O' if XsTurn else 'X', times[True], times[False]
+
+        board[move] = 10 if XsTurn else -10
+        moves.append(move)
+        XsTurn = not XsTurn
+
+    score = calc_score(board)
+    return moves, 'X' if score == 30 else 'O' if score == -30 else 'tie', times[True], times[False]
+
+
+def play_match(x_spec, o_spec, games, seed, random_plies):
+    """Plays a batch of games in a worker process."""
+    x_move, o_move = load_engine(x_spec), load_engine(o_spec)
+    rng = random.Random(seed)
+    records, x_times, o_times = [], [], []
+    for _ in range(games):
+        moves, result, xt, ot = play_one(x_move, o_move, rng, random_plies)
+        records.append((x_spec, o_spec, ''.join(map(str, moves)), result))
+        x_times += xt
+        o_times += ot
+    return records, (x_spec, sum(x_times), len(x_times)), (o_spec, sum(o_times), len(o_times))
+
+
+def run_tournament(specs, games, random_plies=2, seed=0, workers=None, chunk=50):
+    """
+    Plays `games` games for every pair of engines, half with each as X.
+    Returns (records, per-engine latency totals, wall time).
+    """
+    for spec in specs:
+        load_engine(spec)  # fail early on a bad name
+
+    tasks = []
+    for a, b in itertools.combinations(specs, 2):
+        for x_spec, o_spec, count in ((a, b, (games + 1) // 2), (b, a, games // 2)):
+            for start in range(0, count, chunk):
+                tasks.append((x_spec, o_spec, min(chunk, count - start), seed + len(tasks)))
+
+    start = time.perf_counter()
+    records = []
+    latency = defaultdict(lambda: [0.0, 0])
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(play_match, *task, random_plies) for task in tasks]
+        for future in futures:
+            batch, *engine_times = future.result()
+            records += batch
+            for spec, total, count in engine_times:
+                latency[spec][0] += total
+                latency[spec][1] += count
+    return records, latency, time.perf_counter() - start
+
+
+def print_report(specs, records, latency, elapsed):
+    table = defaultdict(lambda: [0, 0, 0])  # (engine, opponent) -> wins, draws, losses
+    for x_spec, o_spec, _, result in records:
+        if result == 'tie':
+            table[x_spec, o_spec][1] += 1
+            table[o_spec, x_spec][1] += 1
+        else:
+            winner, loser = (x_spec, o_spec) if result == 'X' else (o_spec, x_spec)
+            table[winner, loser][0] += 1
+            table[loser, winner][2] += 1
+
+    width = max(len(spec) for spec in specs) + 2
+    print('W/D/L (row engine against column engine)')
+    print(' ' * width + ''.join(f'{spec:>{width + 4}}' for spec in specs))
+    for row in specs:
+        cells = ''.join(
+            f"{'-' if row == col else '/'.join(map(str, table[row, col])):>{width + 4}}"
+            for col in specs)
+        print(f'{row:<{width}}{cells}')
+
+    print('\nMean decision latency')
+    for spec in specs:
+        total, count = latency[spec]
+        print(f'  {spec:<{width}} {total / count * 1000 if count else 0:10.3f} ms  ({count} moves)')
+    print(f'\n{len(records)} games in {elapsed:.2f}s ({len(records) / elapsed:,.0f} games/s)')
+
+
+def log_outcome(moves):
+    """
+    The game log outcome of a tournament game (X moves first). A game that
+    stopped before it was over, at an illegal move, is UNFINISHED: the forfeit
+    is not a win on the board.
+    """
+    board = [1, 2, 3, 4, 5, 6, 7, 8, 9]
+    for turn, square in enumerate(moves):
+        board[square] = 10 if turn % 2 == 0 else -10
+    if not game_over(board):
+        return UNFINISHED
+    return outcome_from_score(calc_score(board))
+
+
+def read_records(path):
+    """
+    Yields (X engine, O engine, moves, x_first, result) from a text record
+    file (X always first) or a game log.
+    """
+    with open(path, 'rb') as f:
+        is_log = f.read(len(MAGIC)) == MAGIC
+    if is_log:
+        for game in read_games(path):
+            yield '?', '?', list(game.moves), game.x_first, OUTCOME_NAMES[game.outcome]
+        return
+    with open(path) as f:
+        for line in f:
+            x_spec, o_spec, moves, result = line.split()
+            yield x_spec, o_spec, [int(square) for square in moves], True, result
+
+
+def replay(moves, x_first=True, delay=1.0):
+    """Shows a recorded game move by move with print_board."""
+    from display_board import print_board
+    board = [1, 2, 3, 4, 5, 6, 7, 8, 9]
+    print_board(board)
+    XsTurn = x_first
+    for square in moves:
+        time.sleep(delay)
+        board[square] = 10 if XsTurn else -10
+        XsTurn = not XsTurn
+        print_board(board)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Self-play tournament between engines.')
+    parser.add_argument('--engines', nargs='+', default=['minimax', 'alphabeta', 'teacher:ai_move'])
+    parser.add_argument('--games', type=int, default=100, help='games per pairing')
+    parser.add_argument('--random-plies', type=int, default=2, help='random opening moves per game')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--record', type=Path, help='write every game to this text file')
+    parser.add_argument('--log', type=Path, help='append every game to this binary game log')
+    parser.add_argument('--replay', nargs=2, metavar=('FILE', 'GAME'),
+                        help='replay game number GAME (from 0) of a record file')
+    args = parser.parse_args(argv)
+
+    if args.replay:
+        path, number = args.replay
+        x_spec, o_spec, moves, x_first, result = next(
+            itertools.islice(read_records(path), int(number), None))
+        replay(moves, x_first)
+        print(f'X: {x_spec}  O: {o_spec}  result: {result}')
+        return 0
+
+    if len(args.engines) < 2:
+        parser.error('a tournament needs at least two engines')
+    try:
+        records, latency, elapsed = run_tournament(
+            args.engines, args.games, args.random_plies, args.seed, args.workers)
+    except ValueError as e:
+        parser.error(str(e))
+    print_report(args.engines, records, latency, elapsed)
+
+    if args.record:
+        with open(args.record, 'w') as f:
+            for record in records:
+                f.write(' '.join(record) + '\n')
+        print(f'Games recorded to {args.record}')
+    if args.log:
+        with GameLog(args.log) as log:
+            for _, _, moves, _ in records:
+                moves = [int(square) for square in moves]
+                log.append(moves, x_first=True, outcome=log_outcome(moves))
+        print(f'Games logged to {args.log}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
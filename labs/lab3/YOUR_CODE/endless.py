@@ -0,0 +1,341 @@
+"""
+Endless minesweeper: a world with no edges, split into square chunks.
+
+initialize_board allocates the whole ROWS x COLS grid up front. Here a
+chunk is only made when a move first touches it, and its mines come from
+(world seed, chunk row, chunk col) alone, so every chunk is the same each
+time it is made, whatever order the world is explored in.
+
+- Counts across chunk borders: a chunk's counts are computed from its own
+  mines padded with the bordering rows and columns of its eight neighbours,
+  whose mine layouts are regenerated from their seeds (the neighbours are
+  not loaded for that).
+- Revealing: each chunk labels its blank regions (label_zero_regions) the
+  first time one is clicked. A click opens the region inside the chunk; blank
+  cells it opens on the chunk's edge pass their neighbours in the next chunks
+  on as new clicks, which load those chunks only then.
+- Memory: at most max_chunks chunks are held, least recently used first
+  out. A chunk that has been played on (revealed or flagged cells) is packed
+  into the store when it leaves and restored when it comes back; one that
+  hasn't is just dropped and regenerated. The store also keeps the world's
+  seed, density and chunk size, and a world with other settings refuses it,
+  since its chunks would not line up with the ones it generates.
+
+Coordinates are world (row, col) integers and may be negative. The cells
+around (0, 0) never hold a mine, so the first click there always opens.
+
+    world = EndlessWorld(seed=7, store='saves/world7')
+    world.update_board(0, 0)
+    world.flush()
+"""
+import os
+import struct
+from collections import OrderedDict
+
+import numpy as np
+
+from mine_board import label_zero_regions, neighbor_counts, place_mines, symbol_rows
+
+CHUNK_SIZE = 32
+DEFAULT_DENSITY = 0.16
+DEFAULT_MAX_CHUNKS = 1024
+# Below about 0.1 the blank cells percolate: one click would open an
+# endless region
+MIN_DENSITY = 0.12
+
+# The world settings a store was made for, under SETTINGS_KEY:
+# magic, seed, density, chunk size
+SETTINGS = struct.Struct('<4sQdI')
+SETTINGS_MAGIC = b'MSWE'
+SETTINGS_KEY = 'settings'
+
+
+def _zigzag(n: int) -> int:
+    """Maps ..., -2, -1, 0, 1, 2, ... to 3, 1, 0, 2, 4, ... (seeds must be non-negative)."""
+    return 2 * n if n >= 0 else -2 * n - 1
+
+
+class Chunk:
+    """One chunk's arrays. dirty is True when it has changes the store doesn't have yet."""
+
+    __slots__ = ('mines', 'counts', 'revealed', 'flagged', 'dirty', 'regions')
+
+    def __init__(self, mines, counts):
+        self.mines = mines
+        self.counts = counts
+        self.revealed = np.zeros(mines.shape, dtype=bool)
+        self.flagged = np.zeros(mines.shape, dtype=bool)
+        self.dirty = False
+        self.regions = None  # (labels, region_start, region_cells), made on the first reveal
+
+    def zero_regions(self):
+        if self.regions is None:
+            self.regions = label_zero_regions(self.mines, self.counts)
+        return self.regions
+
+    def played(self) -> bool:
+        return bool(self.revealed.any() or self.flagged.any())
+
+    def pack(self) -> bytes:
+        """The revealed and flagged cells, one bit each."""
+        return np.packbits(np.stack([self.revealed, self.flagged])).tobytes()
+
+    def unpack(self, data: bytes):
+        size = self.mines.shape[0]
+        bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8), count=2 * size * size)
+        self.revealed, self.flagged = bits.reshape(2, size, size).astype(bool)
+
+
+class DirectoryStore:
+    """
+    Keeps packed chunks as files in a directory, one per chunk.
+    Works like the dict used when no store is given: store.get(key) and
+    store[key] = data, with key = (chunk row, chunk col) or SETTINGS_KEY.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+
+    def file(self, key) -> str:
+        if key == SETTINGS_KEY:
+            return os.path.join(self.path, 'world.settings')
+        return os.path.join(self.path, f'{key[0]}_{key[1]}.chunk')
+
+    def get(self, key, default=None):
+        try:
+            with open(self.file(key), 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return default
+
+    def __setitem__(self, key, data: bytes):
+        # Write then rename, so a crash never leaves half a chunk
+        path = self.file(key)
+        with open(path + '.tmp', 'wb') as f:
+            f.write(data)
+        os.replace(path + '.tmp', path)
+
+
+class EndlessWorld:
+    """
+    An endless minesweeper world.
+    - seed: world seed (non-negative integer).
+    - density: share of each chunk's cells that are mines (MIN_DENSITY to 1).
+    - chunk_size: cells along a chunk's side.
+    - max_chunks: chunks held in memory at most.
+    - store: where played chunks go when they leave memory: a directory
+      path, an object with get() and item assignment, or None for a dict.
+      A store belongs to one (seed, density, chunk_size) world: those are
+      saved in it, and a store saved with others raises ValueError.
+    """
+
+    def __init__(self, seed=0, density=DEFAULT_DENSITY, chunk_size=CHUNK_SIZE,
+                 max_chunks=DEFAULT_MAX_CHUNKS, store=None):
+        if not MIN_DENSITY <= density < 1:
+            raise ValueError(f'density must be between {MIN_DENSITY} and 1')
+        if max_chunks < 1:
+            raise ValueError('max_chunks must be at least 1')
+        self.seed = seed
+        self.density = density
+        self.size = chunk_size
+        self.mines_per_chunk = max(1, round(density * chunk_size * chunk_size))
+        self.max_chunks = max_chunks
+        if store is None:
+            store = {}
+        elif isinstance(store, (str, os.PathLike)):
+            store = DirectoryStore(store)
+        self.store = store
+        self.check_store()
+        self.chunks = OrderedDict()   # (chunk row, chunk col) -> Chunk, least recently used first
+        self.mines_shown = False
+        self.generated = 0
+        self.restored = 0
+        self.evicted = 0
+
+    def check_store(self):
+        """
+        Saves the world settings in a store that has none yet; raises
+        ValueError if the store holds another world's.
+        """
+        settings = SETTINGS.pack(SETTINGS_MAGIC, self.seed, self.density, self.size)
+        saved = self.store.get(SETTINGS_KEY)
+        if saved is None:
+            self.store[SETTINGS_KEY] = settings
+            return
+        if len(saved) != SETTINGS.size or saved[:len(SETTINGS_MAGIC)] != SETTINGS_MAGIC:
+            raise ValueError('the store does not hold an endless world')
+        if saved != settings:
+            _, seed, saved_density, size = SETTINGS.unpack(saved)
+            raise ValueError(
+                f'the store holds a world with seed {seed}, density {saved_density} and chunk '
+                f'size {size}, not seed {self.seed}, density {self.density} and chunk size {self.size}')
+
+    def chunk_mines(self, chunk_row: int, chunk_col: int):
+        """The mine layout of a chunk, from the seeds alone."""
+        chunk = self.chunks.get((chunk_row, chunk_col))
+        if chunk is not None:
+            return chunk.mines
+        size = self.size
+        sequence = np.random.SeedSequence([self.seed, _zigzag(chunk_row), _zigzag(chunk_col)])
+        mines = place_mines(size, size, self.mines_per_chunk, sequence)
+        # Clear the cells around the world origin
+        top, left = chunk_row * size, chunk_col * size
+        mines[max(-1, top) - top:max(0, min(2, top + size) - top),
+              max(-1, left) - left:max(0, min(2, left + size) - left)] = False
+        return mines
+
+    def chunk_counts(self, chunk_row: int, chunk_col: int, mines):
+        """A chunk's neighbour counts, including the mines across its borders."""
+        size = self.size
+        padded = np.zeros((size + 2, size + 2), dtype=bool)
+        padded[1:-1, 1:-1] = mines
+        # The side of each neighbour that touches this chunk
+        edge = {-1: (slice(-1, None), slice(0, 1)), 0: (slice(None), slice(1, -1)),
+                1: (slice(0, 1), slice(-1, None))}
+        for dr in (-1, 0, 1):
+            for dc in (-1, 0, 1):
+                if (dr, dc) != (0, 0):
+                    source_rows, target_rows = edge[dr]
+                    source_cols, target_cols = edge[dc]
+                    padded[target_rows, target_cols] = self.chunk_mines(
+                        chunk_row + dr, chunk_col + dc)[source_rows, source_cols]
+        return neighbor_counts(padded)[1:-1, 1:-1]
+
+    def load(self, chunk_row: int, chunk_col: int) -> Chunk:
+        """The chunk, made or restored if it isn't in memory, and marked as just used."""
+        key = (chunk_row, chunk_col)
+        chunk = self.chunks.get(key)
+        if chunk is not None:
+            self.chunks.move_to_end(key)
+            return chunk
+
+        mines = self.chunk_mines(chunk_row, chunk_col)
+        chunk = Chunk(mines, self.chunk_counts(chunk_row, chunk_col, mines))
+        saved = self.store.get(key)
+        if saved is not None:
+            chunk.unpack(saved)
+            self.restored += 1
+        else:
+            self.generated += 1
+        self.chunks[key] = chunk
+        self.evict()
+        return chunk
+
+    def evict(self):
+        """Drops the least recently used chunks over max_chunks, storing the played ones."""
+        while len(self.chunks) > self.max_chunks:
+            key, chunk = self.chunks.popitem(last=False)
+            if chunk.dirty:
+                self.store[key] = chunk.pack()
+            self.evicted += 1
+
+    def flush(self):
+        """Stores every chunk in memory that has unstored changes."""
+        for key, chunk in self.chunks.items():
+            if chunk.dirty:
+                self.store[key] = chunk.pack()
+                chunk.dirty = False
+
+    def locate(self, row: int, col: int):
+        """(chunk, row in chunk, col in chunk) of a world cell."""
+        chunk_row, r = divmod(row, self.size)
+        chunk_col, c = divmod(col, self.size)
+        return self.load(chunk_row, chunk_col), r, c
+
+    def is_mine_at(self, row: int, col: int) -> bool:
+        chunk, r, c = self.locate(row, col)
+        return bool(chunk.mines[r, c])
+
+    def is_revealed(self, row: int, col: int) -> bool:
+        chunk, r, c = self.locate(row, col)
+        return bool(chunk.revealed[r, c])
+
+    def is_flagged(self, row: int, col: int) -> bool:
+        chunk, r, c = self.locate(row, col)
+        return bool(chunk.flagged[r, c])
+
+    def count_at(self, row: int, col: int) -> int:
+        """Number of mines next to the cell."""
+        chunk, r, c = self.locate(row, col)
+        return int(chunk.counts[r, c])
+
+    def toggle_flag(self, row: int, col: int) -> bool:
+        """Puts a flag on a hidden cell or takes it off. Returns True if the cell is now flagged."""
+        chunk, r, c = self.locate(row, col)
+        if chunk.revealed[r, c]:
+            return False
+        chunk.flagged[r, c] = not chunk.flagged[r, c]
+        chunk.dirty = True
+        return bool(chunk.flagged[r, c])
+
+    def reveal_all_mines(self):
+        """Show the mines in every window drawn from now on (when the player loses)."""
+        self.mines_shown = True
+
+    def update_board(self, start_row: int, start_col: int) -> int:
+        """
+        Reveals the chosen cell like MineBoard.update_board, opening blank
+        regions across as many chunks as they reach. Returns the number of
+        cells revealed.
+        """
+        size = self.size
+        chunk, r, c = self.locate(start_row, start_col)
+        if chunk.revealed[r, c] or chunk.mines[r, c] or chunk.flagged[r, c]:
+            return 0
+
+        # Cells to open, by chunk, as flat indexes into the chunk
+        pending = {(start_row // size, start_col // size): {r * size + c}}
+        opened = 0
+        while pending:
+            key, cells = pending.popitem()
+            chunk = self.load(*key)
+            labels, region_start, region_cells = chunk.zero_regions()
+            labels = labels.reshape(-1)
+            revealed = chunk.revealed.reshape(-1)
+
+            parts = []
+            for cell in cells:
+                label = labels[cell]
+                if label:
+                    parts.append(region_cells[region_start[label]:region_start[label + 1]])
+                elif not revealed[cell]:
+                    parts.append([cell])
+            if not parts:
+                continue
+            new = np.unique(np.concatenate(parts))
+            new = new[~revealed[new]]
+            if not len(new):
+                continue
+            revealed[new] = True
+            chunk.flagged.reshape(-1)[new] = False
+            chunk.dirty = True
+            opened += len(new)
+
+            # Blanks opened on the edge open their neighbours in the next chunks
+            rows, cols = np.divmod(new[labels[new] > 0], size)
+            edge = (rows == 0) | (rows == size - 1) | (cols == 0) | (cols == size - 1)
+            for r, c in zip(rows[edge].tolist(), cols[edge].tolist()):
+                for dr in (-1, 0, 1):
+                    for dc in (-1, 0, 1):
+                        nr, nc = r + dr, c + dc
+                        if not (0 <= nr < size and 0 <= nc < size):
+                            next_key = (key[0] + nr // size, key[1] + nc // size)
+                            pending.setdefault(next_key, set()).add(nr % size * size + nc % size)
+        return opened
+
+    def symbol_window(self, level: int, top: int, left: int, height: int, width: int) -> list:
+        """The symbols of a rectangle of the world (see MineBoard.symbol_window)."""
+        size = self.size
+        arrays = [np.zeros((height, width), dtype=dtype) for dtype in (bool, np.int8, bool, bool)]
+        for chunk_row in range(top // size, (top + height - 1) // size + 1):
+            for chunk_col in range(left // size, (left + width - 1) // size + 1):
+                chunk = self.load(chunk_row, chunk_col)
+                row0, col0 = chunk_row * size, chunk_col * size
+                r1, r2 = max(top, row0), min(top + height, row0 + size)
+                c1, c2 = max(left, col0), min(left + width, col0 + size)
+                for target, source in zip(arrays, (chunk.mines, chunk.counts,
+                                                   chunk.revealed, chunk.flagged)):
+                    target[r1 - top:r2 - top, c1 - left:c2 - left] = \
+                        source[r1 - row0:r2 - row0, c1 - col0:c2 - col0]
+        return symbol_rows(level, *arrays, self.mines_shown)
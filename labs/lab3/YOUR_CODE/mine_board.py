@@ -0,0 +1,447 @@
+"""
+NumPy minesweeper board.
+
+The team's board is a list of lists of (display, base) tuples, and every
+function walks it cell by cell. MineBoard keeps the same game in arrays:
+
+    mines     bool (rows, cols)   True where a mine is
+    counts    int8 (rows, cols)   number of adjacent mines, for every cell
+    revealed  bool (rows, cols)   True once the player has uncovered the cell
+
+All the neighbour counts come from eight shifted-slice additions over the
+whole mine array, taking milliseconds even on a 2000x2000 board.
+from_tuple_board() and to_tuple_board() convert to and from the tuple board,
+so print_board and the team's functions still work on it.
+
+Clicking a blank cell opens its whole region: the connected blank cells and
+the numbers around them. A small region is flood-filled, which only touches
+its own cells. The first region bigger than FLOOD_FILL_LIMIT blanks has every
+region of the board labelled at once (label_zero_regions), with each
+region's cells stored as a list of flat indexes, and from then on a click
+reveals its region directly. So no click pays for a pass over the whole
+board unless it opens a large region.
+
+The board also keeps running counts of revealed cells, safe cells still
+hidden and flags, updated by every move, so game_won() needs no scan.
+"""
+import numpy as np
+
+import globals
+
+HIDDEN_SYMBOL = ' ♦'
+BLANK_SYMBOL = '   '
+MINE_SYMBOL = '💣'
+FLAG_SYMBOL = ' ⚑'
+
+# The eight (row, col) offsets of a cell's neighbours
+NEIGHBOR_OFFSETS = tuple(
+    (dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1) if (dr, dc) != (0, 0)
+)
+
+# Blank cells a click flood-fills before labelling the whole board instead
+FLOOD_FILL_LIMIT = 1024
+
+
+def _shifted(rows: int, cols: int, dr: int, dc: int):
+    """
+    Slices (target, source) such that target cell (r, c) lines up with
+    source cell (r + dr, c + dc), for every pair inside the board.
+    """
+    target = (slice(max(0, -dr), rows - max(0, dr)), slice(max(0, -dc), cols - max(0, dc)))
+    source = (slice(max(0, dr), rows - max(0, -dr)), slice(max(0, dc), cols - max(0, -dc)))
+    return target, source
+
+
+def neighbor_counts(mines):
+    """
+    Returns the number of adjacent mines of every cell (mines included),
+    as an int8 array shaped like mines.
+    """
+    mines = np.asarray(mines, dtype=bool)
+    rows, cols = mines.shape
+    counts = np.zeros((rows, cols), dtype=np.int8)
+    as_int = mines.view(np.int8)
+    for dr, dc in NEIGHBOR_OFFSETS:
+        target, source = _shifted(rows, cols, dr, dc)
+        counts[target] += as_int[source]
+    return counts
+
+
+def _connected_components(count: int, a, b):
+    """
+    Union-find over count nodes joined by the edges (a[i], b[i]), done with
+    whole-array hooking and pointer jumping. Returns each node's root.
+    """
+    parent = np.arange(count)
+    while True:
+        root_a, root_b = parent[a], parent[b]
+        if np.array_equal(root_a, root_b):
+            return parent
+        low = np.minimum(root_a, root_b)
+        np.minimum.at(parent, root_a, low)
+        np.minimum.at(parent, root_b, low)
+        while True:
+            jumped = parent[parent]
+            if np.array_equal(jumped, parent):
+                break
+            parent = jumped
+
+
+def label_zero_regions(mines, counts):
+    """
+    Labels the regions a click on a blank cell opens.
+    Blank (zero-count, safe) cells are split into runs along each row, runs
+    that touch (diagonals included) in neighbouring rows are joined with
+    union-find, and every region gets the numbered cells around it.
+    Returns (labels, region_start, region_cells):
+    - labels: int32 array, the region (1, 2, ...) of every blank cell, 0 elsewhere.
+    - region_cells[region_start[n]:region_start[n + 1]]: flat indexes of the
+      cells region n opens, blanks and bordering numbers.
+    """
+    rows, cols = counts.shape
+    blank = (counts == 0) & ~mines
+
+    # Runs of blanks in each row, as [start, end) columns
+    width = cols + 2
+    edges = np.diff(np.pad(blank.view(np.int8), ((0, 0), (1, 1))), axis=1)
+    run_row, run_start = np.nonzero(edges == 1)
+    run_end = np.nonzero(edges == -1)[1]
+    runs = len(run_row)
+
+    # A run in row r + 1 touches the runs in row r that overlap it after
+    # widening it by one column each way; those form a contiguous range
+    start_keys = run_row * width + run_start
+    end_keys = run_row * width + run_end
+    below = np.nonzero(run_row > 0)[0]
+    above_row = (run_row[below] - 1) * width
+    first = np.searchsorted(end_keys, above_row + run_start[below], side='left')
+    last = np.searchsorted(start_keys, above_row + run_end[below], side='right')
+    touching = np.maximum(last - first, 0)
+    a = np.repeat(below, touching)
+    offsets = np.arange(touching.sum()) - np.repeat(np.cumsum(touching) - touching, touching)
+    b = np.repeat(first, touching) + offsets
+
+    roots = _connected_components(runs, a, b)
+    _, run_label = np.unique(roots, return_inverse=True)
+    run_label = run_label.astype(np.int32) + 1
+    regions = int(run_label.max()) if runs else 0
+
+    labels = np.zeros((rows, cols), dtype=np.int32)
+    labels[blank] = np.repeat(run_label, run_end - run_start)
+
+    # Every blank cell and every numbered neighbour of one, by region
+    index = np.arange(rows * cols).reshape(rows, cols)
+    region_of = [labels[blank]]
+    cell = [index[blank]]
+    numbered = ~blank & ~mines
+    for dr, dc in NEIGHBOR_OFFSETS:
+        target, source = _shifted(rows, cols, dr, dc)
+        border = (labels[source] > 0) & numbered[target]
+        region_of.append(labels[source][border])
+        cell.append(index[target][border])
+    # Sorting (region, cell) keys groups the cells by region and drops
+    # numbers that border the same region more than once
+    keys = np.unique(np.concatenate(region_of).astype(np.int64) * (rows * cols)
+                     + np.concatenate(cell))
+    key_region, region_cells = np.divmod(keys, rows * cols)
+    region_start = np.searchsorted(key_region, np.arange(regions + 2))
+    return labels, region_start, region_cells
+
+
+def first_click_area(rows: int, cols: int, first_click) -> np.ndarray:
+    """Sorted flat indexes of the first-clicked cell and its neighbours."""
+    row, col = first_click
+    area = [(row + dr) * cols + col + dc for dr in (-1, 0, 1) for dc in (-1, 0, 1)
+            if 0 <= row + dr < rows and 0 <= col + dc < cols]
+    return np.array(sorted(area), dtype=np.int64)
+
+
+def place_mines(rows: int, cols: int, mines: int, seed=None, first_click=None) -> np.ndarray:
+    """
+    Picks the mine cells, the same ones for the same arguments.
+    - seed: seed for np.random.default_rng (or a Generator).
+    - first_click: (row, col) kept free of mines together with its
+      neighbours (only the cell itself when the neighbours are needed to fit
+      the mines), so the first click always opens something.
+    Below half density the mines are drawn as random indexes, drawing again
+    for any that landed twice, O(mines); above it a permutation of the free
+    cells is cut.
+    Returns a bool array (rows, cols), True where a mine is.
+    """
+    cells = rows * cols
+    if not 1 <= mines < cells:
+        raise ValueError(f'mines must be between 1 and {cells - 1}')
+    excluded = np.zeros(0, dtype=np.int64)
+    if first_click is not None:
+        excluded = first_click_area(rows, cols, first_click)
+        if mines > cells - len(excluded):
+            excluded = np.array([first_click[0] * cols + first_click[1]], dtype=np.int64)
+    free = cells - len(excluded)
+    # Index i of the free cells skips every excluded cell at or before it
+    skips = excluded - np.arange(len(excluded))
+    rng = np.random.default_rng(seed)
+
+    layout = np.zeros(cells, dtype=bool)
+    if mines <= free // 2:
+        placed = 0
+        while placed < mines:
+            picked = rng.integers(0, free, mines - placed)
+            layout[picked + np.searchsorted(skips, picked, side='right')] = True
+            placed = int(np.count_nonzero(layout))
+    else:
+        picked = rng.permutation(free)[:mines]
+        layout[picked + np.searchsorted(skips, picked, side='right')] = True
+    return layout.reshape(rows, cols)
+
+
+def place_random_mines(board: list, seed=None, first_click=None) -> list:
+    """
+    Drop-in replacement for the team's place_random_mines: puts globals.MINES
+    mines into the base layer of the tuple board with place_mines. Returns
+    the same board object.
+    """
+    rows, cols = len(board), len(board[0])
+    layout = place_mines(rows, cols, globals.MINES, seed, first_click)
+    for r, c in zip(*np.nonzero(layout)):
+        display, _ = board[r][c]
+        board[r][c] = (display, MINE_SYMBOL)
+    return board
+
+
+def base_symbol(count: int) -> str:
+    """The base-layer text for a safe cell with count adjacent mines."""
+    return BLANK_SYMBOL if count == 0 else f' {count} '
+
+
+def symbol_rows(level: int, mines, counts, revealed, flagged, mines_shown=False) -> list:
+    """
+    The tuple-board symbols of a block of cells given as arrays, as a list
+    of rows of strings (level 0 what the player sees, 1 the base layer).
+    """
+    # Codes 0-8 are counts, then a mine, a hidden cell and a flag
+    codes = counts.copy()
+    codes[mines] = 9
+    if level == 0:
+        hidden = ~revealed
+        codes[hidden] = np.where(flagged[hidden], 11, 10)
+        if mines_shown:
+            codes[mines] = 9
+    table = [base_symbol(count) for count in range(9)] + [MINE_SYMBOL, HIDDEN_SYMBOL, FLAG_SYMBOL]
+    return [[table[code] for code in row] for row in codes.tolist()]
+
+
+class MineBoard:
+    """
+    A minesweeper game held in NumPy arrays.
+    - mines: 2-D array-like of booleans, True where a mine is.
+    - debug: check the running counters against a full scan after every move.
+    """
+
+    def __init__(self, mines, debug=False):
+        self.mines = np.array(mines, dtype=bool)
+        if self.mines.ndim != 2:
+            raise ValueError('mines must be a 2-D array')
+        self.rows, self.cols = self.mines.shape
+        self.counts = neighbor_counts(self.mines)
+        self.revealed = np.zeros((self.rows, self.cols), dtype=bool)
+        self.flagged = np.zeros((self.rows, self.cols), dtype=bool)
+        self.mines_shown = False
+        self.debug = debug
+        self.regions = None  # (labels, region_start, region_cells), made when first needed
+        self.mine_count = int(np.count_nonzero(self.mines))
+        self.recount()
+
+    def zero_regions(self):
+        """The blank regions as label_zero_regions returns them, labelled on the first call."""
+        if self.regions is None:
+            self.regions = label_zero_regions(self.mines, self.counts)
+        return self.regions
+
+    def flood_fill(self, row: int, col: int, limit: int = FLOOD_FILL_LIMIT):
+        """
+        Flat indexes of the cells a click on the blank cell (row, col) opens,
+        found by flood-filling from it, or None once more than limit blank
+        cells have been reached.
+        """
+        rows, cols, counts = self.rows, self.cols, self.counts
+        seen = {row * cols + col}
+        stack = [(row, col)]
+        blanks = 0
+        while stack:
+            r, c = stack.pop()
+            blanks += 1
+            if blanks > limit:
+                return None
+            for dr, dc in NEIGHBOR_OFFSETS:
+                nr, nc = r + dr, c + dc
+                if 0 <= nr < rows and 0 <= nc < cols and nr * cols + nc not in seen:
+                    seen.add(nr * cols + nc)
+                    # A blank's neighbours are never mines: each is a blank or a number
+                    if counts[nr, nc] == 0:
+                        stack.append((nr, nc))
+        return np.fromiter(seen, dtype=np.int64, count=len(seen))
+
+    def recount(self):
+        """Sets the running counters from a full scan of the arrays."""
+        self.revealed_count = int(np.count_nonzero(self.revealed))
+        self.safe_remaining = self.rows * self.cols - self.mine_count - self.revealed_count
+        self.flag_count = int(np.count_nonzero(self.flagged))
+
+    def check_counters(self):
+        """Raises AssertionError if a running counter disagrees with a full scan."""
+        counters = (self.revealed_count, self.safe_remaining, self.flag_count)
+        self.recount()
+        scanned = (self.revealed_count, self.safe_remaining, self.flag_count)
+        if counters != scanned:
+            raise AssertionError(
+                f'counters (revealed, safe remaining, flags) {counters} != scan {scanned}')
+
+    @classmethod
+    def random(cls, rows: int, cols: int, mines: int, rng=None, first_click=None) -> 'MineBoard':
+        """A board with mines placed uniformly at random by place_mines (see there for the arguments)."""
+        return cls(place_mines(rows, cols, mines, rng, first_click))
+
+    @classmethod
+    def from_tuple_board(cls, board: list) -> 'MineBoard':
+        """
+        Builds a MineBoard from the team's (display, base) tuple board.
+        Counts are recomputed from the mines, so the base numbers may be
+        missing (e.g. before count_adjacent_mines has run).
+        """
+        game = cls([[base == MINE_SYMBOL for _, base in row] for row in board])
+        for r, row in enumerate(board):
+            for c, (display, base) in enumerate(row):
+                if display == MINE_SYMBOL:
+                    game.mines_shown = True
+                elif display == FLAG_SYMBOL:
+                    game.flagged[r, c] = True
+                elif display != HIDDEN_SYMBOL:
+                    game.revealed[r, c] = True
+        game.recount()
+        return game
+
+    def to_tuple_board(self) -> list:
+        """Returns the board as the team's list of lists of (display, base) tuples."""
+        return [list(zip(display_row, base_row)) for display_row, base_row in zip(
+            self.symbol_window(0, 0, 0, self.rows, self.cols),
+            self.symbol_window(1, 0, 0, self.rows, self.cols))]
+
+    def symbol_window(self, level: int, top: int, left: int, height: int, width: int) -> list:
+        """
+        The symbols of a rectangle of the board, as a list of rows of strings.
+        - level: 0 for what the player sees, 1 for the hidden base layer
+          (the same two levels as the tuple board).
+        """
+        window = np.s_[top:top + height, left:left + width]
+        return symbol_rows(level, self.mines[window], self.counts[window], self.revealed[window],
+                           self.flagged[window], self.mines_shown)
+
+    def is_mine_at(self, row: int, col: int) -> bool:
+        """Return True if there is a mine at (row, col)."""
+        return bool(self.mines[row, col])
+
+    def is_revealed(self, row: int, col: int) -> bool:
+        """Return True if the cell at (row, col) has been uncovered."""
+        return bool(self.revealed[row, col])
+
+    def is_flagged(self, row: int, col: int) -> bool:
+        """Return True if the cell at (row, col) has a flag on it."""
+        return bool(self.flagged[row, col])
+
+    def player_view(self) -> np.ndarray:
+        """
+        The board as the player sees it, as a new int8 array (rows, cols):
+        the number on every revealed cell, -1 for a hidden cell and -2 for a
+        flagged one. Solvers read the board through this, never the mines.
+        """
+        view = np.where(self.revealed, self.counts, np.int8(-1)).astype(np.int8)
+        view[self.flagged & ~self.revealed] = -2
+        return view
+
+    def update_board(self, start_row: int, start_col: int) -> int:
+        """
+        Reveals the chosen cell, like the team's update_board: a number
+        reveals just that cell, a blank also reveals every connected blank
+        and the numbers bordering them. Flagged cells are left alone, except
+        wrong flags inside an opened region, which are cleared.
+        Returns the number of cells revealed.
+        """
+        if (self.revealed[start_row, start_col] or self.mines[start_row, start_col]
+                or self.flagged[start_row, start_col]):
+            return 0
+
+        if self.counts[start_row, start_col]:
+            self.revealed[start_row, start_col] = True
+            opened = 1
+        else:
+            cells = None if self.regions is not None else self.flood_fill(start_row, start_col)
+            if cells is None:
+                labels, region_start, region_cells = self.zero_regions()
+                label = labels[start_row, start_col]
+                cells = region_cells[region_start[label]:region_start[label + 1]]
+            revealed = self.revealed.reshape(-1)
+            flagged = self.flagged.reshape(-1)
+            opened = len(cells) - int(np.count_nonzero(revealed[cells]))
+            self.flag_count -= int(np.count_nonzero(flagged[cells]))
+            revealed[cells] = True
+            flagged[cells] = False
+
+        self.revealed_count += opened
+        self.safe_remaining -= opened
+        if self.debug:
+            self.check_counters()
+        return opened
+
+    def toggle_flag(self, row: int, col: int) -> bool:
+        """Puts a flag on a hidden cell or takes it off. Returns True if the cell is now flagged."""
+        if self.revealed[row, col]:
+            return False
+        flagged = not self.flagged[row, col]
+        self.flagged[row, col] = flagged
+        self.flag_count += 1 if flagged else -1
+        if self.debug:
+            self.check_counters()
+        return flagged
+
+    def region_size(self, row: int, col: int) -> int:
+        """Cells a click on (row, col) opens on a fresh board (1 for a number, 0 for a mine)."""
+        if self.mines[row, col]:
+            return 0
+        if self.counts[row, col]:
+            return 1
+        labels, region_start, _ = self.zero_regions()
+        label = labels[row, col]
+        return int(region_start[label + 1] - region_start[label])
+
+    def region_sizes(self):
+        """Array of the number of cells each region opens, indexed by label (entry 0 unused)."""
+        return np.diff(self.zero_regions()[1])
+
+    def game_won(self) -> bool:
+        """Return True when every safe cell has been revealed."""
+        return self.safe_remaining == 0
+
+    def mines_left(self) -> int:
+        """Mines not yet flagged, as shown on a minesweeper counter."""
+        return self.mine_count - self.flag_count
+
+    def reveal_all_mines(self):
+        """Show all mines (when the player loses). Safe cells and the counters are unchanged."""
+        self.mines_shown = True
+        if self.debug:
+            self.check_counters()
+
+
+def count_adjacent_mines(board: list) -> list:
+    """
+    Drop-in replacement for the team's count_adjacent_mines: writes every
+    safe cell's count into the base layer of the tuple board, using the
+    vectorized neighbour counts. Returns the same board object.
+    """
+    mines = np.array([[base == MINE_SYMBOL for _, base in row] for row in board], dtype=bool)
+    counts = neighbor_counts(mines).tolist()
+    for r, row in enumerate(board):
+        for c, (display, base) in enumerate(row):
+            if base != MINE_SYMBOL:
+                row[c] = (display, base_symbol(counts[r][c]))
+    return board
@@ -0,0 +1,440 @@
+"""
+Minesweeper game loop with the input and the output plugged in.
+
+The team's play_minesweeper reads every move with get_validated_input
+(blocking input()), draws with print_board and keeps the board size in
+globals.ROWS/COLS/MINES, so only one interactive game can run per process.
+Here the loop takes:
+
+- a BoardConfig with the board size, instead of the globals. By default
+  the mines are placed after the first click, away from it;
+- an input strategy: any callable strategy(board) -> (row, col), or None to
+  stop the game. ConsoleInput asks the player like get_validated_input;
+  ScriptedInput, RandomInput and SolverInput play on their own;
+- an optional renderer (renderer.BoardRenderer); without one nothing is drawn.
+
+A strategy may also return ('flag', row, col) to flag a cell or take the
+flag off, and ('save', path) or ('resume', path) to write the game to a save
+file or carry on from one (savegame.py); ConsoleInput does so for
+"flag row col", "save [file]" and "resume [file]".
+
+play_endless runs the same loop on an endless.EndlessWorld, a board with no
+edges whose chunks are made as the player reaches them and stored when
+memory fills up. The renderer follows the last move around the world.
+
+    play_minesweeper()                                      # interactive, as before
+    play_minesweeper(resume='minesweeper.save')             # carry on a saved game
+    play_minesweeper(BoardConfig(16, 30, 99), SolverInput(), rng=7)   # headless
+    play_endless(EndlessWorld(seed=7, store='world7'))      # endless, kept in world7/
+
+    python play_minesweeper.py [save file]
+    python play_minesweeper.py --endless [store directory]
+
+simulate.py runs many headless games across processes.
+"""
+import random
+import sys
+import time
+
+import numpy as np
+
+import globals
+from endless import EndlessWorld
+from mine_board import HIDDEN_SYMBOL, MineBoard
+from renderer import BoardRenderer
+from savegame import load_game, save_game
+from solver import Solver
+
+DEFAULT_SAVE = 'minesweeper.save'
+FLAGGED_MESSAGE = 'That cell is flagged. Take the flag off to open it.'
+
+
+class BoardConfig:
+    """
+    Board size for one game.
+    - rows, cols: at least 2 each.
+    - mines: between 1 and rows * cols - 1.
+    - safe_first_click: place the mines after the first click, keeping that
+      cell and its neighbours free.
+    """
+
+    def __init__(self, rows: int, cols: int, mines: int, safe_first_click=True):
+        if rows < 2 or cols < 2:
+            raise ValueError('rows and cols must be at least 2')
+        if not 1 <= mines < rows * cols:
+            raise ValueError(f'mines must be between 1 and {rows * cols - 1}')
+        self.rows = rows
+        self.cols = cols
+        self.mines = mines
+        self.safe_first_click = safe_first_click
+
+    def __repr__(self):
+        return f'BoardConfig({self.rows}, {self.cols}, {self.mines}, {self.safe_first_click})'
+
+    @classmethod
+    def from_globals(cls) -> 'BoardConfig':
+        """The size set in globals.ROWS/COLS/MINES."""
+        return cls(globals.ROWS, globals.COLS, globals.MINES)
+
+    def set_globals(self):
+        """Copies the size into globals, for the team's functions and print_board."""
+        globals.ROWS, globals.COLS, globals.MINES = self.rows, self.cols, self.mines
+
+    def new_board(self, rng=None, first_click=None) -> MineBoard:
+        """A random MineBoard of this size, the same for the same rng seed and first_click."""
+        return MineBoard.random(self.rows, self.cols, self.mines, rng, first_click)
+
+
+class HiddenBoard:
+    """
+    Stands in for the board before the first click of a safe_first_click
+    game: every cell hidden, no mines placed and nothing labelled. Strategies
+    and renderers read it like a MineBoard.
+    """
+
+    def __init__(self, config: BoardConfig):
+        self.rows = config.rows
+        self.cols = config.cols
+        self.mine_count = config.mines
+        self.revealed_count = 0
+        self.mines_shown = False
+
+    def is_revealed(self, row: int, col: int) -> bool:
+        return False
+
+    def is_flagged(self, row: int, col: int) -> bool:
+        return False
+
+    def player_view(self) -> np.ndarray:
+        return np.full((self.rows, self.cols), -1, dtype=np.int8)
+
+    def symbol_window(self, level: int, top: int, left: int, height: int, width: int) -> list:
+        height = max(0, min(height, self.rows - top))
+        width = max(0, min(width, self.cols - left))
+        return [[HIDDEN_SYMBOL] * width for _ in range(height)]
+
+    def game_won(self) -> bool:
+        return False
+
+
+def ask_board_config(input_fn=input) -> BoardConfig:
+    """Asks for the board size with the same prompts and limits as initialize_board."""
+    def ask(prompt, low, high):
+        while True:
+            try:
+                value = int(input_fn(prompt))
+                if low <= value <= high:
+                    return value
+            except ValueError:
+                pass
+            prompt = f'Invalid. Try again ({low}–{high}): '
+
+    rows = ask('Please define number of rows (min. 2 and max. 10): ', 2, 10)
+    cols = ask('Please define number of columns (min. 2 and max. 10): ', 2, 10)
+    mines = ask(f'Please define number of mines (1–{rows * cols - 1}): ', 1, rows * cols - 1)
+    return BoardConfig(rows, cols, mines)
+
+
+class ConsoleInput:
+    """
+    Asks the player for a row and column, like get_validated_input, until
+    they are two integers inside the board on a hidden cell, or for
+    "flag row col", "save [file]" or "resume [file]" (file defaults to
+    DEFAULT_SAVE). On a board with no edges (no rows/cols) any cell is inside.
+    - input_fn, output: replace input() and print(), e.g. in a test.
+    """
+
+    def __init__(self, input_fn=input, output=print):
+        self.input_fn = input_fn
+        self.output = output
+
+    def __call__(self, board):
+        while True:
+            parts = self.input_fn(
+                'Enter row and column (e.g. 1 2), flag row column, save or resume: ').split()
+            if parts and parts[0] in ('save', 'resume') and len(parts) <= 2:
+                return parts[0], parts[1] if len(parts) == 2 else DEFAULT_SAVE
+            command = None
+            if parts and parts[0] == 'flag':
+                command, parts = 'flag', parts[1:]
+            if len(parts) != 2:
+                self.output('Please enter exactly two numbers.')
+                continue
+            try:
+                row, col = int(parts[0]), int(parts[1])
+            except ValueError:
+                self.output('Both row and column must be numbers.')
+                continue
+            if hasattr(board, 'rows') and not (0 <= row < board.rows and 0 <= col < board.cols):
+                self.output('Out of bounds. Try again.')
+                continue
+            if board.is_revealed(row, col):
+                self.output('That cell is already revealed. Pick another.')
+                continue
+            if command is None and board.is_flagged(row, col):
+                self.output('That cell is flagged. Take the flag off (flag row col) to open it.')
+                continue
+            return (command, row, col) if command else (row, col)
+
+
+class ScriptedInput:
+    """Plays a fixed list of (row, col) moves, skipping revealed cells; stops when they run out."""
+
+    def __init__(self, moves):
+        self.moves = iter(moves)
+
+    def __call__(self, board):
+        for row, col in self.moves:
+            if not board.is_revealed(row, col):
+                return row, col
+        return None
+
+
+class RandomInput:
+    """Clicks a random hidden cell. - rng: seed or random.Random."""
+
+    def __init__(self, rng=None):
+        self.rng = rng if isinstance(rng, random.Random) else random.Random(rng)
+
+    def __call__(self, board):
+        # Rejection sampling: cheap while most of the board is hidden
+        for _ in range(32):
+            row, col = self.rng.randrange(board.rows), self.rng.randrange(board.cols)
+            if not board.is_revealed(row, col):
+                return row, col
+        hidden = (board.player_view() < 0).nonzero()
+        i = self.rng.randrange(len(hidden[0]))
+        return int(hidden[0][i]), int(hidden[1][i])
+
+
+class SolverInput:
+    """
+    Plays the solver's move. A new Solver is started whenever the board
+    changes, so one SolverInput can play a series of games.
+    - total_mines: mines on the board (default: the board's own count).
+    - rng: seed or random.Random for the solver's guesses.
+    """
+
+    def __init__(self, total_mines=None, rng=None):
+        self.total_mines = total_mines
+        self.rng = rng if isinstance(rng, random.Random) else random.Random(rng)
+        self.solver = None
+
+    def __call__(self, board):
+        if self.solver is None or self.solver.board is not board:
+            total_mines = board.mine_count if self.total_mines is None else self.total_mines
+            self.solver = Solver(board, total_mines, self.rng)
+        cell, _ = self.solver.choose_move()
+        return divmod(cell, board.cols)
+
+
+def play_minesweeper(config=None, strategy=None, renderer=None, rng=None, board=None,
+                     resume=None) -> dict:
+    """
+    Plays one game.
+    - config: BoardConfig; None asks for the size like initialize_board.
+    - strategy: callable(board) -> (row, col) or None to stop; None plays
+      interactively (ConsoleInput, drawn with a BoardRenderer).
+    - renderer: draws the board after every move (None: draw nothing).
+    - rng: seed for the mine layout.
+    - board: a ready MineBoard to play instead of a random one.
+    - resume: path of a save file to carry on from instead.
+    Until the first click of a safe_first_click game, the strategy and the
+    renderer see a HiddenBoard; the mines are placed at that click.
+    Returns a dict: result ('won', 'lost' or 'stopped'), moves, cells
+    revealed, and per-move seconds spent choosing (decide) and revealing
+    (reveal).
+    """
+    if strategy is None:
+        strategy = ConsoleInput()
+        if renderer is None:
+            renderer = BoardRenderer()
+    place_on_click = False
+    moves = 0
+    seed = rng if isinstance(rng, int) else None
+    if resume is not None:
+        board, header = load_game(resume)
+        moves, seed = header.moves, header.seed
+    if board is None:
+        if config is None:
+            config = ask_board_config()
+        if config.safe_first_click:
+            board = HiddenBoard(config)
+            place_on_click = True
+        else:
+            board = config.new_board(rng)
+
+    def show(message=None):
+        if renderer is not None:
+            renderer.render(board)
+            if message:
+                print(message, file=renderer.stream)
+
+    def finished():
+        if board.mines_shown:
+            return 'lost'
+        return 'won' if board.game_won() else None
+
+    decide, reveal = [], []
+    result = finished()
+    message = None
+    while result is None:
+        show(message)
+        message = None
+
+        start = time.perf_counter()
+        move = strategy(board)
+        elapsed = time.perf_counter() - start
+        if move is None:
+            result = 'stopped'
+            break
+
+        if move[0] == 'flag':
+            if place_on_click:
+                message = 'Nothing to flag before the first move.'
+            else:
+                board.toggle_flag(move[1], move[2])
+            continue
+        if move[0] == 'save':
+            if place_on_click:
+                message = 'Nothing to save before the first move.'
+            else:
+                save_game(board, move[1], seed, moves)
+                message = f'Game saved to {move[1]}.'
+            continue
+        if move[0] == 'resume':
+            try:
+                board, header = load_game(move[1])
+            except (OSError, ValueError) as error:
+                message = f'Could not resume: {error}'
+                continue
+            moves, seed = header.moves, header.seed
+            place_on_click = False
+            result = finished()
+            message = f'Resumed {move[1]} after {moves} moves.'
+            continue
+        if board.is_flagged(*move):
+            # Like update_board, a click leaves a flagged cell alone, mine or not
+            message = FLAGGED_MESSAGE
+            continue
+
+        decide.append(elapsed)
+        moves += 1
+        row, col = move
+        if place_on_click:
+            board = config.new_board(rng, first_click=(row, col))
+            place_on_click = False
+
+        if board.is_mine_at(row, col):
+            board.reveal_all_mines()
+            result = 'lost'
+            show('You hit a mine. Game over.')
+            break
+
+        start = time.perf_counter()
+        board.update_board(row, col)
+        if board.game_won():
+            result = 'won'
+        reveal.append(time.perf_counter() - start)
+        if result == 'won':
+            show('You cleared all safe cells. You win.')
+
+    if message:
+        show(message)
+    return {
+        'result': result,
+        'moves': moves,
+        'revealed': board.revealed_count,
+        'decide': decide,
+        'reveal': reveal,
+    }
+
+
+def play_endless(world=None, strategy=None, renderer=None) -> dict:
+    """
+    Plays on an endless world until a mine is hit or the strategy stops.
+    - world: an EndlessWorld (default: seed 0, played chunks kept in memory).
+    - strategy: callable(world) -> (row, col), ('flag', row, col), ('save', path)
+      or None to stop; None plays interactively. ('save', path) stores the
+      played chunks in the world's own store; path is not used.
+    - renderer: draws the cells around the last move after every move.
+    Played chunks are stored when the game ends.
+    Returns a dict like play_minesweeper's: result ('lost' or 'stopped'),
+    moves, cells revealed, decide and reveal seconds.
+    """
+    if world is None:
+        world = EndlessWorld()
+    if strategy is None:
+        strategy = ConsoleInput()
+        if renderer is None:
+            renderer = BoardRenderer()
+    if renderer is not None:
+        renderer.center(0, 0)  # the cells around (0, 0) never hold a mine
+
+    def show(message=None):
+        if renderer is not None:
+            renderer.render(world)
+            if message:
+                print(message, file=renderer.stream)
+
+    moves = revealed = 0
+    decide, reveal = [], []
+    result = None
+    message = None
+    while result is None:
+        show(message)
+        message = None
+
+        start = time.perf_counter()
+        move = strategy(world)
+        elapsed = time.perf_counter() - start
+        if move is None:
+            result = 'stopped'
+            break
+
+        if move[0] == 'flag':
+            world.toggle_flag(move[1], move[2])
+            continue
+        if move[0] == 'save':
+            world.flush()
+            message = 'World saved.'
+            continue
+        if move[0] == 'resume':
+            message = 'An endless world carries on from its store; start it with the same one.'
+            continue
+        if world.is_flagged(*move):
+            message = FLAGGED_MESSAGE
+            continue
+
+        decide.append(elapsed)
+        moves += 1
+        row, col = move
+        if renderer is not None:
+            renderer.show(row, col)
+        if world.is_mine_at(row, col):
+            world.reveal_all_mines()
+            result = 'lost'
+            show(f'You hit a mine after opening {revealed} cells. Game over.')
+            break
+
+        start = time.perf_counter()
+        revealed += world.update_board(row, col)
+        reveal.append(time.perf_counter() - start)
+
+    world.flush()
+    if message:
+        show(message)
+    return {
+        'result': result,
+        'moves': moves,
+        'revealed': revealed,
+        'decide': decide,
+        'reveal': reveal,
+    }
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and sys.argv[1] == '--endless':
+        play_endless(EndlessWorld(store=sys.argv[2] if len(sys.argv) > 2 else None))
+    else:
+        play_minesweeper(resume=sys.argv[1] if len(sys.argv) > 1 else None)
@@ -0,0 +1,197 @@
+"""
+Buffered, incremental board renderer.
+
+print_board writes every cell fragment with its own print call, and the game
+clears the screen with os.system('clear') each turn, which starts a process.
+BoardRenderer builds each frame as one string and writes it once:
+
+- On a terminal, the first frame is drawn in full and later frames only
+  rewrite the cells that changed, moving the cursor with ANSI escape codes.
+  A board bigger than the terminal is shown through a viewport that can be
+  scrolled.
+- Anywhere else (a pipe, a file, a test) it writes exactly what
+  print_board prints, header layout and '💣' padding included.
+
+Boards are the team's tuple board (with the same `level` argument as
+print_board), a MineBoard or anything else with a symbol_window(level, top,
+left, height, width) method. A board without rows and cols, like
+endless.EndlessWorld, has no edges: the viewport scrolls anywhere and only
+the cells inside it are ever asked for (render_window draws any window).
+"""
+import shutil
+import sys
+
+import globals
+
+CELL_WIDTH = 6     # '| xx  ' per cell
+HEADER_LINES = 2   # column numbers and the first separator line
+# Row label width on boards with no edges, room for labels like -1234
+# so scrolling doesn't change the layout
+OPEN_LABEL_WIDTH = 5
+
+
+def cell_text(symbol: str) -> str:
+    """One cell as print_board draws it (the bomb emoji is two columns wide)."""
+    if symbol == '💣':
+        return f'| {symbol:3}'
+    return f'| {symbol:3} '
+
+
+def board_size(board):
+    """
+    (rows, cols) of a MineBoard, globals.ROWS/COLS for a tuple board like
+    print_board, or None for a board with no edges.
+    """
+    if hasattr(board, 'symbol_window'):
+        return (board.rows, board.cols) if hasattr(board, 'rows') else None
+    return globals.ROWS, globals.COLS
+
+
+def symbol_window(board, level: int, top: int, left: int, height: int, width: int) -> list:
+    """The symbols of a rectangle of a MineBoard or tuple board."""
+    if hasattr(board, 'symbol_window'):
+        return board.symbol_window(level, top, left, height, width)
+    return [[cell[level] for cell in row[left:left + width]] for row in board[top:top + height]]
+
+
+def format_board(board, level: int) -> str:
+    """The text print_board(board, level) prints, as one string."""
+    rows, cols = board_size(board)
+    line_hash = f'      {"|-----" * cols}|\n'
+    lines = ['      ' + ''.join(f'   {idx}  ' for idx in range(cols)) + '\n', line_hash]
+    for row, symbols in enumerate(symbol_window(board, level, 0, 0, rows, cols)):
+        lines.append(f'  {row}   ' + ''.join(cell_text(symbol) for symbol in symbols) + '|\n')
+        lines.append(line_hash)
+    return ''.join(lines)
+
+
+class BoardRenderer:
+    """
+    Draws boards to a stream, one buffered write per frame.
+    - stream: where to draw (default sys.stdout).
+    - viewport: (rows, cols) of cells to show on a terminal; None fits the
+      terminal size.
+    - tty: force terminal (True) or plain (False) output; None asks the stream.
+    """
+
+    def __init__(self, stream=None, viewport=None, tty=None):
+        self.stream = stream or sys.stdout
+        self.viewport = viewport
+        self.tty = self.stream.isatty() if tty is None else tty
+        self.top = 0
+        self.left = 0
+        self.layout = None    # (top, left, height, width, label width) last drawn
+        self.symbols = None   # symbols last drawn, to compare the next frame with
+
+    def scroll(self, rows: int, cols: int):
+        """Moves the viewport; render() keeps it inside the board."""
+        self.top += rows
+        self.left += cols
+
+    def show(self, row: int, col: int):
+        """Scrolls just enough for (row, col) to be in the viewport."""
+        height, width = self.layout[2:4] if self.layout else (1, 1)
+        self.top = min(self.top, row)
+        self.top = max(self.top, row - height + 1)
+        self.left = min(self.left, col)
+        self.left = max(self.left, col - width + 1)
+
+    def center(self, row: int, col: int):
+        """Scrolls so (row, col) is in the middle of the viewport."""
+        height, width = self.layout[2:4] if self.layout else self.view_size(
+            None, None, OPEN_LABEL_WIDTH)
+        self.top = row - height // 2
+        self.left = col - width // 2
+
+    def invalidate(self):
+        """Makes the next frame a full redraw (e.g. after other output covered the board)."""
+        self.layout = None
+
+    def view_size(self, rows, cols, label_width: int = 3):
+        """Rows and columns of cells that fit on screen, at most the board size (None: no limit)."""
+        if self.viewport is not None:
+            height, width = self.viewport
+        else:
+            size = shutil.get_terminal_size()
+            # Leave room below the board for the status line and the prompt
+            height = (size.lines - HEADER_LINES - 3) // 2
+            width = (size.columns - label_width - 4) // CELL_WIDTH
+        if rows is not None:
+            height, width = min(rows, height), min(cols, width)
+        return max(1, height), max(1, width)
+
+    def render(self, board, level: int = 0):
+        """
+        Draws the viewport of the board: in full the first time, then only
+        the cells that changed. A board with edges keeps the viewport inside
+        them.
+        """
+        size = board_size(board)
+        if size is None:
+            label_width = OPEN_LABEL_WIDTH
+            height, width = self.view_size(None, None, label_width)
+            status = (f'rows {self.top} to {self.top + height - 1}, '
+                      f'columns {self.left} to {self.left + width - 1}')
+        else:
+            if not self.tty:
+                self.stream.write(format_board(board, level))
+                self.stream.flush()
+                return
+            rows, cols = size
+            label_width = max(3, len(str(rows - 1)))
+            height, width = self.view_size(rows, cols, label_width)
+            self.top = max(0, min(self.top, rows - height))
+            self.left = max(0, min(self.left, cols - width))
+            status = ''
+            if (height, width) != (rows, cols):
+                status = (f'rows {self.top}-{self.top + height - 1} of {rows}, '
+                          f'columns {self.left}-{self.left + width - 1} of {cols}')
+        self.render_window(board, level, self.top, self.left, height, width, label_width, status)
+
+    def render_window(self, board, level: int, top: int, left: int, height: int, width: int,
+                      label_width: int = 3, status: str = ''):
+        """
+        Draws the cells from (top, left), height rows by width columns, with
+        status on the line below. Only board.symbol_window is read, so the
+        board needs no size. On a terminal only the changed cells are
+        redrawn; elsewhere the window is written in full.
+        """
+        symbols = symbol_window(board, level, top, left, height, width)
+        layout = (top, left, height, width, label_width)
+        if not self.tty:
+            self.stream.write(self.full_frame(symbols, layout) + (status and status + '\n'))
+            self.stream.flush()
+            return
+
+        margin = label_width + 3
+        if layout != self.layout:
+            frame = ['\x1b[H\x1b[2J', self.full_frame(symbols, layout)]
+        else:
+            frame = []
+            for r, (old_row, new_row) in enumerate(zip(self.symbols, symbols)):
+                for c, (old, new) in enumerate(zip(old_row, new_row)):
+                    if old != new:
+                        y = HEADER_LINES + 2 * r + 1
+                        x = margin + CELL_WIDTH * c + 1
+                        frame.append(f'\x1b[{y};{x}H{cell_text(new)}')
+
+        # Status line under the board, then clear whatever was printed below it last turn
+        bottom = HEADER_LINES + 2 * height + 1
+        frame.append(f'\x1b[{bottom};1H\x1b[J{status}\n')
+
+        self.stream.write(''.join(frame))
+        self.stream.flush()
+        self.layout = layout
+        self.symbols = symbols
+
+    def full_frame(self, symbols: list, layout) -> str:
+        """The whole viewport, laid out like print_board with the real row and column numbers."""
+        top, left, height, width, label_width = layout
+        pad = ' ' * (label_width + 3)
+        line_hash = f'{pad}{"|-----" * width}|\n'
+        lines = [pad + ''.join(f'{idx:>4}  ' for idx in range(left, left + width)) + '\n', line_hash]
+        for row, row_symbols in zip(range(top, top + height), symbols):
+            lines.append(f'{row:>{label_width}}   '
+                         + ''.join(cell_text(symbol) for symbol in row_symbols) + '|\n')
+            lines.append(line_hash)
+        return ''.join(lines)
@@ -0,0 +1,168 @@
+"""
+Saved minesweeper games in a compact binary file.
+
+Pickling the tuple board stores two strings per cell. A save here is a
+header and one bit per cell for each of the mines, the revealed cells and
+the flags, about 3/8 of a byte per cell:
+
+    header      magic b'MSWP', version, flags, rows, cols, seed, moves, mines
+    mines       ceil(rows * cols / 8) bytes, np.packbits of the flat array
+    revealed    the same
+    flagged     the same
+    counts      optional, two cells per byte (4-bit nibbles, high nibble first)
+
+Counts are recomputed from the mines on load unless they were saved
+(store_counts=True), which lets a reader inspect cells without recomputing.
+SavedGame opens a file with mmap, so reading the header or a few cells of a
+large save only touches the pages they are on.
+
+    save_game(board, 'game.save', seed=7, moves=12)
+    board, header = load_game('game.save')
+"""
+import mmap
+import os
+import struct
+from collections import namedtuple
+
+import numpy as np
+
+from mine_board import MineBoard, neighbor_counts
+
+MAGIC = b'MSWP'
+VERSION = 1
+# Header: magic, version, flags, rows, cols, seed (-1 if unknown), moves, mines
+HEADER = struct.Struct('<4sHHIIqII')
+MINES_SHOWN = 1    # flag: the game was lost and the mines are shown
+HAS_COUNTS = 2     # flag: nibble counts follow the bitsets
+
+Header = namedtuple('Header', 'rows cols seed moves mines mines_shown has_counts')
+
+
+def bitset_size(rows: int, cols: int) -> int:
+    return (rows * cols + 7) // 8
+
+
+def pack_counts(counts) -> bytes:
+    """Counts 0-8 as 4-bit nibbles, two cells per byte."""
+    flat = counts.reshape(-1).astype(np.uint8)
+    if len(flat) % 2:
+        flat = np.append(flat, np.uint8(0))
+    return (flat[0::2] << 4 | flat[1::2]).tobytes()
+
+
+def unpack_counts(data, rows: int, cols: int):
+    nibbles = np.frombuffer(data, dtype=np.uint8)
+    flat = np.empty(len(nibbles) * 2, dtype=np.int8)
+    flat[0::2] = nibbles >> 4
+    flat[1::2] = nibbles & 15
+    return flat[:rows * cols].reshape(rows, cols)
+
+
+def save_game(board, path, seed=None, moves=0, store_counts=False):
+    """
+    Writes a MineBoard to path.
+    - seed: the seed the board was made from, if known.
+    - moves: moves played so far.
+    - store_counts: also write the counts, so readers need not recompute them.
+    The file is written next to path and renamed over it, so an old save is
+    never left half overwritten.
+    """
+    flags = (MINES_SHOWN if board.mines_shown else 0) | (HAS_COUNTS if store_counts else 0)
+    parts = [HEADER.pack(MAGIC, VERSION, flags, board.rows, board.cols,
+                         -1 if seed is None else seed, moves, board.mine_count)]
+    for layer in (board.mines, board.revealed, board.flagged):
+        parts.append(np.packbits(layer.reshape(-1)).tobytes())
+    if store_counts:
+        parts.append(pack_counts(board.counts))
+    with open(f'{path}.tmp', 'wb') as f:
+        f.write(b''.join(parts))
+    os.replace(f'{path}.tmp', path)
+
+
+class SavedGame:
+    """
+    A save file opened through mmap. Use it as a context manager.
+    - header: the file's Header.
+    Layers and cells are read from the mapping when asked for.
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < HEADER.size:
+                raise ValueError(f'{path} is too short to be a saved minesweeper game')
+            self.map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, flags, rows, cols, seed, moves, mines = HEADER.unpack_from(self.map)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f'{path} is not a saved minesweeper game')
+        if version != VERSION:
+            self.close()
+            raise ValueError(f'{path} has save version {version}, expected {VERSION}')
+        self.header = Header(rows, cols, None if seed < 0 else seed, moves, mines,
+                             bool(flags & MINES_SHOWN), bool(flags & HAS_COUNTS))
+        size = HEADER.size + 3 * bitset_size(rows, cols)
+        if flags & HAS_COUNTS:
+            size += (rows * cols + 1) // 2
+        if len(self.map) != size:
+            self.close()
+            raise ValueError(f'{path} is {len(self.map)} bytes, expected {size}')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.map.close()
+
+    def layer_offset(self, layer: int) -> int:
+        """Where bitset layer 0 (mines), 1 (revealed) or 2 (flagged) starts."""
+        return HEADER.size + layer * bitset_size(self.header.rows, self.header.cols)
+
+    def bit(self, layer: int, row: int, col: int) -> bool:
+        """One cell of a bitset layer, reading a single byte."""
+        index = row * self.header.cols + col
+        return bool(self.map[self.layer_offset(layer) + index // 8] >> (7 - index % 8) & 1)
+
+    def is_mine_at(self, row: int, col: int) -> bool:
+        return self.bit(0, row, col)
+
+    def is_revealed(self, row: int, col: int) -> bool:
+        return self.bit(1, row, col)
+
+    def is_flagged(self, row: int, col: int) -> bool:
+        return self.bit(2, row, col)
+
+    def layer(self, layer: int):
+        """A whole bitset layer as a bool array (rows, cols)."""
+        rows, cols = self.header.rows, self.header.cols
+        data = np.frombuffer(self.map, dtype=np.uint8, count=bitset_size(rows, cols),
+                             offset=self.layer_offset(layer))
+        return np.unpackbits(data, count=rows * cols).astype(bool).reshape(rows, cols)
+
+    def counts(self):
+        """The counts, from the file if they were saved, else recomputed from the mines."""
+        rows, cols = self.header.rows, self.header.cols
+        if not self.header.has_counts:
+            return neighbor_counts(self.layer(0))
+        data = np.frombuffer(self.map, dtype=np.uint8, count=(rows * cols + 1) // 2,
+                             offset=self.layer_offset(3))
+        return unpack_counts(data, rows, cols)
+
+    def to_board(self) -> MineBoard:
+        """The saved game as a MineBoard, ready to play on."""
+        board = MineBoard(self.layer(0))
+        board.revealed = self.layer(1)
+        board.flagged = self.layer(2)
+        board.mines_shown = self.header.mines_shown
+        board.recount()
+        if board.mine_count != self.header.mines:
+            raise ValueError(f'save holds {board.mine_count} mines, header says {self.header.mines}')
+        return board
+
+
+def load_game(path):
+    """Reads a save. Returns (MineBoard, Header)."""
+    with SavedGame(path) as saved:
+        return saved.to_board(), saved.header
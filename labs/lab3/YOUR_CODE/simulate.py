@@ -0,0 +1,139 @@
+"""
+Batch runner: plays many seeded headless games across a process pool and
+reports games per second, win rate and how long moves take.
+
+    python simulate.py --games 5000 --strategy solver --rows 16 --cols 30 --mines 99
+    python simulate.py --games 20000 --strategy random --workers 8 --seed 3
+    python simulate.py --strategy scripted --script "0 0" "4 4" "8 8"
+
+Game i uses seed + i for both its mine layout and its strategy, so a batch
+gives the same results for any number of workers.
+"""
+import argparse
+import multiprocessing
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from play_minesweeper import (BoardConfig, RandomInput, ScriptedInput, SolverInput,
+                              play_minesweeper)
+
+# Each strategy is built per game from (config, seed, script)
+STRATEGIES = {
+    'scripted': lambda config, seed, script: ScriptedInput(script),
+    'random': lambda config, seed, script: RandomInput(seed),
+    'solver': lambda config, seed, script: SolverInput(config.mines, seed),
+}
+
+# Games handed to a worker at a time
+CHUNK_SIZE = 50
+
+
+def play_chunk(rows, cols, mines, safe_first_click, strategy, seeds, script=()):
+    """
+    Plays one game per seed (run in a worker process).
+    Returns (results {result: games}, moves, decide seconds, reveal seconds)
+    with the latencies of every move as float arrays.
+    """
+    config = BoardConfig(rows, cols, mines, safe_first_click)
+    make_strategy = STRATEGIES[strategy]
+    results = {'won': 0, 'lost': 0, 'stopped': 0}
+    moves = 0
+    decide, reveal = [], []
+    for seed in seeds:
+        game = play_minesweeper(config, make_strategy(config, seed, script), rng=seed)
+        results[game['result']] += 1
+        moves += game['moves']
+        decide.extend(game['decide'])
+        reveal.extend(game['reveal'])
+    return results, moves, np.array(decide), np.array(reveal)
+
+
+def run_batch(config, strategy='solver', games=1000, seed=0, workers=None, script=()):
+    """
+    Plays games seeded seed, seed + 1, ... and adds up the results.
+    - config: BoardConfig.
+    - strategy: a name from STRATEGIES.
+    - workers: processes to use (default: all cores; 1 plays in this process).
+    - script: (row, col) moves for the 'scripted' strategy.
+    Returns a dict with the result counts, moves, elapsed seconds and the
+    decide / reveal latency arrays.
+    """
+    chunks = [range(start, min(start + CHUNK_SIZE, seed + games))
+              for start in range(seed, seed + games, CHUNK_SIZE)]
+    args = (config.rows, config.cols, config.mines, config.safe_first_click, strategy)
+    script = [tuple(move) for move in script]
+
+    start = time.perf_counter()
+    if workers == 1 or multiprocessing.parent_process() is not None:
+        parts = [play_chunk(*args, chunk, script) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(play_chunk, *args, chunk, script) for chunk in chunks]
+            parts = [future.result() for future in futures]
+    elapsed = time.perf_counter() - start
+
+    results = {'won': 0, 'lost': 0, 'stopped': 0}
+    for part_results, _, _, _ in parts:
+        for name, count in part_results.items():
+            results[name] += count
+    return {
+        'games': games,
+        'results': results,
+        'moves': sum(part[1] for part in parts),
+        'elapsed': elapsed,
+        'decide': np.concatenate([part[2] for part in parts]) if parts else np.zeros(0),
+        'reveal': np.concatenate([part[3] for part in parts]) if parts else np.zeros(0),
+    }
+
+
+def latency_line(name, seconds):
+    """One report line: mean and percentiles of a latency array, in microseconds."""
+    if not len(seconds):
+        return f'{name:<7} no moves'
+    p50, p90, p99 = np.percentile(seconds, (50, 90, 99)) * 1e6
+    return (f'{name:<7} mean {seconds.mean() * 1e6:9.1f} us  p50 {p50:9.1f}  '
+            f'p90 {p90:9.1f}  p99 {p99:9.1f}  max {seconds.max() * 1e6:9.1f}')
+
+
+def report(batch, file=sys.stdout):
+    """Prints games/s, the results and the latency distributions of a batch."""
+    games = batch['games']
+    results = batch['results']
+    print(f'{games:,} games in {batch["elapsed"]:.2f}s  '
+          f'({games / batch["elapsed"]:,.0f} games/s, {batch["moves"]:,} moves)', file=file)
+    print(f'won {results["won"] / games:6.1%}  lost {results["lost"] / games:6.1%}  '
+          f'stopped {results["stopped"] / games:6.1%}', file=file)
+    print(latency_line('decide', batch['decide']), file=file)
+    print(latency_line('reveal', batch['reveal']), file=file)
+
+
+def parse_move(text):
+    row, col = text.split()
+    return int(row), int(col)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Play many headless minesweeper games.')
+    parser.add_argument('--rows', type=int, default=9)
+    parser.add_argument('--cols', type=int, default=9)
+    parser.add_argument('--mines', type=int, default=10)
+    parser.add_argument('--games', type=int, default=1000)
+    parser.add_argument('--unsafe-first-click', action='store_true',
+                        help='place the mines before the first click')
+    parser.add_argument('--strategy', default='solver', choices=list(STRATEGIES))
+    parser.add_argument('--script', nargs='+', type=parse_move, default=[],
+                        help='moves for the scripted strategy, each "row col"')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    config = BoardConfig(args.rows, args.cols, args.mines, not args.unsafe_first_click)
+    report(run_batch(config, args.strategy, args.games, args.seed, args.workers, args.script))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,409 @@
+"""
+Minesweeper solver.
+
+Plays a MineBoard through the same calls a player makes (is_mine_at,
+update_board, game_won), looking only at what the player can see: the
+board's player_view(), which cells are revealed and the numbers on them.
+
+Each move it works on the frontier, the hidden cells next to revealed numbers:
+
+1. Single-cell rules: a number whose mines are all accounted for makes its
+   other hidden neighbours safe; a number with exactly as many hidden
+   neighbours as missing mines makes them all mines.
+2. Subset rule: when one number's hidden neighbours are a subset of
+   another's, the difference holds the difference of their mines.
+3. If no cell is certain, the frontier is split into independent components
+   (cells linked by shared numbers), each component's mine layouts are
+   enumerated, and exact mine probabilities come from combining them with
+   the number of ways to place the remaining mines (globals.MINES) in the
+   cells off the frontier. The safest cell is played.
+
+The Python-level work grows with the frontier; whole-board passes are
+single NumPy operations.
+
+    result = solve(MineBoard.random(30, 16, 99, rng=1))
+    print(result['won'], result['guesses'], result['latency_mean'])
+"""
+import math
+import random
+import time
+from collections import defaultdict
+
+import numpy as np
+
+import globals
+from mine_board import NEIGHBOR_OFFSETS
+
+# Components with more cells than this, or whose enumeration takes more
+# than SEARCH_BUDGET steps, are not enumerated; their cells get the highest
+# simple ratio (missing mines / hidden cells) of their numbers
+MAX_COMPONENT = 32
+SEARCH_BUDGET = 20000
+
+
+class SearchBudgetExceeded(Exception):
+    """Stops an enumeration that has run past SEARCH_BUDGET steps."""
+
+
+class Solver:
+    """
+    Solver state for one game.
+    - board: a MineBoard.
+    - total_mines: mines on the board (default globals.MINES, else the board's count).
+    - rng: random seed or generator, used to pick among equally safe cells.
+    - flag_mines: flag every mine the solver finds (toggle_flag).
+    """
+
+    def __init__(self, board, total_mines=None, rng=None, flag_mines=False):
+        self.board = board
+        self.rows, self.cols = board.rows, board.cols
+        if total_mines is None:
+            total_mines = globals.MINES if globals.MINES is not None else board.mine_count
+        self.total_mines = total_mines
+        self.rng = rng if isinstance(rng, random.Random) else random.Random(rng)
+        self.flag_mines = flag_mines
+        self.known_mines = set()
+        self.view = None    # flat player_view(), read at the start of every search
+        self.seen = np.zeros(self.rows * self.cols, dtype=bool)  # revealed cells already read
+        self.numbers = {}   # frontier numbers: flat index -> count shown
+        self.safe_queue = []  # cells known to be safe, not played yet
+        self.planned = None   # (cell, probability) from hint(), played by the next step()
+        self.latencies = []
+        self.guesses = 0
+
+    def neighbors(self, cell: int) -> list:
+        row, col = divmod(cell, self.cols)
+        return [(row + dr) * self.cols + col + dc for dr, dc in NEIGHBOR_OFFSETS
+                if 0 <= row + dr < self.rows and 0 <= col + dc < self.cols]
+
+    def read_board(self):
+        """Reads the player's view and adds the numbers revealed since the last move to the frontier."""
+        self.view = self.board.player_view().reshape(-1)
+        new = np.flatnonzero((self.view >= 0) & ~self.seen)
+        self.seen[new] = True
+        for cell in new.tolist():
+            if self.view[cell]:
+                self.numbers[cell] = int(self.view[cell])
+
+    def constraints(self) -> dict:
+        """Frontier constraints: frozenset of unknown cells -> mines among them."""
+        view = self.view
+        result = {}
+        for cell, count in list(self.numbers.items()):
+            unknown = []
+            for neighbor in self.neighbors(cell):
+                if neighbor in self.known_mines:
+                    count -= 1
+                elif view[neighbor] < 0:
+                    unknown.append(neighbor)
+            if unknown:
+                result[frozenset(unknown)] = count
+            else:
+                del self.numbers[cell]  # fully solved, never needed again
+        return result
+
+    def propagate(self, constraints: dict):
+        """
+        Applies the single-cell rules, then the subset rule when they are
+        stuck, until neither finds anything new. New mines are added to
+        known_mines. Returns (safe cells, mine cells, remaining constraints).
+        """
+        safe, mines = set(), set()
+        while True:
+            new_safe, new_mines = set(), set()
+            for cells, need in constraints.items():
+                if need == 0:
+                    new_safe |= cells
+                elif need == len(cells):
+                    new_mines |= cells
+            if new_safe or new_mines:
+                safe |= new_safe
+                mines |= new_mines
+                constraints = reduce_constraints(constraints, new_safe, new_mines)
+                continue
+
+            derived = subset_constraints(constraints)
+            if not derived:
+                break
+            constraints.update(derived)
+
+        self.known_mines |= mines
+        return safe, mines, constraints
+
+    def probabilities(self, constraints: dict) -> tuple:
+        """
+        Exact mine probabilities of the frontier cells, with the global mine
+        count taken into account. Returns ({cell: probability}, probability
+        for each unknown cell off the frontier).
+        """
+        frontier = set().union(*constraints) if constraints else set()
+        off_frontier = self.rows * self.cols - int(np.count_nonzero(self.view >= 0)) \
+            - len(self.known_mines) - len(frontier)
+        mines_left = self.total_mines - len(self.known_mines)
+
+        # Each component: {mines: (layout weight, {cell: weight of layouts with a mine there})}
+        components = [enumerate_component(component) for component in split_components(constraints)]
+
+        # Weight of placing the other mines off the frontier, relative to the largest
+        def log_ways(frontier_mines):
+            rest = mines_left - frontier_mines
+            if rest < 0 or rest > off_frontier:
+                return None
+            return math.lgamma(off_frontier + 1) - math.lgamma(rest + 1) \
+                - math.lgamma(off_frontier - rest + 1)
+
+        max_mines = sum(max(component, default=0) for component in components)
+        logs = [log_ways(j) for j in range(max_mines + 1)]
+        top = max((value for value in logs if value is not None), default=0.0)
+        ways = [0.0 if value is None else math.exp(value - top) for value in logs]
+
+        def convolve(parts):
+            totals = {0: 1.0}
+            for part in parts:
+                merged = defaultdict(float)
+                for j, weight in totals.items():
+                    for k, (count, _) in part.items():
+                        merged[j + k] += weight * count
+                totals = merged
+            return totals
+
+        everything = convolve(components)
+        total = sum(weight * ways[j] for j, weight in everything.items())
+        if total == 0:
+            # The mine count can't be met (e.g. total_mines is wrong); use the frontier alone
+            ways = [1.0] * len(ways)
+            total = sum(everything.values())
+
+        result = {}
+        for i, component in enumerate(components):
+            others = convolve(components[:i] + components[i + 1:])
+            for k, (_, cell_counts) in component.items():
+                for cell, count in cell_counts.items():
+                    result[cell] = result.get(cell, 0.0) + count * sum(
+                        weight * ways[k + j] for j, weight in others.items()) / total
+
+        off_probability = 0.0
+        if off_frontier:
+            expected = sum(weight * ways[j] * (mines_left - j) for j, weight in everything.items())
+            off_probability = min(1.0, max(0.0, expected / total / off_frontier))
+        return result, off_probability
+
+    def choose_move(self):
+        """
+        Returns (cell, mine probability) for the next cell to reveal: a
+        certain safe cell (probability 0) if there is one, else the cell
+        least likely to be a mine.
+        """
+        while self.safe_queue:
+            cell = self.safe_queue.pop()
+            if not self.board.is_revealed(*divmod(cell, self.cols)):
+                return cell, 0.0  # else an earlier blank region opened it
+
+        self.read_board()
+        safe, mines, constraints = self.propagate(self.constraints())
+        if self.flag_mines:
+            for cell in mines:
+                if self.view[cell] != -2:  # not flagged yet
+                    self.board.toggle_flag(*divmod(cell, self.cols))
+        if safe:
+            self.safe_queue = sorted(safe, reverse=True)
+            return self.safe_queue.pop(), 0.0
+
+        probabilities, off_probability = self.probabilities(constraints)
+        best = min(probabilities.values(), default=1.0)
+        off_frontier = self.off_frontier_cells(set(probabilities))
+        if probabilities and (best <= off_probability or not off_frontier):
+            candidates = sorted(cell for cell, p in probabilities.items() if p == best)
+        else:
+            best = off_probability
+            candidates = off_frontier
+        return self.rng.choice(candidates), best
+
+    def off_frontier_cells(self, frontier: set) -> list:
+        """Unknown cells that touch no revealed number (corners first, they open most often)."""
+        unknown = self.view < 0
+        unknown[list(self.known_mines)] = False
+        cells = [cell for cell in np.flatnonzero(unknown).tolist() if cell not in frontier]
+        corners = {0, self.cols - 1, (self.rows - 1) * self.cols, self.rows * self.cols - 1}
+        return [cell for cell in cells if cell in corners] or cells
+
+    def hint(self):
+        """(row, col, mine probability) of the move the solver would make now; step() plays it."""
+        if self.planned is None:
+            self.planned = self.choose_move()
+        cell, probability = self.planned
+        return (*divmod(cell, self.cols), probability)
+
+    def step(self):
+        """Plays one move (the hinted one, if any). Returns 'won', 'lost' or None if the game goes on."""
+        start = time.perf_counter()
+        planned, self.planned = self.planned, None
+        if planned is not None and not self.board.is_revealed(*divmod(planned[0], self.cols)):
+            cell, probability = planned
+        else:
+            cell, probability = self.choose_move()
+        self.latencies.append(time.perf_counter() - start)
+        if probability > 0:
+            self.guesses += 1
+
+        row, col = divmod(cell, self.cols)
+        if self.board.is_mine_at(row, col):
+            self.board.reveal_all_mines()
+            return 'lost'
+        self.board.update_board(row, col)
+        return 'won' if self.board.game_won() else None
+
+    def play(self, max_moves=None) -> dict:
+        """Plays until the game is over (or max_moves). Returns a summary of the game."""
+        result = None
+        moves = 0
+        while result is None and (max_moves is None or moves < max_moves):
+            result = self.step()
+            moves += 1
+        latencies = self.latencies
+        return {
+            'won': result == 'won',
+            'result': result,
+            'moves': moves,
+            'guesses': self.guesses,
+            'latency_mean': sum(latencies) / len(latencies) if latencies else 0.0,
+            'latency_max': max(latencies, default=0.0),
+        }
+
+
+def reduce_constraints(constraints: dict, safe: set, mines: set) -> dict:
+    """Removes known cells from every constraint."""
+    reduced = {}
+    for cells, need in constraints.items():
+        rest = cells - safe - mines
+        if rest:
+            reduced[rest] = need - len(cells & mines)
+    return reduced
+
+
+def subset_constraints(constraints: dict) -> dict:
+    """New constraints B - A (holding need B - need A) for every A inside another B."""
+    by_cell = defaultdict(list)
+    for cells in constraints:
+        for cell in cells:
+            by_cell[cell].append(cells)
+    derived = {}
+    for a, need_a in constraints.items():
+        for b in {b for cell in a for b in by_cell[cell]}:
+            if len(a) < len(b) and a < b:
+                rest = b - a
+                if rest not in constraints:
+                    derived[rest] = constraints[b] - need_a
+    return derived
+
+
+def split_components(constraints: dict) -> list:
+    """Groups the constraints into components that share no cells."""
+    parent = {}
+
+    def find(cell):
+        while parent[cell] != cell:
+            parent[cell] = parent[parent[cell]]
+            cell = parent[cell]
+        return cell
+
+    for cells in constraints:
+        cells = list(cells)
+        for cell in cells:
+            parent.setdefault(cell, cell)
+        root = find(cells[0])
+        for cell in cells[1:]:
+            parent[find(cell)] = root
+
+    groups = defaultdict(dict)
+    for cells, need in constraints.items():
+        groups[find(next(iter(cells)))][cells] = need
+    return list(groups.values())
+
+
+def enumerate_component(constraints: dict) -> dict:
+    """
+    Counts the mine layouts of one component that satisfy all its constraints.
+    Returns {mines: (layouts, {cell: layouts with a mine on cell})}.
+    Components over MAX_COMPONENT cells or SEARCH_BUDGET steps, and those
+    with no layout at all (the numbers contradict each other), are
+    estimated instead.
+    """
+    cells = sorted(set().union(*constraints))
+    if len(cells) > MAX_COMPONENT:
+        return estimate_component(constraints, cells)
+
+    # Assign cells so that constraints complete early and prune the search
+    order = []
+    placed = set()
+    for group in sorted(constraints, key=len):
+        for cell in sorted(group):
+            if cell not in placed:
+                placed.add(cell)
+                order.append(cell)
+    position = {cell: i for i, cell in enumerate(order)}
+    members = [(sorted(position[cell] for cell in group), need)
+               for group, need in constraints.items()]
+    touching = [[] for _ in order]
+    for index, (indexes, _) in enumerate(members):
+        for i in indexes:
+            touching[i].append(index)
+
+    assignment = [0] * len(order)
+    sums = [0] * len(members)
+    left = [len(indexes) for indexes, _ in members]
+    results = {}
+    steps = [0]
+
+    def search(i, mines):
+        steps[0] += 1
+        if steps[0] > SEARCH_BUDGET:
+            raise SearchBudgetExceeded
+        if i == len(order):
+            count, cell_counts = results.get(mines, (0, None))
+            if cell_counts is None:
+                cell_counts = dict.fromkeys(order, 0)
+            for j, value in enumerate(assignment):
+                if value:
+                    cell_counts[order[j]] += 1
+            results[mines] = (count + 1, cell_counts)
+            return
+        for value in (0, 1):
+            ok = True
+            for index in touching[i]:
+                sums[index] += value
+                left[index] -= 1
+                need = members[index][1]
+                if sums[index] > need or sums[index] + left[index] < need:
+                    ok = False
+            if ok:
+                assignment[i] = value
+                search(i + 1, mines + value)
+            for index in touching[i]:
+                sums[index] -= value
+                left[index] += 1
+        assignment[i] = 0
+
+    try:
+        search(0, 0)
+    except SearchBudgetExceeded:
+        return estimate_component(constraints, cells)
+    return results or estimate_component(constraints, cells)
+
+
+def estimate_component(constraints: dict, cells: list) -> dict:
+    """
+    Rough stand-in for a component too big to enumerate: each cell's chance
+    is the highest missing-mines / hidden-cells ratio of its numbers.
+    """
+    ratio = dict.fromkeys(cells, 0.0)
+    for group, need in constraints.items():
+        for cell in group:
+            ratio[cell] = max(ratio[cell], need / len(group))
+    mines = round(sum(ratio.values()))
+    return {mines: (1.0, ratio)}
+
+
+def solve(board, total_mines=None, rng=None, max_moves=None) -> dict:
+    """Plays a whole game on board and returns the Solver.play() summary."""
+    return Solver(board, total_mines, rng).play(max_moves)
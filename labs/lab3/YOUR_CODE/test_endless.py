@@ -0,0 +1,65 @@
+import tempfile
+
+import numpy as np
+
+from endless import EndlessWorld
+
+
+def played_world(**kwargs) -> EndlessWorld:
+    world = EndlessWorld(seed=4, max_chunks=4, **kwargs)
+    world.update_board(0, 0)
+    world.toggle_flag(*next((row, col) for row in range(60, 200) for col in range(60, 200)
+                            if world.is_mine_at(row, col)))
+    world.flush()
+    return world
+
+
+def test_store_round_trip():
+    window = (0, -40, -40, 120, 120)
+    store = {}
+    world = played_world(store=store)
+    again = EndlessWorld(seed=4, max_chunks=4, store=store)
+    assert world.symbol_window(*window) == again.symbol_window(*window)
+    assert again.restored > 0
+    with tempfile.TemporaryDirectory() as path:
+        world = played_world(store=path)
+        again = EndlessWorld(seed=4, max_chunks=4, store=path)
+        assert world.symbol_window(*window) == again.symbol_window(*window)
+        assert again.restored > 0
+
+
+def test_store_settings_must_match():
+    with tempfile.TemporaryDirectory() as path:
+        played_world(store=path)
+        EndlessWorld(seed=4, store=path)   # same settings: fine
+        for settings in ({'seed': 5}, {'seed': 4, 'density': 0.2}, {'seed': 4, 'chunk_size': 16}):
+            try:
+                EndlessWorld(store=path, **settings)
+            except ValueError:
+                pass
+            else:
+                raise AssertionError(f'a store saved with seed 4 was attached to {settings}')
+    try:
+        EndlessWorld(store={'settings': b'not a world'})
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('a store without a world was accepted')
+
+
+def test_counts_cross_chunk_borders():
+    world = EndlessWorld(seed=9, chunk_size=8)
+    mines = np.array([[world.is_mine_at(row, col) for col in range(-12, 12)]
+                      for row in range(-12, 12)])
+    for row in range(1, 23):
+        for col in range(1, 23):
+            if not mines[row, col]:
+                expected = int(mines[row - 1:row + 2, col - 1:col + 2].sum())
+                assert world.count_at(row - 12, col - 12) == expected
+
+
+if __name__ == '__main__':
+    test_store_round_trip()
+    test_store_settings_must_match()
+    test_counts_cross_chunk_borders()
+    print('EndlessWorld stores, restores and checks its chunks.')
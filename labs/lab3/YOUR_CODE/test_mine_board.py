@@ -0,0 +1,211 @@
+import random
+
+import numpy as np
+
+from mine_board import (BLANK_SYMBOL, HIDDEN_SYMBOL, MINE_SYMBOL, MineBoard, count_adjacent_mines,
+                        label_zero_regions, neighbor_counts, place_mines)
+
+
+# The team's functions (see __init__.studentcopy.20251110.py), written out
+# here with explicit board sizes so they don't need globals or
+# get_adjacent_cells.
+
+def adjacent_cells(row: int, col: int, rows: int, cols: int) -> list:
+    return [(row + dr, col + dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1)
+            if (dr, dc) != (0, 0) and 0 <= row + dr < rows and 0 <= col + dc < cols]
+
+
+def team_count_adjacent_mines(board: list) -> list:
+    rows, cols = len(board), len(board[0])
+    for r in range(rows):
+        for c in range(cols):
+            if board[r][c][1] == MINE_SYMBOL:
+                continue
+            count = sum(1 for nr, nc in adjacent_cells(r, c, rows, cols)
+                        if board[nr][nc][1] == MINE_SYMBOL)
+            board[r][c] = (board[r][c][0], BLANK_SYMBOL if count == 0 else f' {count} ')
+    return board
+
+
+def team_update_board(board: list, start_row: int, start_col: int) -> list:
+    rows, cols = len(board), len(board[0])
+    stack = [(start_row, start_col)]
+    while stack:
+        r, c = stack.pop()
+        display, base = board[r][c]
+        if display != HIDDEN_SYMBOL:
+            continue
+        if base != BLANK_SYMBOL and base != MINE_SYMBOL:
+            board[r][c] = (base, base)
+            continue
+        if base == BLANK_SYMBOL:
+            board[r][c] = (BLANK_SYMBOL, base)
+            for nr, nc in adjacent_cells(r, c, rows, cols):
+                n_display, n_base = board[nr][nc]
+                if n_display == HIDDEN_SYMBOL and n_base != MINE_SYMBOL:
+                    if n_base == BLANK_SYMBOL:
+                        stack.append((nr, nc))
+                    else:
+                        board[nr][nc] = (n_base, n_base)
+    return board
+
+
+def team_game_won(board: list) -> bool:
+    return all(base == MINE_SYMBOL or display != HIDDEN_SYMBOL
+               for row in board for display, base in row)
+
+
+def random_games(count: int, seed: int = 0):
+    """(MineBoard, matching tuple board, random.Random) for boards of random size and density."""
+    rng = random.Random(seed)
+    for game in range(count):
+        rows, cols = rng.randint(2, 12), rng.randint(2, 12)
+        board = MineBoard.random(rows, cols, rng.randint(1, rows * cols - 1), rng=game)
+        tuple_board = [[(HIDDEN_SYMBOL, MINE_SYMBOL if board.mines[r, c] else BLANK_SYMBOL)
+                        for c in range(cols)] for r in range(rows)]
+        yield board, team_count_adjacent_mines(tuple_board), rng
+
+
+def test_counts_match_team():
+    for board, tuple_board, _ in random_games(200):
+        fresh = [[(display, MINE_SYMBOL if base == MINE_SYMBOL else BLANK_SYMBOL)
+                  for display, base in row] for row in tuple_board]
+        assert count_adjacent_mines(fresh) == tuple_board
+        assert board.to_tuple_board() == tuple_board
+
+
+def test_reveal_matches_team_flood_fill():
+    for board, tuple_board, rng in random_games(300):
+        for _ in range(8):
+            r, c = rng.randrange(board.rows), rng.randrange(board.cols)
+            if board.is_mine_at(r, c):
+                continue
+            before = sum(display != HIDDEN_SYMBOL for row in tuple_board for display, _ in row)
+            team_update_board(tuple_board, r, c)
+            after = sum(display != HIDDEN_SYMBOL for row in tuple_board for display, _ in row)
+            assert board.update_board(r, c) == after - before
+            assert board.to_tuple_board() == tuple_board
+            assert board.game_won() == team_game_won(tuple_board)
+
+
+def test_tuple_board_round_trip():
+    for board, tuple_board, rng in random_games(100, seed=1):
+        r, c = rng.randrange(board.rows), rng.randrange(board.cols)
+        if not board.is_mine_at(r, c):
+            board.update_board(r, c)
+        board.toggle_flag(rng.randrange(board.rows), rng.randrange(board.cols))
+        copy = MineBoard.from_tuple_board(board.to_tuple_board())
+        assert copy.to_tuple_board() == board.to_tuple_board()
+        assert (copy.revealed_count, copy.flag_count) == (board.revealed_count, board.flag_count)
+
+
+def test_small_regions_are_flood_filled():
+    mines = np.zeros((6, 6), dtype=bool)
+    mines[0, 5] = mines[5, 0] = True
+    board = MineBoard(mines)
+    board.update_board(0, 4)  # a number
+    board.update_board(3, 3)
+    assert board.regions is None
+    assert board.game_won()
+
+
+def test_large_regions_label_the_board():
+    mines = np.zeros((60, 60), dtype=bool)
+    mines[45] = True  # a wall: 45 rows above it, 14 below
+    board = MineBoard(mines)
+    assert board.flood_fill(0, 0) is None
+    assert board.update_board(0, 0) == 45 * 60
+    assert board.regions is not None
+    assert board.update_board(59, 59) == 14 * 60
+    assert board.game_won()
+
+
+def test_flood_fill_matches_labels():
+    for board, _, rng in random_games(100, seed=3):
+        labels, region_start, region_cells = label_zero_regions(board.mines, board.counts)
+        for label in range(1, len(region_start) - 1):
+            r, c = map(int, np.argwhere(labels == label)[0])
+            cells = region_cells[region_start[label]:region_start[label + 1]]
+            assert sorted(board.flood_fill(r, c)) == sorted(cells)
+            assert board.flood_fill(r, c, limit=0) is None
+
+
+def test_region_sizes():
+    for board, _, rng in random_games(100, seed=2):
+        labels, region_start, region_cells = label_zero_regions(board.mines, board.counts)
+        assert (labels > 0).sum() == ((board.counts == 0) & ~board.mines).sum()
+        r, c = rng.randrange(board.rows), rng.randrange(board.cols)
+        size = board.region_size(r, c)
+        if not board.is_mine_at(r, c):
+            assert board.update_board(r, c) == size
+        assert list(board.region_sizes()[1:]) == list(np.diff(region_start)[1:])
+
+
+def test_place_mines():
+    for rows, cols, mines in ((9, 9, 10), (16, 30, 99), (5, 5, 24), (10, 10, 91)):
+        for seed in range(5):
+            layout = place_mines(rows, cols, mines, seed, first_click=(2, 2))
+            assert layout.sum() == mines
+            assert not layout[2, 2]
+            if mines <= rows * cols - 9:
+                assert not layout[1:4, 1:4].any()
+            assert (layout == place_mines(rows, cols, mines, seed, first_click=(2, 2))).all()
+
+
+def test_counters_follow_every_move():
+    rng = random.Random(3)
+    for game in range(200):
+        rows, cols = rng.randint(2, 15), rng.randint(2, 15)
+        board = MineBoard.random(rows, cols, rng.randint(1, rows * cols - 1), rng=game)
+        board.debug = True  # check_counters() after every move
+        while not board.game_won():
+            r, c = rng.randrange(rows), rng.randrange(cols)
+            if rng.random() < 0.2:
+                board.toggle_flag(r, c)
+            elif not board.is_mine_at(r, c):
+                board.update_board(r, c)
+            assert board.revealed_count == board.revealed.sum()
+            assert board.safe_remaining == (~board.revealed & ~board.mines).sum()
+            assert board.flag_count == board.flagged.sum()
+            assert board.mines_left() == board.mine_count - board.flagged.sum()
+        assert board.safe_remaining == 0
+
+
+def test_check_counters_catches_drift():
+    board = MineBoard.random(5, 5, 3, rng=1)
+    board.revealed[0, 0] = True  # behind the counters' back
+    try:
+        board.check_counters()
+    except AssertionError:
+        pass
+    else:
+        raise AssertionError('check_counters missed a changed cell')
+
+
+def test_reveal_all_mines_keeps_counters():
+    board = MineBoard.random(6, 6, 5, rng=2)
+    counters = (board.revealed_count, board.safe_remaining, board.flag_count)
+    board.reveal_all_mines()
+    assert board.mines_shown
+    assert (board.revealed_count, board.safe_remaining, board.flag_count) == counters
+
+
+def test_neighbor_counts_include_mines():
+    mines = np.ones((3, 3), dtype=bool)
+    assert neighbor_counts(mines).tolist() == [[3, 5, 3], [5, 8, 5], [3, 5, 3]]
+
+
+if __name__ == '__main__':
+    test_counts_match_team()
+    test_reveal_matches_team_flood_fill()
+    test_tuple_board_round_trip()
+    test_small_regions_are_flood_filled()
+    test_large_regions_label_the_board()
+    test_flood_fill_matches_labels()
+    test_region_sizes()
+    test_place_mines()
+    test_counters_follow_every_move()
+    test_check_counters_catches_drift()
+    test_reveal_all_mines_keeps_counters()
+    test_neighbor_counts_include_mines()
+    print('MineBoard matches the team logic.')
@@ -0,0 +1,182 @@
+import io
+import os
+import tempfile
+
+import numpy as np
+
+from endless import EndlessWorld
+from mine_board import MineBoard
+from play_minesweeper import (BoardConfig, ConsoleInput, HiddenBoard, RandomInput, ScriptedInput,
+                              SolverInput, play_endless, play_minesweeper)
+from renderer import BoardRenderer
+from simulate import run_batch
+
+
+def console(lines):
+    """A ConsoleInput that reads lines (EOFError when they run out) and collects its messages."""
+    lines = iter(lines)
+    messages = []
+
+    def input_fn(prompt):
+        try:
+            return next(lines)
+        except StopIteration:
+            raise EOFError from None
+
+    return ConsoleInput(input_fn, messages.append), messages
+
+
+def test_scripted_game():
+    mines = np.zeros((4, 4), dtype=bool)
+    mines[0, 0] = True
+    board = MineBoard(mines)
+    game = play_minesweeper(strategy=ScriptedInput([(3, 3), (3, 3), (0, 1)]), board=board)
+    assert game['result'] == 'won'
+    assert game['moves'] == 1   # the flood fill from (3, 3) clears the board
+    assert game['revealed'] == 15
+    assert len(game['decide']) == len(game['reveal']) == 1
+
+    board = MineBoard(mines)
+    game = play_minesweeper(strategy=ScriptedInput([(0, 1), (0, 0)]), board=board)
+    assert game['result'] == 'lost' and board.mines_shown
+    game = play_minesweeper(strategy=ScriptedInput([]), board=MineBoard(mines))
+    assert game['result'] == 'stopped'
+
+
+def test_flagged_cells_are_not_opened():
+    mines = np.zeros((4, 4), dtype=bool)
+    mines[0, 0] = True
+    board = MineBoard(mines)
+    moves = iter([('flag', 0, 0), (0, 0)])
+    out = io.StringIO()
+    game = play_minesweeper(strategy=lambda board: next(moves, None),
+                            renderer=BoardRenderer(out, tty=False), board=board)
+    assert game['result'] == 'stopped' and game['moves'] == 0
+    assert not board.mines_shown and board.is_flagged(0, 0)
+    assert 'That cell is flagged. Take the flag off to open it.' in out.getvalue()
+
+    world = EndlessWorld(seed=1)
+    mine = next((row, col) for row in range(100) for col in range(100)
+                if world.is_mine_at(row, col))
+    moves = iter([('flag',) + mine, mine])
+    game = play_endless(world, lambda world: next(moves, None))
+    assert game['result'] == 'stopped' and game['moves'] == 0
+    assert not world.mines_shown and world.is_flagged(*mine)
+
+
+def test_random_and_solver_games_finish():
+    config = BoardConfig(9, 9, 10)
+    for seed in range(20):
+        for strategy in (RandomInput(seed), SolverInput(rng=seed)):
+            game = play_minesweeper(config, strategy, rng=seed)
+            assert game['result'] in ('won', 'lost')
+            assert game['moves'] == len(game['decide'])
+
+
+def test_first_click_is_safe_and_hidden_before():
+    config = BoardConfig(6, 6, 30)
+    for seed in range(20):
+        seen = []
+
+        def strategy(board):
+            seen.append(type(board))
+            return (2, 3) if len(seen) == 1 else None
+
+        game = play_minesweeper(config, strategy, rng=seed)
+        assert seen == [HiddenBoard, MineBoard]
+        assert game['result'] in ('won', 'stopped') and game['revealed'] >= 1
+
+
+def test_hidden_board_shows_nothing():
+    board = HiddenBoard(BoardConfig(3, 4, 2))
+    assert not board.is_revealed(1, 1) and not board.game_won()
+    assert (board.player_view() == -1).all() and board.player_view().shape == (3, 4)
+    fresh = MineBoard.random(3, 4, 2)
+    assert board.symbol_window(0, 0, 0, 3, 4) == fresh.symbol_window(0, 0, 0, 3, 4)
+
+
+def test_console_input():
+    board = MineBoard.random(5, 5, 3, rng=1)
+    board.update_board(*map(int, np.argwhere(~board.mines)[0]))
+    revealed = tuple(map(int, np.argwhere(board.revealed)[0]))
+    hidden = tuple(map(int, np.argwhere(~board.revealed)[0]))
+    strategy, messages = console(['1', 'a b', '9 9', '%d %d' % revealed, '%d %d' % hidden,
+                                  'flag %d %d' % hidden, '%d %d' % hidden, 'flag %d %d' % hidden,
+                                  'save', 'resume other.save'])
+    assert strategy(board) == hidden
+    assert messages == ['Please enter exactly two numbers.', 'Both row and column must be numbers.',
+                        'Out of bounds. Try again.', 'That cell is already revealed. Pick another.']
+    assert strategy(board) == ('flag',) + hidden
+    board.toggle_flag(*hidden)
+    assert strategy(board) == ('flag',) + hidden   # a flagged cell can only be unflagged
+    assert messages[-1] == 'That cell is flagged. Take the flag off (flag row col) to open it.'
+    assert strategy(board) == ('save', 'minesweeper.save')
+    assert strategy(board) == ('resume', 'other.save')
+
+    # A world with no edges takes any cell
+    strategy, messages = console(['-40 1000'])
+    assert strategy(EndlessWorld()) == (-40, 1000) and messages == []
+
+
+def test_console_save_and_resume():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'game.save')
+        missing = os.path.join(directory, 'missing.save')
+        short = os.path.join(directory, 'short.save')
+        with open(short, 'wb') as f:
+            f.write(b'MSWP')
+        out = io.StringIO()
+        strategy, _ = console([f'save {path}', 'flag 0 0', '4 4', f'save {path}',
+                               f'resume {missing}', f'resume {short}'])
+        try:
+            play_minesweeper(BoardConfig(9, 9, 10), strategy, BoardRenderer(out, tty=False), rng=3)
+        except EOFError:
+            pass
+        messages = [line for line in out.getvalue().splitlines() if not line.startswith(' ')]
+        assert messages == ['Nothing to save before the first move.',
+                            'Nothing to flag before the first move.',
+                            f'Game saved to {path}.',
+                            f'Could not resume: [Errno 2] No such file or directory: {missing!r}',
+                            f'Could not resume: {short} is too short to be a saved minesweeper game']
+
+        game = play_minesweeper(strategy=SolverInput(rng=1), resume=path)
+        assert game['result'] in ('won', 'lost')
+        assert game['moves'] == 1 + len(game['decide'])
+
+
+def test_run_batch_is_the_same_with_workers():
+    config = BoardConfig(9, 9, 10)
+    for strategy in ('random', 'solver'):
+        alone = run_batch(config, strategy, games=120, seed=7, workers=1)
+        pooled = run_batch(config, strategy, games=120, seed=7, workers=2)
+        assert alone['results'] == pooled['results']
+        assert alone['moves'] == pooled['moves'] == len(alone['decide'])
+        assert sum(alone['results'].values()) == 120
+
+
+def test_endless_game():
+    world = EndlessWorld(seed=2)
+    moves = iter([(0, 0), ('flag', 5, 5), ('save', 'ignored'), (0, 0)])
+    out = io.StringIO()
+    game = play_endless(world, lambda world: next(moves, None), BoardRenderer(out, tty=False))
+    assert game['result'] == 'stopped' and game['moves'] == 2
+    assert game['revealed'] > 0 and world.is_revealed(0, 0)
+    assert 'World saved.' in out.getvalue()
+
+    mine = next((row, col) for row in range(100) for col in range(100)
+                if world.is_mine_at(row, col))
+    game = play_endless(world, lambda world: mine)
+    assert game['result'] == 'lost' and world.mines_shown
+
+
+if __name__ == '__main__':
+    test_scripted_game()
+    test_flagged_cells_are_not_opened()
+    test_random_and_solver_games_finish()
+    test_first_click_is_safe_and_hidden_before()
+    test_hidden_board_shows_nothing()
+    test_console_input()
+    test_console_save_and_resume()
+    test_run_batch_is_the_same_with_workers()
+    test_endless_game()
+    print('play_minesweeper, its inputs and run_batch behave as expected.')
@@ -0,0 +1,110 @@
+import contextlib
+import io
+
+import globals
+from endless import EndlessWorld
+from mine_board import MineBoard
+from print_board import print_board
+from renderer import OPEN_LABEL_WIDTH, BoardRenderer, cell_text, format_board
+
+CLEAR = '\x1b[H\x1b[2J'
+
+
+def played_board() -> MineBoard:
+    board = MineBoard.random(8, 10, 12, rng=3)
+    board.update_board(0, 0)
+    board.update_board(7, 9)
+    board.toggle_flag(3, 4)
+    return board
+
+
+def take(stream: io.StringIO) -> str:
+    """What was written to stream since the last take."""
+    text = stream.getvalue()
+    stream.seek(0)
+    stream.truncate()
+    return text
+
+
+def test_plain_output_matches_print_board():
+    board = played_board()
+    tuple_board = board.to_tuple_board()
+    globals.ROWS, globals.COLS = board.rows, board.cols
+    for level in (0, 1):
+        printed = io.StringIO()
+        with contextlib.redirect_stdout(printed):
+            print_board(tuple_board, level)
+        for drawn in (tuple_board, board):
+            out = io.StringIO()
+            BoardRenderer(out, tty=False).render(drawn, level)
+            assert out.getvalue() == printed.getvalue(), level
+        assert format_board(board, level) == printed.getvalue()
+
+
+def test_unchanged_frame_writes_only_the_status_line():
+    board = played_board()
+    out = io.StringIO()
+    renderer = BoardRenderer(out, tty=True, viewport=(5, 6))
+    renderer.render(board)
+    assert take(out).startswith(CLEAR)
+    renderer.render(board)
+    frame = take(out)
+    assert '|' not in frame
+    assert frame.endswith('rows 0-4 of 8, columns 0-5 of 10\n')
+
+
+def test_one_change_redraws_one_cell():
+    board = played_board()
+    out = io.StringIO()
+    renderer = BoardRenderer(out, tty=True, viewport=(5, 6))
+    renderer.render(board)
+    take(out)
+    board.toggle_flag(1, 5)
+    renderer.render(board)
+    frame = take(out)
+    assert not frame.startswith(CLEAR)
+    assert frame.count('|') == 1
+    # Row 1 is on screen line 5 (two header lines, then a separator under
+    # each row); column 5 starts after the label and five cells
+    flag = board.symbol_window(0, 1, 5, 1, 1)[0][0]
+    assert frame.startswith(f'\x1b[5;{3 + 3 + 6 * 5 + 1}H{cell_text(flag)}')
+
+
+def test_scrolling_redraws_and_stays_inside_the_board():
+    board = played_board()
+    out = io.StringIO()
+    renderer = BoardRenderer(out, tty=True, viewport=(5, 6))
+    renderer.render(board)
+    take(out)
+    renderer.scroll(100, 100)
+    renderer.render(board)
+    assert take(out).startswith(CLEAR)
+    assert (renderer.top, renderer.left) == (3, 4)
+    renderer.show(0, 0)
+    renderer.render(board)
+    assert (renderer.top, renderer.left) == (0, 0)
+
+
+def test_endless_window():
+    world = EndlessWorld(seed=5)
+    world.update_board(-3, -3)
+    out = io.StringIO()
+    renderer = BoardRenderer(out, tty=False, viewport=(4, 7))
+    renderer.center(-3, -3)
+    renderer.render(world)
+    lines = take(out).splitlines()
+    assert lines[-1] == 'rows -5 to -2, columns -6 to 0'
+    assert len(lines) == 2 + 2 * 4 + 1
+    assert lines[2].startswith(f'{-5:>{OPEN_LABEL_WIDTH}}   |')
+    for row, line in zip(range(-5, -1), lines[2::2]):
+        symbols = world.symbol_window(0, row, -6, 1, 7)[0]
+        assert line.endswith(''.join(cell_text(symbol) for symbol in symbols) + '|')
+
+
+if __name__ == '__main__':
+    test_plain_output_matches_print_board()
+    test_unchanged_frame_writes_only_the_status_line()
+    test_one_change_redraws_one_cell()
+    test_scrolling_redraws_and_stays_inside_the_board()
+    test_endless_window()
+    print('BoardRenderer matches print_board and redraws only what changed.')
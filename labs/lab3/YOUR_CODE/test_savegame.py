@@ -0,0 +1,96 @@
+import os
+import tempfile
+
+import numpy as np
+
+from mine_board import MineBoard
+from savegame import HEADER, MAGIC, SavedGame, load_game, pack_counts, save_game, unpack_counts
+
+
+def played_boards():
+    """Boards part way through a game, including odd cell counts and a lost game."""
+    for game, (rows, cols, mines) in enumerate(((9, 9, 10), (7, 13, 20), (1, 3, 1), (16, 30, 99))):
+        board = MineBoard.random(rows, cols, mines, rng=game)
+        board.update_board(*map(int, np.argwhere(~board.mines)[0]))
+        board.toggle_flag(*map(int, np.argwhere(board.mines)[0]))
+        yield board
+    board.reveal_all_mines()
+    yield board
+
+
+def assert_same_board(copy, board):
+    for name in ('mines', 'revealed', 'flagged', 'counts'):
+        assert (getattr(copy, name) == getattr(board, name)).all(), name
+    assert copy.mines_shown == board.mines_shown
+    assert (copy.revealed_count, copy.safe_remaining, copy.flag_count) == \
+        (board.revealed_count, board.safe_remaining, board.flag_count)
+
+
+def test_round_trip():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'game.save')
+        for board in played_boards():
+            for store_counts in (False, True):
+                save_game(board, path, seed=5, moves=3, store_counts=store_counts)
+                copy, header = load_game(path)
+                assert_same_board(copy, board)
+                assert (header.rows, header.cols, header.seed, header.moves, header.mines) == \
+                    (board.rows, board.cols, 5, 3, board.mine_count)
+                assert header.has_counts == store_counts
+                assert header.mines_shown == board.mines_shown
+        save_game(board, path)
+        assert load_game(path)[1].seed is None
+        assert os.listdir(directory) == ['game.save']   # no .tmp file left behind
+
+
+def test_cells_read_through_mmap():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'game.save')
+        for board in played_boards():
+            for store_counts in (False, True):
+                save_game(board, path, store_counts=store_counts)
+                with SavedGame(path) as saved:
+                    assert (saved.counts() == board.counts).all()
+                    for row in range(board.rows):
+                        for col in range(board.cols):
+                            assert saved.is_mine_at(row, col) == board.mines[row, col]
+                            assert saved.is_revealed(row, col) == board.revealed[row, col]
+                            assert saved.is_flagged(row, col) == board.flagged[row, col]
+
+
+def test_counts_nibbles():
+    for rows, cols in ((1, 1), (3, 3), (4, 6)):
+        counts = np.arange(rows * cols, dtype=np.int8).reshape(rows, cols) % 9
+        packed = pack_counts(counts)
+        assert len(packed) == (rows * cols + 1) // 2
+        assert (unpack_counts(packed, rows, cols) == counts).all()
+
+
+def test_bad_files_raise_value_error():
+    board = next(played_boards())
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'game.save')
+        save_game(board, path)
+        with open(path, 'rb') as f:
+            data = f.read()
+        assert data.startswith(MAGIC)
+        header = bytearray(data[:HEADER.size])
+        header[4] = 99   # version
+        for bad in (b'XXXX' + data[4:], bytes(header) + data[HEADER.size:], data[:-1], data + b'\0',
+                    data[:HEADER.size - 1], b''):
+            with open(path, 'wb') as f:
+                f.write(bad)
+            try:
+                load_game(path)
+            except ValueError:
+                pass
+            else:
+                raise AssertionError('load_game read a bad save')
+
+
+if __name__ == '__main__':
+    test_round_trip()
+    test_cells_read_through_mmap()
+    test_counts_nibbles()
+    test_bad_files_raise_value_error()
+    print('Saves round-trip and bad files are rejected.')